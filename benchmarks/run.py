@@ -0,0 +1,134 @@
+# benchmarks/run.py
+"""
+Offline benchmark runner.
+
+Times every benchmark in ``suite.py`` at each of its sizes and writes
+the results to JSON, so runs from different releases can be compared.
+
+Usage:
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --quick --filter matrix
+    python benchmarks/run.py --output new.json --compare old.json
+
+With ``--compare`` the runner prints the time ratio against a previous
+result file and exits with status 1 if any benchmark got slower than
+``--threshold`` (default 1.25×).
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "src"))
+sys.path.insert(0, HERE)
+
+import numpy as np  # noqa: E402
+import supertropical  # noqa: E402
+from suite import BENCHMARKS, QUICK_SIZES  # noqa: E402
+
+
+def measure(func, repeat, min_time):
+    """
+    Times ``func`` like timeit: calls per round are chosen so a round
+    lasts at least ``min_time`` seconds.
+
+    Returns:
+        dict: Per-call min/median/mean seconds, calls per round, rounds.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    rounds = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min": min(rounds),
+        "median": statistics.median(rounds),
+        "mean": statistics.fmean(rounds),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(names, quick, repeat, min_time):
+    """Runs the selected benchmarks and returns the result document."""
+    results = []
+    for name in names:
+        setup, sizes = BENCHMARKS[name]
+        for size in QUICK_SIZES[name] if quick else sizes:
+            stats = measure(setup(size), repeat, min_time)
+            results.append({"name": name, "size": size, **stats})
+            print(f"{name:<16}{size:>8}  {stats['min'] * 1e3:12.4f} ms", flush=True)
+    return {
+        "metadata": {
+            "supertropical": supertropical.__version__,
+            "backend": supertropical.get_backend(),
+            "numpy": np.__version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Prints current/baseline ratios of the minimum times.
+
+    Returns:
+        list: (name, size, ratio) of benchmarks slower than threshold.
+    """
+    previous = {(r["name"], r["size"]): r["min"] for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'benchmark':<16}{'size':>8}  {'ratio':>8}")
+    for r in current["results"]:
+        key = (r["name"], r["size"])
+        if key not in previous:
+            continue
+        ratio = r["min"] / previous[key]
+        flag = "  SLOWER" if ratio > threshold else ""
+        print(f"{r['name']:<16}{r['size']:>8}  {ratio:8.3f}{flag}")
+        if ratio > threshold:
+            regressions.append((r["name"], r["size"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="previous JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio reported as a regression")
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--quick", action="store_true", help="small sizes only")
+    parser.add_argument("--repeat", type=int, default=5, help="timed rounds per size")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum seconds per round")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    document = run(names, args.quick, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(document, fh, indent=2)
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        if compare(document, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+# benchmarks/suite.py
+"""
+Benchmark definitions for the element, matrix and solver hot paths.
+
+Each benchmark is a setup function taking a size and returning a
+zero-argument callable to time. Sizes are listed per benchmark so the
+runner can record a scaling curve; ``QUICK_SIZES`` is a smaller set for
+smoke runs.
+"""
+import numpy as np
+from supertropical import SupertropicalElement, SupertropicalMatrix
+
+SEED = 0
+
+
+def _random_matrix(n, ghost_fraction=0.1, seed=SEED):
+    """Random integer-valued n×n matrix with a few ghost entries."""
+    rng = np.random.default_rng(seed + n)
+    values = rng.integers(-10, 10, size=(n, n)).astype(float)
+    ghost = rng.random((n, n)) < ghost_fraction
+    return SupertropicalMatrix._from_arrays(values, ghost)
+
+
+def _nonsingular_matrix(n):
+    """Random matrix with a dominant tangible diagonal, so per(A) is tangible."""
+    A = _random_matrix(n, ghost_fraction=0.0)
+    np.fill_diagonal(A.values, 100.0 + np.arange(n))
+    return A
+
+
+def _elements(count):
+    rng = np.random.default_rng(SEED)
+    values = rng.integers(-10, 10, size=count).astype(float)
+    ghost = rng.random(count) < 0.3
+    return [SupertropicalElement(float(v), is_ghost=bool(g)) for v, g in zip(values, ghost)]
+
+
+def element_add(count):
+    """``count`` additions a ⊕ b of elements."""
+    left, right = _elements(count), _elements(count)[::-1]
+
+    def run():
+        for a, b in zip(left, right):
+            a + b
+    return run
+
+
+def element_mul(count):
+    """``count`` multiplications a ⊙ b of elements."""
+    left, right = _elements(count), _elements(count)[::-1]
+
+    def run():
+        for a, b in zip(left, right):
+            a * b
+    return run
+
+
+def matrix_mul(n):
+    """n×n matrix product A ⊙ B."""
+    A, B = _random_matrix(n), _random_matrix(n, seed=SEED + 1)
+    return lambda: A * B
+
+
+def permanent(n):
+    """Permanent of an n×n matrix."""
+    A = _random_matrix(n)
+    return A.permanent
+
+
+def adjoint(n):
+    """Adjoint of an n×n matrix."""
+    A = _random_matrix(n)
+    return A.adjoint
+
+
+def solve(n):
+    """Solve A x = b for an n×n nonsingular matrix."""
+    A = _nonsingular_matrix(n)
+    b = SupertropicalMatrix(np.arange(n, dtype=float).reshape(-1, 1))
+    return lambda: A.solve(b)
+
+
+def pseudo_inverse(n):
+    """Pseudo-inverse of an n×n matrix."""
+    A = _random_matrix(n)
+    return A.pseudo_inverse
+
+
+def power(n):
+    """A^16 for an n×n matrix."""
+    A = _random_matrix(n)
+    return lambda: A ** 16
+
+
+def transpose(n):
+    """Transpose of an n×n matrix."""
+    A = _random_matrix(n)
+    return A.transpose
+
+
+BENCHMARKS = {
+    "element_add": (element_add, [1_000, 10_000, 100_000]),
+    "element_mul": (element_mul, [1_000, 10_000, 100_000]),
+    "matrix_mul": (matrix_mul, [16, 32, 64, 128, 256]),
+    "permanent": (permanent, [8, 16, 32, 64, 128, 256]),
+    "adjoint": (adjoint, [8, 16, 32, 64, 128]),
+    "solve": (solve, [8, 16, 32, 64, 128]),
+    "pseudo_inverse": (pseudo_inverse, [8, 16, 32, 64, 128]),
+    "power": (power, [16, 32, 64, 128]),
+    "transpose": (transpose, [64, 256, 1024]),
+}
+
+QUICK_SIZES = {
+    "element_add": [1_000],
+    "element_mul": [1_000],
+    "matrix_mul": [16, 32],
+    "permanent": [8, 16],
+    "adjoint": [8, 16],
+    "solve": [8, 16],
+    "pseudo_inverse": [8, 16],
+    "power": [16],
+    "transpose": [64],
+}
@@ -24,8 +24,19 @@ Alternative usage:
     >>> A = Matrix([[1, 2], [3, 4]])
 """
 
-from .element import SupertropicalElement
+from .element import EPSILON, GHOST_EPSILON, UNIT, SupertropicalElement
 from .matrix import SupertropicalMatrix
+from .factorization import SupertropicalFactorization
+from .sparse import SparseSupertropicalMatrix
+from .trajectory import SupertropicalTrajectory
+from .storage import MappedSupertropicalMatrix
+from .lazy import LazySupertropicalMatrix
+from .polynomial import SupertropicalPolynomial, evaluate_characteristic
+from .residuation import SupertropicalSystemSolution
+from .backend import get_backend, set_backend
+from .profiling import Profiler, profile
+from .cache import disable_cache, enable_cache, get_cache, invalidate_cache
+from . import ufuncs
 
 # Shorter aliases for easier import
 Element = SupertropicalElement
@@ -35,6 +46,25 @@ __version__ = "0.1.2"
 __all__ = [
     "SupertropicalElement", 
     "SupertropicalMatrix",
+    "SupertropicalFactorization",
+    "SparseSupertropicalMatrix",
+    "SupertropicalTrajectory",
+    "MappedSupertropicalMatrix",
+    "LazySupertropicalMatrix",
+    "SupertropicalPolynomial",
+    "evaluate_characteristic",
+    "SupertropicalSystemSolution",
+    "EPSILON",
+    "GHOST_EPSILON",
+    "UNIT",
+    "set_backend",
+    "get_backend",
+    "Profiler",
+    "profile",
+    "enable_cache",
+    "disable_cache",
+    "get_cache",
+    "invalidate_cache",
     "Element",  # Alias
     "Matrix",   # Alias
 ]
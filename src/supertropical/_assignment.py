@@ -0,0 +1,728 @@
+# src/supertropical/_assignment.py
+"""
+Assignment-problem routines behind the supertropical permanent.
+
+The tropical permanent per(A) = ⊕_π ⊙_i a_{i,π(i)} is the value of a
+maximum-weight perfect assignment. It is ghost when the optimum is
+attained by two or more permutations, when the optimal permutation uses
+a ghost entry, or when it is ε (-inf).
+"""
+import numpy as np
+from .backend import get_backend, kernel, run_blocks, split
+from ._kernels import tie_tolerance
+
+
+def _penalty(finite_costs, n):
+    """
+    Cost given to ε entries: large enough that any assignment using one
+    costs more than every assignment avoiding them all.
+    """
+    c_max = finite_costs.max()
+    span = c_max - finite_costs.min()
+    return c_max + n * (span + 1.0) + 1.0
+
+
+def _costs(values):
+    """
+    Converts a max-plus weight matrix into finite minimization costs,
+    with ε entries at the _penalty cost.
+    """
+    n = values.shape[0]
+    finite = np.isfinite(values)
+    costs = np.zeros(values.shape)
+    if not finite.any():
+        return costs, finite
+    costs[finite] = -values[finite]
+    costs[~finite] = _penalty(costs[finite], n)
+    return costs, finite
+
+
+def augment_row(costs, u, v, p, i):
+    """
+    One phase of the Hungarian method: matches the free row i (1-based)
+    along a shortest augmenting path, updating u, v and p in place.
+
+    Requires reduced costs costs - u - v to be non-negative on row i and
+    on every matched row, and zero on matched edges. O(n²).
+    """
+    n = costs.shape[0]
+    way = np.zeros(n + 1, dtype=np.int64)
+    p[0] = i
+    j0 = 0
+    minv = np.full(n + 1, np.inf)
+    used = np.zeros(n + 1, dtype=bool)
+    while True:
+        used[j0] = True
+        i0 = p[j0]
+        free = ~used
+        free[0] = False
+        cur = costs[i0 - 1] - u[i0] - v[1:]
+        better = free[1:] & (cur < minv[1:])
+        minv[1:][better] = cur[better]
+        way[1:][better] = j0
+
+        candidates = np.where(free, minv, np.inf)
+        j1 = int(np.argmin(candidates))
+        delta = candidates[j1]
+
+        u[p[used]] += delta
+        v[used] -= delta
+        minv[free] -= delta
+        j0 = j1
+        if p[j0] == 0:
+            break
+    # Augment along the alternating path
+    while j0:
+        j1 = way[j0]
+        p[j0] = p[j1]
+        j0 = j1
+
+
+def _hungarian(costs):
+    """
+    Minimum-cost perfect assignment on finite (n, n) costs (Hungarian
+    method, O(n³)).
+
+    Returns:
+        tuple: (u, v, p) row and column potentials and p[j], the row
+        matched to column j, all 1-based with a virtual column 0.
+    """
+    n = costs.shape[0]
+    u = np.zeros(n + 1)
+    v = np.zeros(n + 1)
+    p = np.zeros(n + 1, dtype=np.int64)      # p[j]: row matched to column j
+    for i in range(1, n + 1):
+        augment_row(costs, u, v, p, i)
+    return u, v, p
+
+
+def repair_row(costs, u, v, p, row):
+    """
+    Restores an optimal assignment after the costs of one row changed.
+
+    Row ``row`` (0-based) is unmatched, its potential lowered until its
+    reduced costs are non-negative, and rematched with augment_row. The
+    other rows keep their potentials, so this costs one phase, O(n²).
+    """
+    i = row + 1
+    p[np.flatnonzero(p == i)] = 0
+    u[i] = np.min(costs[row] - v[1:])
+    augment_row(costs, u, v, p, i)
+
+
+def max_weight_assignment(values):
+    """
+    Maximum-weight perfect assignment (Hungarian method, O(n³)).
+
+    Args:
+        values (np.ndarray): (n, n) float64 weights; -inf marks ε entries.
+
+    Returns:
+        tuple: (sigma, reduced, finite) where sigma[i] is the column
+        assigned to row i, reduced is the (n, n) array of non-negative
+        reduced costs (zero on the assignment and on every edge that
+        belongs to some optimal assignment), and finite marks non-ε
+        entries.
+    """
+    n = values.shape[0]
+    costs, finite = _costs(values)
+    u, v, p = kernel("hungarian", _hungarian)(costs)
+
+    sigma = np.empty(n, dtype=np.int64)
+    sigma[p[1:] - 1] = np.arange(n)
+    reduced = costs - u[1:, None] - v[None, 1:]
+    return sigma, reduced, finite
+
+
+def has_alternative_optimum(sigma, tight):
+    """
+    Checks whether another optimal assignment exists.
+
+    A second optimum exists iff the tight-edge graph contains a cycle
+    alternating between assignment edges and other tight edges, i.e.
+    iff the digraph i -> i' with (i, sigma[i']) tight and i != i' has a
+    directed cycle. Detected with Kahn's topological sort.
+    """
+    n = sigma.shape[0]
+    # adjacency[i, i'] = edge (i, sigma[i']) is tight
+    adjacency = tight[:, sigma].copy()
+    np.fill_diagonal(adjacency, False)
+    in_degree = adjacency.sum(axis=0)
+    removed = np.zeros(n, dtype=bool)
+    stack = list(np.flatnonzero(in_degree == 0))
+    while stack:
+        node = stack.pop()
+        removed[node] = True
+        targets = np.flatnonzero(adjacency[node])
+        in_degree[targets] -= 1
+        stack.extend(t for t in targets if in_degree[t] == 0)
+    return not removed.all()
+
+
+def _assignment_permanent(values, ghost, sigma, reduced, finite):
+    """per(A) as (value, is_ghost) from an optimal assignment sigma."""
+    rows = np.arange(values.shape[0])
+    if not finite[rows, sigma].all():
+        # Every permutation contains ε
+        return -np.inf, True
+
+    # Sequential sum, in row order, like the product over i of a_{i,π(i)}
+    total = float(np.add.accumulate(values[rows, sigma])[-1])
+    tight = finite & (reduced <= tie_tolerance(values, terms=values.shape[0]))
+    is_ghost = bool(ghost[rows, sigma].any()) or has_alternative_optimum(sigma, tight)
+    return total, is_ghost
+
+
+def permanent(values, ghost):
+    """
+    Supertropical permanent of a square (values, ghost) pair.
+
+    Returns:
+        tuple: (value, is_ghost) of per(A).
+    """
+    if values.shape[0] == 0:
+        # Empty product: the multiplicative identity
+        return 0.0, False
+
+    sigma, reduced, finite = max_weight_assignment(values)
+    return _assignment_permanent(values, ghost, sigma, reduced, finite)
+
+
+def assignment_state(values):
+    """
+    Optimal assignment of a square matrix, kept for incremental updates.
+
+    Returns:
+        tuple: (costs, penalty, u, v, p) as in _hungarian, with the cost
+        matrix and the cost of its ε entries (None without finite entries).
+    """
+    costs, finite = _costs(values)
+    penalty = _penalty(costs[finite], values.shape[0]) if finite.any() else None
+    u, v, p = kernel("hungarian", _hungarian)(costs)
+    return costs, penalty, u, v, p
+
+
+def update_row(state, values, row):
+    """
+    Repairs an assignment_state in place after row ``row`` of the matrix
+    changed to ``values[row]``, in O(n²).
+
+    Returns:
+        bool: False if the state cannot be repaired because the new
+        entries make the ε penalty too small; rebuild it instead.
+    """
+    costs, penalty, u, v, p = state
+    n = values.shape[0]
+    finite = np.isfinite(values)
+    if not finite.all():
+        finite_costs = -values[finite]
+        if penalty is None or finite_costs.size == 0:
+            return False
+        c_max = finite_costs.max()
+        # Any assignment through an ε entry must stay the most expensive
+        if penalty <= c_max + (n - 1) * (c_max - finite_costs.min()):
+            return False
+    costs[row] = np.where(finite[row], -values[row], penalty if penalty is not None else 0.0)
+    repair_row(costs, u, v, p, row)
+    return True
+
+
+def state_permanent(values, ghost, state):
+    """
+    per(A) from an assignment_state, in O(n²).
+
+    Returns:
+        tuple: (value, is_ghost, sigma).
+    """
+    costs, _, u, v, p = state
+    n = values.shape[0]
+    if n == 0:
+        return 0.0, False, np.empty(0, dtype=np.int64)
+    sigma = np.empty(n, dtype=np.int64)
+    sigma[p[1:] - 1] = np.arange(n)
+    reduced = costs - u[1:, None] - v[None, 1:]
+    value, is_ghost = _assignment_permanent(values, ghost, sigma, reduced, np.isfinite(values))
+    return value, is_ghost, sigma
+
+
+def _shortest_paths(weights):
+    """All-pairs shortest paths (Floyd–Warshall) on non-negative weights."""
+    dist = weights.copy()
+    np.fill_diagonal(dist, 0.0)
+    for k in range(dist.shape[0]):
+        np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+    return dist
+
+
+def _count_tight_paths(adjacency, source, sigma_ghost, edge_ghost):
+    """
+    Walks the acyclic tight graph from ``source`` in topological order.
+
+    Returns, for every target row, the number of tight paths (capped at
+    2), whether the path uses a ghost entry, and how many ghost
+    assignment entries lie on the path (only meaningful for a unique
+    path).
+    """
+    n = adjacency.shape[0]
+    in_degree = adjacency.sum(axis=0)
+    count = np.zeros(n, dtype=np.int64)
+    path_ghost = np.zeros(n, dtype=bool)
+    path_sigma_ghost = np.zeros(n, dtype=np.int64)
+    count[source] = 1
+    path_sigma_ghost[source] = sigma_ghost[source]
+
+    stack = list(np.flatnonzero(in_degree == 0))
+    while stack:
+        node = stack.pop()
+        succ = np.flatnonzero(adjacency[node])
+        if count[node]:
+            count[succ] = np.minimum(count[succ] + count[node], 2)
+            path_ghost[succ] |= path_ghost[node] | edge_ghost[node, succ]
+            path_sigma_ghost[succ] = path_sigma_ghost[node] + sigma_ghost[succ]
+        in_degree[succ] -= 1
+        stack.extend(succ[in_degree[succ] == 0])
+    return count, path_ghost, path_sigma_ghost
+
+
+def _disjoint_cycles(tight):
+    """
+    Greedy family of vertex-disjoint cycles of the zero-weight row graph.
+
+    From each row in turn, a shortest cycle through it among the rows
+    not used yet is found by breadth-first search (O(n²) per row).
+
+    Returns:
+        tuple: (cycle, count) where cycle[i] labels the cycle through
+        row i, or -1 if row i is in none of them.
+    """
+    n = tight.shape[0]
+    adjacency = tight.copy()
+    np.fill_diagonal(adjacency, False)
+    cycle = np.full(n, -1)
+    free = np.ones(n, dtype=bool)
+    count = 0
+    for start in range(n):
+        if not free[start]:
+            continue
+        predecessor = np.full(n, -1)
+        frontier = [start]
+        found = False
+        while frontier and not found:
+            if adjacency[frontier, start].any():
+                last = frontier[int(np.argmax(adjacency[frontier, start]))]
+                found = True
+                break
+            reached = np.flatnonzero(adjacency[frontier].any(axis=0) & free & (predecessor < 0))
+            reached = reached[reached != start]
+            for node in reached:
+                predecessor[node] = frontier[int(np.argmax(adjacency[frontier, node]))]
+            frontier = list(reached)
+        free[start] = False
+        if not found:
+            continue
+        node = last
+        while node != start:
+            cycle[node] = count
+            free[node] = False
+            node = predecessor[node]
+        cycle[start] = count
+        count += 1
+    return cycle, count
+
+
+def _misses_cycle(source, target, predecessor, cycle, cycles):
+    """True if the tight path source -> target avoids one of the cycles."""
+    hit = {cycle[target]}
+    node = target
+    while node != source:
+        node = predecessor[node]
+        hit.add(cycle[node])
+    hit.discard(-1)
+    return len(hit) < cycles
+
+
+def _on_cycle(tight):
+    """Rows on some cycle of the zero-weight row graph (O(n³) closure)."""
+    reach = tight.copy()
+    np.fill_diagonal(reach, False)
+    for k in range(reach.shape[0]):
+        reach |= reach[:, k, None] & reach[None, k, :]
+    return np.diagonal(reach).copy()
+
+
+def _minor_is_ghost(source, target, predecessor, sigma, col_tight, ghost, relevant):
+    """
+    Ghost status of one minor when the tight graph has cycles.
+
+    Builds the minor's optimal assignment from the tight path
+    source -> target and tests it for ghost entries and for an
+    alternative optimum directly. Another optimum differs from it only
+    on tight paths to the target and on zero-weight cycles, so the
+    search is restricted to the ``relevant`` rows.
+    """
+    n = sigma.shape[0]
+    col = sigma[source]
+    assign = sigma.copy()
+    node = target
+    while node != source:
+        prev = predecessor[node]
+        assign[prev] = sigma[node]
+        node = prev
+
+    keep_rows = np.arange(n) != target
+    if ghost[keep_rows][np.arange(n - 1), assign[keep_rows]].any():
+        return True
+    rows = np.flatnonzero(relevant & keep_rows)
+    # Row graph of the minor's assignment on the relevant rows
+    return has_alternative_optimum(np.arange(rows.shape[0]), col_tight[np.ix_(rows, assign[rows])])
+
+
+def _adjoint_columns(inputs, outputs, start, stop, tol, degenerate, cycles):
+    """
+    Ghost status of the minors without column col, for start <= col < stop.
+
+    Writes outputs["minor_ghost"][:, start:stop]; see adjoint().
+    """
+    sigma, inverse, reduced, ghost = (
+        inputs["sigma"], inputs["inverse"], inputs["reduced"], inputs["ghost"]
+    )
+    weights, dist, is_epsilon = inputs["weights"], inputs["dist"], inputs["is_epsilon"]
+    sigma_ghost, edge_ghost = inputs["sigma_ghost"], inputs["edge_ghost"]
+    cycle, on_cycle = inputs["cycle"], inputs["on_cycle"]
+    minor_ghost = outputs["minor_ghost"]
+    n = sigma.shape[0]
+
+    for col in range(start, stop):
+        source = inverse[col]
+        d = dist[source]
+        adjacency = np.abs(d[:, None] + weights - d[None, :]) <= tol
+        np.fill_diagonal(adjacency, False)
+        targets = np.flatnonzero(~is_epsilon[:, col])
+        if not degenerate:
+            count, path_ghost, path_sigma_ghost = _count_tight_paths(
+                adjacency, source, sigma_ghost, edge_ghost
+            )
+            # Assignment entries off the path stay in the minor
+            kept_ghost = sigma_ghost.sum() - path_sigma_ghost > 0
+            status = (count >= 2) | path_ghost | kept_ghost
+            minor_ghost[targets, col] = status[targets]
+            continue
+
+        # Breadth-first tight paths from the source give one optimum per row
+        predecessor = np.full(n, -1)
+        predecessor[source] = source
+        depth = np.zeros(n, dtype=np.int64)
+        frontier = [source]
+        while frontier:
+            reached = np.flatnonzero(adjacency[frontier].any(axis=0) & (predecessor < 0))
+            for node in reached:
+                predecessor[node] = frontier[int(np.argmax(adjacency[frontier, node]))]
+            depth[reached] = depth[frontier[0]] + 1
+            frontier = list(reached)
+        col_tight = None
+        for target in targets:
+            # A zero-weight cycle disjoint from the path gives the minor a
+            # second optimum; a path with fewer rows than there are
+            # disjoint cycles always misses one
+            if depth[target] + 1 < cycles or _misses_cycle(
+                source, target, predecessor, cycle, cycles
+            ):
+                minor_ghost[target, col] = True
+                continue
+            if col_tight is None:
+                col_tight = np.abs(reduced + d[:, None] - d[inverse][None, :]) <= tol
+            # Rows with a tight path to the target
+            reaching = np.zeros(n, dtype=bool)
+            reaching[target] = True
+            frontier = np.array([target])
+            while frontier.size:
+                frontier = np.flatnonzero(adjacency[:, frontier].any(axis=1) & ~reaching)
+                reaching[frontier] = True
+            minor_ghost[target, col] = _minor_is_ghost(
+                source, target, predecessor, sigma, col_tight, ghost,
+                reaching | on_cycle,
+            )
+
+
+def adjoint(values, ghost):
+    """
+    Supertropical adjoint of a square (values, ghost) pair.
+
+    All n² minor permanents come from a single optimal assignment σ: the
+    minor without row r and column c differs from σ by an alternating
+    path from row σ⁻¹(c) to row r, so its permanent is per(A) corrected
+    by the dual potentials and an all-pairs shortest-path distance over
+    reduced costs, O(n³) overall. Ghost status counts optimal paths on
+    the tight graph. If per(A) itself has several optima the tight graph
+    has zero-weight cycles. A greedy family of vertex-disjoint cycles is
+    then found once in O(n³); a minor whose optimal path misses one of
+    them has a second optimum and is ghost, found in O(path length).
+    Only minors whose path meets every cycle of the family are checked
+    directly, in O(n²) each, so the worst case is O(n⁴); on random
+    integer data few minors need this.
+    Values are exact for integer-valued data and agree with the minor
+    permanents up to floating-point rounding otherwise.
+
+    Returns:
+        tuple: (values, ghost) arrays of adj(A), adj(A)_ij = per(A_(j,i)).
+    """
+    n = values.shape[0]
+    if n <= 1:
+        # The only minor of a 1×1 matrix is empty, with permanent 0
+        return np.zeros((n, n)), np.zeros((n, n), dtype=bool)
+
+    costs, finite = _costs(values)
+    if not finite.any():
+        return np.full((n, n), -np.inf), np.ones((n, n), dtype=bool)
+
+    sigma, reduced, _ = max_weight_assignment(values)
+    rows = np.arange(n)
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[sigma] = rows
+    tol = tie_tolerance(values, terms=values.shape[0])
+
+    # Row graph: i -> i' means row i takes over the column of row i'
+    weights = reduced[:, sigma]
+    dist = _shortest_paths(weights)
+
+    # minor_cost[r, c] = cost(σ) - (u_r + v_c) + dist(σ⁻¹(c), r)
+    potentials = costs - reduced
+    minor_cost = costs[rows, sigma].sum() - potentials + dist[inverse, :].T
+    c_max = costs[finite].max()
+    # Assignments through a penalized ε entry cost more than this bound
+    is_epsilon = minor_cost > (n - 1) * c_max + 0.5
+    minor_values = np.where(is_epsilon, -np.inf, -minor_cost)
+    minor_ghost = is_epsilon.copy()
+
+    sigma_ghost = ghost[rows, sigma].astype(np.int64)
+    edge_ghost = ghost[:, sigma]
+    degenerate = has_alternative_optimum(sigma, reduced <= tol)
+    if degenerate:
+        cycle, cycles = _disjoint_cycles(weights <= tol)
+        on_cycle = _on_cycle(weights <= tol)
+    else:
+        cycle, cycles, on_cycle = np.full(n, -1), 0, np.zeros(n, dtype=bool)
+
+    inputs = {
+        "sigma": sigma, "inverse": inverse, "reduced": reduced, "ghost": ghost,
+        "weights": weights, "dist": dist, "is_epsilon": is_epsilon,
+        "sigma_ghost": sigma_ghost, "edge_ghost": edge_ghost, "cycle": cycle, "on_cycle": on_cycle,
+    }
+    # Columns are independent: split them across the backend's workers
+    blocks = split(n, 4 * get_backend()["workers"])
+    run_blocks(_adjoint_columns, inputs, {"minor_ghost": minor_ghost}, blocks, tol,
+               degenerate, cycles)
+
+    return minor_values.T, minor_ghost.T
+
+
+def _sink_distances(weights, sink):
+    """
+    Shortest distances from every row to a virtual sink reached from row
+    l at cost sink[l] (dense Dijkstra on non-negative weights, O(n²)).
+    """
+    n = weights.shape[0]
+    dist = sink.copy()
+    done = np.zeros(n, dtype=bool)
+    for _ in range(n):
+        node = int(np.argmin(np.where(done, np.inf, dist)))
+        if done[node] or dist[node] == np.inf:
+            break
+        done[node] = True
+        np.minimum(dist, weights[:, node] + dist[node], out=dist)
+    return dist
+
+
+def _count_sink_paths(weights, sink, dist, edge_ghost, sink_ghost, tol):
+    """
+    Counts the shortest paths from every row to the sink (capped at 2)
+    and whether one of them uses a ghost entry, in reverse topological
+    order of the tight graph. Rows on a tight cycle count as 2.
+    """
+    reachable = np.isfinite(dist)
+    with np.errstate(invalid="ignore"):
+        adjacency = reachable[:, None] & (np.abs(weights + dist[None, :] - dist[:, None]) <= tol)
+        ends = reachable & (np.abs(sink - dist) <= tol)
+    count = ends.astype(np.int64)
+    path_ghost = ends & sink_ghost
+    out_degree = adjacency.sum(axis=1)
+    done = np.zeros(dist.shape[0], dtype=bool)
+    stack = list(np.flatnonzero(out_degree == 0))
+    while stack:
+        node = stack.pop()
+        done[node] = True
+        pred = np.flatnonzero(adjacency[:, node])
+        count[pred] = np.minimum(count[pred] + count[node], 2)
+        path_ghost[pred] |= path_ghost[node] | edge_ghost[pred, node]
+        out_degree[pred] -= 1
+        stack.extend(pred[out_degree[pred] == 0])
+    count[~done] = 2
+    return count, path_ghost
+
+
+def solve_columns(values, ghost, sigma, u, v, b_values, b_ghost):
+    """
+    x = adj(A) ⊙ b ⊙ per(A)⁻¹ from an optimal assignment, without the
+    adjoint.
+
+    By Cramer's rule x_k = per(A with column k replaced by b) - per(A).
+    That permanent's optimal assignment differs from σ by an alternating
+    path from row σ⁻¹(k) to the row l that takes b_l, so all of x comes
+    from one single-sink shortest-path search over the reduced costs,
+    O(n²) per column of b. Ghost status counts the optimal paths as in
+    adjoint(). Requires per(A) to be tangible, so that σ is the unique
+    optimum and uses no ε or ghost entry.
+
+    Args:
+        values, ghost: The (n, n) matrix A.
+        sigma (np.ndarray): Optimal assignment, sigma[i] the column of row i.
+        u, v (np.ndarray): Row and column potentials of the costs -values,
+                           with -values - u - v >= 0 and zero on sigma.
+        b_values, b_ghost: The (n, k) right-hand sides.
+
+    Returns:
+        tuple: (values, ghost) arrays of shape (n, k).
+    """
+    n, k = b_values.shape
+    x_values = np.full((n, k), -np.inf)
+    x_ghost = np.ones((n, k), dtype=bool)
+    if n == 0:
+        return x_values, x_ghost
+
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[sigma] = np.arange(n)
+    tol = tie_tolerance(values, b_values, terms=n)
+    finite = np.isfinite(values)
+    reduced = np.full((n, n), np.inf)
+    reduced[finite] = (-values - u[:, None] - v[None, :])[finite]
+    # Row graph as in adjoint(), without ε entries; rounding may leave
+    # tiny negative reduced costs
+    weights = np.maximum(reduced[:, sigma], 0.0)
+    np.fill_diagonal(weights, np.inf)
+    edge_ghost = ghost[:, sigma]
+
+    for c in range(k):
+        b = b_values[:, c]
+        b_finite = np.isfinite(b)
+        sink = np.full(n, np.inf)
+        sink[b_finite] = -b[b_finite] - u[b_finite]
+        dist = _sink_distances(weights, sink)
+        count, path_ghost = _count_sink_paths(
+            weights, sink, dist, edge_ghost, b_ghost[:, c], tol
+        )
+        d = dist[inverse]
+        reached = np.isfinite(d)
+        x_values[reached, c] = v[reached] - d[reached]
+        x_ghost[reached, c] = ((count[inverse] >= 2) | path_ghost[inverse])[reached]
+    return x_values, x_ghost
+
+
+def shifted_permanent(values, ghost, x, x_ghost=False):
+    """
+    Supertropical permanent of A ⊕ x·I, i.e. the characteristic
+    polynomial of A evaluated at x.
+
+    Returns:
+        tuple: (value, is_ghost).
+    """
+    n = values.shape[0]
+    diagonal = np.arange(n)
+    shifted_values, shifted_ghost = values.copy(), ghost.copy()
+    a = values[diagonal, diagonal]
+    shifted_values[diagonal, diagonal] = np.maximum(a, x)
+    shifted_ghost[diagonal, diagonal] = np.where(
+        a == x, True, np.where(a > x, ghost[diagonal, diagonal], x_ghost)
+    )
+    return permanent(shifted_values, shifted_ghost)
+
+
+def _diagonal_assignment(values, x):
+    """
+    Optimal assignment of A ⊕ x·I.
+
+    Returns:
+        tuple: (k, c) with k the number of diagonal positions taking x and
+        c the sum of the entries of A used, so per(A ⊕ x·I) = c + k·x.
+    """
+    n = values.shape[0]
+    rows = np.arange(n)
+    a = values[rows, rows]
+    shifted = values.copy()
+    shifted[rows, rows] = np.maximum(a, x)
+    sigma, _, _ = max_weight_assignment(shifted)
+    on_x = (sigma == rows) & (x > a)
+    return int(on_x.sum()), float(values[rows[~on_x], sigma[~on_x]].sum())
+
+
+def _interior_point(lo, hi, avoid):
+    """A point strictly inside (lo, hi) that is not in ``avoid``."""
+    if lo == -np.inf and hi == np.inf:
+        lo, hi = -1.0, 1.0
+    elif lo == -np.inf:
+        lo = hi - 2.0
+    elif hi == np.inf:
+        hi = lo + 2.0
+    for j in range(1, avoid.size + 2):
+        x = lo + (hi - lo) * j / (avoid.size + 2)
+        if lo < x < hi and not np.any(avoid == x):
+            return x
+    return 0.5 * (lo + hi)
+
+
+def characteristic_coefficients(values, ghost):
+    """
+    Essential coefficients of the characteristic polynomial
+    f_A(x) = per(A ⊕ x·I) = ⊕_k c_k x^k, where c_k is the supertropical
+    sum of the permanents of all (n-k)×(n-k) principal submatrices.
+
+    f_A is convex and piecewise linear, and an optimal assignment of
+    A ⊕ x·I gives both f_A(x) and a supporting line (k, c_k). The hull of
+    the points (k, c_k) is found by bisecting between known supporting
+    lines at their intersection (Eisner–Severance), at most 2(n + 1)
+    assignments, O(n⁴) overall. Each hull coefficient's ghost status is
+    that of f_A at a tangible point inside its linear piece.
+
+    Coefficients below the hull never attain the maximum and are left ε:
+    finding them all is the best principal submatrix problem, for which
+    no polynomial algorithm is known. f_A, its corners (eigenvalue
+    candidates) and its value and ghost status at every tangible point
+    are exact.
+
+    Returns:
+        tuple: (values, ghost) arrays of length n + 1, indexed by degree.
+    """
+    n = values.shape[0]
+    coef_values = np.full(n + 1, -np.inf)
+    coef_ghost = np.ones(n + 1, dtype=bool)
+    coef_values[n], coef_ghost[n] = 0.0, False
+    if n == 0:
+        return coef_values, coef_ghost
+
+    finite = values[np.isfinite(values)]
+    # Every corner lies within ±2n·max|a_ij|
+    bound = 2.0 * n * (float(np.abs(finite).max()) if finite.size else 0.0) + 1.0
+    left = _diagonal_assignment(values, -bound)
+    lines = {left[0]: left[1], n: 0.0}
+    pending = [(left, (n, 0.0))]
+    while pending:
+        (k_left, c_left), (k_right, c_right) = pending.pop()
+        if k_right - k_left <= 1:
+            continue
+        x = (c_left - c_right) / (k_right - k_left)
+        k, c = _diagonal_assignment(values, x)
+        # Is (k, c) strictly above the segment between the two lines?
+        cross = (k_right - k_left) * (c - c_left) - (c_right - c_left) * (k - k_left)
+        if k in (k_left, k_right) or cross <= 0:
+            continue
+        lines[k] = c
+        pending.extend([((k_left, c_left), (k, c)), ((k, c), (k_right, c_right))])
+
+    degrees = np.array(sorted(lines))
+    coef_values[degrees] = [lines[k] for k in degrees]
+    corners = -np.diff(coef_values[degrees]) / np.diff(degrees)
+    bounds = np.concatenate([[-np.inf], corners, [np.inf]])
+    diagonal = np.diag(values)
+    for p, k in enumerate(degrees):
+        x = _interior_point(bounds[p], bounds[p + 1], diagonal)
+        coef_ghost[k] = shifted_permanent(values, ghost, x)[1]
+    return coef_values, coef_ghost
@@ -0,0 +1,197 @@
+# src/supertropical/_jit.py
+"""
+Fused loop kernels, compiled with Numba when it is installed.
+
+Each kernel computes the maximum, the number of terms attaining it and
+whether a ghost term attains it in a single pass, so no (m, k, n) term
+tensor or extra comparison passes are needed. Signatures and results
+match the NumPy kernels in ``_kernels`` and ``_assignment``.
+
+Without Numba the functions are left as plain Python; they stay correct
+but slow, and ``backend`` keeps using the NumPy kernels.
+"""
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+AVAILABLE = numba is not None
+
+
+def _compile(func):
+    # nogil lets the thread backend run compiled blocks in parallel
+    if numba is None:
+        return func
+    return numba.njit(cache=True, nogil=True)(func)
+
+
+@_compile
+def maxplus_matmul(a_values, a_ghost, b_values, b_ghost, block_elements=0):
+    """
+    Supertropical matrix product C = A ⊙ B in one fused loop.
+
+    ``block_elements`` is accepted for compatibility and ignored: no
+    temporaries beyond one output row of counters are allocated.
+
+    Returns:
+        tuple: (values, ghost) arrays of shape (m, n).
+    """
+    m, k = a_values.shape
+    n = b_values.shape[1]
+    values = np.full((m, n), -np.inf)
+    ghost = np.ones((m, n), dtype=np.bool_)
+    count = np.zeros(n, dtype=np.int64)
+    hit = np.zeros(n, dtype=np.bool_)
+
+    for i in range(m):
+        count[:] = 0
+        hit[:] = False
+        for p in range(k):
+            a = a_values[i, p]
+            if a == -np.inf:
+                # Only ε terms; an all-ε sum is ghost anyway
+                continue
+            a_is_ghost = a_ghost[i, p]
+            for j in range(n):
+                term = a + b_values[p, j]
+                if term > values[i, j]:
+                    values[i, j] = term
+                    count[j] = 1
+                    hit[j] = a_is_ghost or b_ghost[p, j]
+                elif term == values[i, j]:
+                    count[j] += 1
+                    hit[j] = hit[j] or a_is_ghost or b_ghost[p, j]
+        for j in range(n):
+            ghost[i, j] = count[j] >= 2 or hit[j] or values[i, j] == -np.inf
+    return values, ghost
+
+
+@_compile
+def maxplus_matvec(a_values, a_ghost, x_values, x_ghost, out_values, out_ghost, work):
+    """
+    Supertropical matrix-vector product y = A ⊙ x into preallocated
+    arrays; ``work`` is accepted for compatibility and not used.
+    """
+    m, n = a_values.shape
+    for i in range(m):
+        best = -np.inf
+        count = 0
+        hit = False
+        for j in range(n):
+            term = a_values[i, j] + x_values[j]
+            if term > best:
+                best = term
+                count = 1
+                hit = a_ghost[i, j] or x_ghost[j]
+            elif term == best:
+                count += 1
+                hit = hit or a_ghost[i, j] or x_ghost[j]
+        out_values[i] = best
+        out_ghost[i] = count >= 2 or hit or best == -np.inf
+
+
+@_compile
+def kleene_star(values, ghost, atol=0.0):
+    """
+    Kleene star A* by Floyd–Warshall elimination, updated in place on a
+    copy of the input.
+
+    Raises:
+        ValueError: If a cycle has positive weight.
+    """
+    n = values.shape[0]
+    values = values.copy()
+    ghost = ghost.copy()
+    col_values = np.empty(n)
+    col_ghost = np.empty(n, dtype=np.bool_)
+    row_values = np.empty(n)
+    row_ghost = np.empty(n, dtype=np.bool_)
+
+    for k in range(n):
+        cycle = values[k, k]
+        if cycle > atol:
+            raise ValueError("Matrix has a cycle of positive weight; closure diverges.")
+        star_ghost = cycle >= -atol
+        # Terms use row and column k from before this step
+        for i in range(n):
+            col_values[i] = values[i, k]
+            col_ghost[i] = ghost[i, k]
+            row_values[i] = values[k, i]
+            row_ghost[i] = ghost[k, i]
+        for i in range(n):
+            if col_values[i] == -np.inf:
+                continue
+            for j in range(n):
+                term = col_values[i] + row_values[j]
+                if term == values[i, j]:
+                    ghost[i, j] = True
+                elif term > values[i, j]:
+                    values[i, j] = term
+                    ghost[i, j] = col_ghost[i] or row_ghost[j] or star_ghost
+
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                if values[i, i] < 0.0:
+                    values[i, i] = 0.0
+                    ghost[i, i] = False
+                elif values[i, i] == 0.0:
+                    ghost[i, i] = True
+            elif values[i, j] == -np.inf:
+                ghost[i, j] = True
+    return values, ghost
+
+
+@_compile
+def hungarian(costs):
+    """
+    Minimum-cost perfect assignment on finite (n, n) costs.
+
+    Returns:
+        tuple: (u, v, p) potentials and matching with a virtual column 0,
+        as in _assignment.max_weight_assignment.
+    """
+    n = costs.shape[0]
+    u = np.zeros(n + 1)
+    v = np.zeros(n + 1)
+    p = np.zeros(n + 1, dtype=np.int64)
+    way = np.zeros(n + 1, dtype=np.int64)
+    minv = np.empty(n + 1)
+    used = np.empty(n + 1, dtype=np.bool_)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv[:] = np.inf
+        used[:] = False
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            delta = np.inf
+            j1 = 0
+            for j in range(1, n + 1):
+                if not used[j]:
+                    cur = costs[i0 - 1, j - 1] - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(n + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # Augment along the alternating path
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    return u, v, p
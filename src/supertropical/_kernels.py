@@ -0,0 +1,369 @@
+# src/supertropical/_kernels.py
+"""
+Vectorized NumPy kernels working directly on the (values, ghost) arrays
+used by SupertropicalMatrix.
+
+Ghost rule for a supertropical sum ⊕_k t_k (see theory, Axiom 1.1):
+the value is max_k t_k, and the result is ghost when
+- two or more terms attain the maximum (a ⊕ a = aν), or
+- a term attaining the maximum is itself ghost, or
+- the maximum is ε = -inf.
+
+Values may be stored as float64, float32, int64 or int32. Integer
+dtypes have no -inf, so their minimum is reserved as the sentinel for ε
+and ⊙ (classical +) keeps it absorbing. A product whose finite value
+does not fit the dtype raises OverflowError instead of wrapping around.
+"""
+import numpy as np
+
+# Upper bound on the number of float64 terms materialized at once
+# (~32 MB for the term tensor).
+DEFAULT_BLOCK_ELEMENTS = 1 << 22
+
+# Supported dtypes of the values array
+VALUE_DTYPES = tuple(np.dtype(t) for t in (np.float64, np.float32, np.int64, np.int32))
+
+
+def value_dtype(dtype):
+    """
+    Validates a values dtype.
+
+    Returns:
+        np.dtype: The dtype.
+
+    Raises:
+        ValueError: If it is not one of VALUE_DTYPES.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in VALUE_DTYPES:
+        names = ", ".join(d.name for d in VALUE_DTYPES)
+        raise ValueError(f"Unsupported dtype {dtype.name}; use one of {names}.")
+    return dtype
+
+
+def epsilon(dtype):
+    """ε in the given values dtype: -inf, or the integer sentinel."""
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f":
+        return dtype.type(-np.inf)
+    return dtype.type(np.iinfo(dtype).min)
+
+
+def cast_values(values, dtype):
+    """
+    Converts a values array to another values dtype, mapping ε.
+
+    Nothing is copied when the dtype already matches.
+
+    Raises:
+        ValueError: If values do not fit the integer dtype (non-integral,
+                    infinite or out of range).
+    """
+    values = np.asarray(values)
+    dtype = np.dtype(dtype)
+    if values.dtype == dtype:
+        return values
+    source = values.dtype
+    eps = values == epsilon(source) if source.kind in "iu" else values == -np.inf
+    if dtype.kind == "f":
+        out = values.astype(dtype)
+        out[eps] = -np.inf
+        return out
+
+    info = np.iinfo(dtype)
+    finite = values[~eps]
+    if source.kind == "f" and not np.all(np.isfinite(finite) & (finite == np.round(finite))):
+        raise ValueError(f"{dtype.name} entries must be integers or ε.")
+    if finite.size and (finite.min() <= info.min or finite.max() > info.max):
+        raise ValueError(f"Entries out of range for {dtype.name}.")
+    out = np.where(eps, 0, values).astype(dtype)
+    out[eps] = info.min
+    return out
+
+
+def to_float64(values):
+    """Values as float64 with ε = -inf (no copy if already float64)."""
+    return cast_values(values, np.float64)
+
+
+def result_dtype(*values):
+    """
+    Values dtype of an operation on the given operands.
+
+    Arrays promote like NumPy (int32 with float32 gives float64); 0-d
+    operands are scalars and keep the dtype of the arrays, except that a
+    non-integral scalar turns integer arrays into float64.
+    """
+    arrays = [v for v in values if np.ndim(v)]
+    if not arrays:
+        return np.dtype(np.float64)
+    dtype = np.result_type(*arrays)
+    if dtype.kind in "iu":
+        for v in values:
+            if not np.ndim(v) and np.asarray(v).dtype.kind == "f":
+                v = float(v)
+                if v != -np.inf and not v.is_integer():
+                    return np.dtype(np.float64)
+    return dtype
+
+
+def check_overflow(overflow, dtype):
+    """
+    Raises OverflowError if any entry of the ``overflow`` mask is set.
+
+    Integer values must not wrap around or land on the ε sentinel.
+    """
+    if np.any(overflow):
+        dtype = np.dtype(dtype)
+        wider = "int64 or float64" if dtype.itemsize < 8 else "float64"
+        raise OverflowError(
+            f"Result does not fit {dtype.name}; convert the operands with astype() to {wider}."
+        )
+
+
+def tie_tolerance(*arrays, terms=1):
+    """
+    Slack within which two sums of ``terms`` float64 values count as tied.
+
+    Exact (0) when every finite entry is an integer. Otherwise
+    8 · terms · eps · scale, where scale is the sum of the largest
+    magnitudes of the arrays (at least 1). The permanent, the adjoint
+    and the residuation solver all decide ties with it, so they agree
+    on borderline inputs.
+    """
+    finite = [array[np.isfinite(array)] for array in map(np.asarray, arrays)]
+    if all(np.all(part == np.round(part)) for part in finite):
+        return 0.0
+    scale = max(1.0, sum(float(np.abs(part).max()) for part in finite if part.size))
+    return 8 * max(terms, 1) * np.finfo(np.float64).eps * scale
+
+
+def value_product(a_values, b_values, out=None):
+    """
+    Values of a ⊙ b (classical +), broadcasting like NumPy.
+
+    For integer dtypes the ε sentinel absorbs: ε ⊙ a = ε.
+
+    Raises:
+        OverflowError: If an integer sum of finite values is out of range.
+    """
+    dtype = np.result_type(a_values, b_values)
+    if dtype.kind == "f":
+        return np.add(a_values, b_values, out=out)
+    eps = epsilon(dtype)
+    absorbed = (a_values == eps) | (b_values == eps)
+    # Signs are read before the sum, which may overwrite an operand
+    positive = (a_values > 0) & (b_values > 0)
+    negative = (a_values < 0) & (b_values < 0)
+    with np.errstate(over="ignore"):
+        result = np.add(a_values, b_values, out=out)
+    # Wrap-around flips the sign; a sum of exactly the sentinel is out of
+    # range too
+    check_overflow(
+        ~absorbed & ((positive & (result < 0)) | (negative & (result >= 0)) | (result == eps)),
+        dtype,
+    )
+    if np.ndim(result) == 0:
+        return eps if absorbed else result
+    np.copyto(result, eps, where=absorbed)
+    return result
+
+
+def _integer_operands(a_values, b_values):
+    """
+    Integer operands with ε replaced by -H, H = max // 4, so the product
+    loop can add terms without sentinel masks.
+
+    With finite entries bounded by L < H / 3, a term with an ε factor is
+    at most L - H < -2L, below every finite term, and no sum overflows.
+
+    Returns:
+        tuple or None: (a, b, floor), where product values below ``floor``
+        are ε, or None if the finite entries are too large.
+    """
+    eps = epsilon(a_values.dtype)
+    a_eps, b_eps = a_values == eps, b_values == eps
+    bound = 0
+    for values, mask in ((a_values, a_eps), (b_values, b_eps)):
+        finite = values[~mask]
+        if finite.size:
+            bound = max(bound, abs(int(finite.min())), abs(int(finite.max())))
+    soft = np.iinfo(a_values.dtype).max // 4
+    if 3 * bound >= soft:
+        return None
+    soft = a_values.dtype.type(-soft)
+    return np.where(a_eps, soft, a_values), np.where(b_eps, soft, b_values), -2 * bound
+
+
+def _merge_sums(values, count, ghost_hit, blk_values, blk_count, blk_ghost_hit):
+    """
+    Merges a partial sum (blk_*) into a running sum, in place.
+
+    Each sum is tracked as (maximum, number of terms at the maximum,
+    whether a ghost term attains the maximum).
+    """
+    higher = blk_values > values
+    equal = blk_values == values
+    count[equal] += blk_count[equal]
+    ghost_hit[equal] |= blk_ghost_hit[equal]
+    count[higher] = blk_count[higher]
+    ghost_hit[higher] = blk_ghost_hit[higher]
+    values[higher] = blk_values[higher]
+
+
+def maxplus_matmul(a_values, a_ghost, b_values, b_ghost,
+                   block_elements=DEFAULT_BLOCK_ELEMENTS):
+    """
+    Supertropical matrix product C = A ⊙ B on raw arrays.
+
+    C_ij = ⊕_k (A_ik ⊙ B_kj). The (m, k, n) term tensor is never built
+    in full: rows of A and the inner dimension are processed in blocks
+    of at most ``block_elements`` terms.
+
+    Args:
+        a_values, a_ghost: (m, k) values and bool ghost mask of A.
+        b_values, b_ghost: (k, n) values and bool ghost mask of B, with
+                           the same values dtype as A.
+        block_elements (int): Maximum number of terms per block.
+
+    Returns:
+        tuple: (values, ghost) arrays of shape (m, n).
+    """
+    m, k = a_values.shape
+    n = b_values.shape[1]
+
+    eps = epsilon(a_values.dtype)
+    values = np.full((m, n), eps)
+    if k == 0:
+        # Empty sum: the additive identity ε
+        return values, np.ones((m, n), dtype=bool)
+
+    add, floor = value_product, None
+    if a_values.dtype.kind in "iu":
+        operands = _integer_operands(a_values, b_values)
+        if operands is not None:
+            a_values, b_values, floor = operands
+            add = np.add
+
+    count = np.zeros((m, n), dtype=np.int64)
+    ghost_hit = np.zeros((m, n), dtype=bool)
+
+    # Split the inner dimension first, then rows, so that
+    # row_block * k_block * n <= block_elements.
+    k_block = max(1, min(k, block_elements // max(n, 1)))
+    row_block = max(1, block_elements // (k_block * max(n, 1)))
+
+    for r0 in range(0, m, row_block):
+        r1 = min(r0 + row_block, m)
+        rows = slice(r0, r1)
+        for k0 in range(0, k, k_block):
+            k1 = min(k0 + k_block, k)
+            inner = slice(k0, k1)
+
+            # terms[i, k, j] = A_ik + B_kj
+            terms = add(a_values[rows, inner, None], b_values[None, inner, :])
+            blk_values = terms.max(axis=1)
+            at_max = terms == blk_values[:, None, :]
+            blk_count = at_max.sum(axis=1)
+            term_ghost = a_ghost[rows, inner, None] | b_ghost[None, inner, :]
+            blk_ghost_hit = (at_max & term_ghost).any(axis=1)
+
+            if k0 == 0:
+                values[rows] = blk_values
+                count[rows] = blk_count
+                ghost_hit[rows] = blk_ghost_hit
+            else:
+                _merge_sums(values[rows], count[rows], ghost_hit[rows],
+                            blk_values, blk_count, blk_ghost_hit)
+
+    if floor is not None:
+        values[values < floor] = eps
+    ghost = (count >= 2) | ghost_hit | (values == eps)
+    return values, ghost
+
+
+def supertropical_add(a_values, a_ghost, b_values, b_ghost):
+    """
+    Elementwise A ⊕ B on raw arrays (broadcasting like NumPy).
+
+    Returns:
+        tuple: (values, ghost) with the larger value, ghost on a tie or
+        when the larger operand is ghost.
+    """
+    values = np.maximum(a_values, b_values)
+    ghost = np.where(
+        a_values == b_values,
+        True,
+        np.where(a_values > b_values, a_ghost, b_ghost),
+    )
+    return values, ghost
+
+
+def kleene_star(values, ghost, atol=0.0):
+    """
+    Kleene star A* = I ⊕ A ⊕ A² ⊕ ... on raw arrays.
+
+    Floyd–Warshall elimination over the supertropical semiring: after
+    step k, entry (i, j) is the sum over all walks whose intermediate
+    nodes are < k. A zero-weight cycle through k makes its star 0ν, so
+    every walk through k becomes ghost. Cycle weights within ``atol``
+    of zero count as zero.
+
+    Raises:
+        ValueError: If a cycle has positive weight.
+    """
+    n = values.shape[0]
+    values = values.copy()
+    ghost = ghost.copy()
+    for k in range(n):
+        cycle = values[k, k]
+        if cycle > atol:
+            raise ValueError("Matrix has a cycle of positive weight; closure diverges.")
+        # (a_kk)* = 0 if a_kk < 0, 0ν if a_kk = 0
+        star_ghost = cycle >= -atol
+        terms = value_product(values[:, k, None], values[None, k, :])
+        term_ghost = ghost[:, k, None] | ghost[None, k, :] | star_ghost
+        values, ghost = supertropical_add(values, ghost, terms, term_ghost)
+
+    identity = np.full((n, n), epsilon(values.dtype))
+    np.fill_diagonal(identity, 0)
+    return supertropical_add(identity, ~np.eye(n, dtype=bool), values, ghost)
+
+
+def matvec_workspace(m, n):
+    """Scratch buffers for repeated calls to maxplus_matvec on (m, n) A."""
+    return (
+        np.empty((m, n)),
+        np.empty((m, n), dtype=bool),
+        np.empty((m, n), dtype=bool),
+        np.empty(m, dtype=np.int64),
+        np.empty(m, dtype=bool),
+    )
+
+
+def maxplus_matvec(a_values, a_ghost, x_values, x_ghost, out_values, out_ghost, work):
+    """
+    Supertropical matrix-vector product y = A ⊙ x into preallocated arrays.
+
+    Same ghost rule as maxplus_matmul, but every intermediate lives in
+    ``work`` (from matvec_workspace), so repeated calls allocate nothing.
+    ``out_*`` must not alias ``x_*``.
+
+    Args:
+        a_values, a_ghost: (m, n) float64 values and bool ghost mask of A.
+        x_values, x_ghost: (n,) values and ghost mask of x.
+        out_values, out_ghost: (m,) arrays receiving the result.
+        work (tuple): Scratch buffers for (m, n) A.
+    """
+    terms, at_max, term_ghost, count, flag = work
+    np.add(a_values, x_values[None, :], out=terms)
+    terms.max(axis=1, out=out_values)
+    np.equal(terms, out_values[:, None], out=at_max)
+    at_max.sum(axis=1, out=count)
+    np.logical_or(a_ghost, x_ghost[None, :], out=term_ghost)
+    np.logical_and(at_max, term_ghost, out=at_max)
+    at_max.any(axis=1, out=out_ghost)
+    np.greater_equal(count, 2, out=flag)
+    out_ghost |= flag
+    np.equal(out_values, -np.inf, out=flag)
+    out_ghost |= flag
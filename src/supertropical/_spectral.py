@@ -0,0 +1,200 @@
+# src/supertropical/_spectral.py
+"""
+Max-plus spectral routines: the eigenvalue of A is its maximum cycle
+mean, and the fundamental eigenvectors are columns of (A - λ)* taken at
+critical nodes (nodes on cycles attaining λ).
+"""
+import numpy as np
+from ._kernels import kleene_star
+from .backend import kernel
+
+METHODS = ("karp", "howard")
+
+
+def _tolerance(values):
+    """Absolute tolerance for comparing cycle means and path weights."""
+    finite = values[np.isfinite(values)]
+    scale = max(1.0, float(np.abs(finite).max())) if finite.size else 1.0
+    return 1e-9 * scale
+
+
+def karp_cycle_mean(values):
+    """
+    Maximum cycle mean by Karp's algorithm.
+
+    D_k(i) is the heaviest walk of exactly k edges starting at i (from
+    any node, as if a virtual source linked to every node), and
+    λ = max_i min_k (D_n(i) - D_k(i)) / (n - k).
+
+    Returns:
+        float: λ, or -inf if the graph has no cycle.
+    """
+    n = values.shape[0]
+    walks = np.empty((n + 1, n))
+    walks[0] = 0.0
+    for k in range(1, n + 1):
+        walks[k] = (values + walks[k - 1][None, :]).max(axis=1)
+
+    last = walks[n]
+    reachable = last > -np.inf
+    if not reachable.any():
+        return -np.inf
+    lengths = (n - np.arange(n))[:, None]
+    with np.errstate(invalid="ignore"):
+        means = (last[None, :] - walks[:n]) / lengths
+    # D_k(i) = -inf gives +inf here and never attains the minimum
+    means = np.where(walks[:n] == -np.inf, np.inf, means)
+    return float(means[:, reachable].min(axis=0).max())
+
+
+def _prune_acyclic(values):
+    """Indices of nodes that keep a successor after removing sink nodes."""
+    alive = np.ones(values.shape[0], dtype=bool)
+    finite = np.isfinite(values)
+    while True:
+        has_successor = (finite & alive[None, :]).any(axis=1) & alive
+        if np.array_equal(has_successor, alive):
+            return np.flatnonzero(alive)
+        alive = has_successor
+
+
+def _evaluate_policy(weights, policy, previous_bias):
+    """
+    Cycle mean (eta) and bias of every node under a fixed policy.
+
+    The policy graph i -> policy[i] has one cycle per component; the
+    bias of one node on each cycle is kept from the previous iteration.
+    """
+    n = policy.shape[0]
+    eta = np.empty(n)
+    bias = np.empty(n)
+    state = np.zeros(n, dtype=np.int8)  # 0 new, 1 on current path, 2 done
+
+    for start in range(n):
+        if state[start]:
+            continue
+        path = []
+        node = start
+        while state[node] == 0:
+            state[node] = 1
+            path.append(node)
+            node = policy[node]
+        if state[node] == 1:
+            # Closed a new cycle: path[idx:] = node -> ... -> node
+            idx = path.index(node)
+            cycle = path[idx:]
+            mean = weights[cycle, policy[cycle]].sum() / len(cycle)
+            eta[cycle] = mean
+            bias[node] = previous_bias[node]
+            for member in reversed(cycle[1:]):
+                bias[member] = weights[member, policy[member]] - mean + bias[policy[member]]
+            state[cycle] = 2
+            path = path[:idx]
+        for member in reversed(path):
+            successor = policy[member]
+            eta[member] = eta[successor]
+            bias[member] = weights[member, successor] - eta[member] + bias[successor]
+            state[member] = 2
+    return eta, bias
+
+
+def howard_cycle_mean(values, max_iterations=None):
+    """
+    Maximum cycle mean by Howard's policy iteration.
+
+    Nodes that cannot reach a cycle are pruned first, so that every
+    remaining row has a finite entry.
+
+    Returns:
+        float: λ, or -inf if the graph has no cycle.
+
+    Raises:
+        RuntimeError: If the iteration does not converge.
+    """
+    nodes = _prune_acyclic(values)
+    if nodes.size == 0:
+        return -np.inf
+    weights = values[np.ix_(nodes, nodes)]
+    n = nodes.size
+    finite = np.isfinite(weights)
+    tol = _tolerance(weights)
+    if max_iterations is None:
+        max_iterations = 10 * n + 100
+
+    policy = np.argmax(weights, axis=1)
+    bias = np.zeros(n)
+    for _ in range(max_iterations):
+        eta, bias = _evaluate_policy(weights, policy, bias)
+
+        # First improve the cycle mean reachable from each node
+        reach_eta = np.where(finite, eta[None, :], -np.inf)
+        best_eta = reach_eta.max(axis=1)
+        improve = best_eta > eta + tol
+        if improve.any():
+            candidates = np.where(
+                finite & (reach_eta >= best_eta[:, None] - tol),
+                weights + bias[None, :],
+                -np.inf,
+            )
+            policy[improve] = np.argmax(candidates, axis=1)[improve]
+            continue
+
+        # Then improve the bias among successors with the same mean
+        same_eta = finite & (np.abs(eta[None, :] - eta[:, None]) <= tol)
+        candidates = np.where(same_eta, weights - eta[:, None] + bias[None, :], -np.inf)
+        improve = candidates.max(axis=1) > bias + tol
+        if not improve.any():
+            return float(eta.max())
+        policy[improve] = np.argmax(candidates, axis=1)[improve]
+
+    raise RuntimeError("Howard policy iteration did not converge.")
+
+
+def cycle_mean(values, method="karp"):
+    """Dispatches to the selected maximum cycle mean engine."""
+    if method == "karp":
+        return karp_cycle_mean(values)
+    if method == "howard":
+        return howard_cycle_mean(values)
+    raise ValueError(f"Unknown eigenvalue method {method!r}; use one of {METHODS}.")
+
+
+def critical_analysis(values, ghost, eigenvalue):
+    """
+    Critical graph of A for its eigenvalue λ.
+
+    Returns:
+        tuple: (star_values, star_ghost, critical, classes, is_ghost)
+        where star_* is (A - λ)*, critical is the (n, n) mask of edges on
+        cycles attaining λ, classes lists one representative per
+        strongly connected component of the critical graph, and
+        is_ghost tells whether λ is attained by more than one cycle or
+        by a cycle through a ghost entry.
+    """
+    tol = _tolerance(values)
+    normalized = values - eigenvalue
+    star_values, star_ghost = kernel("kleene_star", kleene_star)(normalized, ghost, atol=tol)
+
+    # Edge (i, j) is critical iff it closes a zero-weight cycle j ~> i
+    with np.errstate(invalid="ignore"):
+        closing = normalized + star_values.T
+    critical = np.isfinite(values) & (np.abs(closing) <= tol)
+    nodes = np.flatnonzero(critical.any(axis=1))
+
+    # Critical nodes i, j share a component iff (A-λ)*_ij ⊙ (A-λ)*_ji = 0
+    classes = []
+    assigned = np.zeros(values.shape[0], dtype=bool)
+    for node in nodes:
+        if assigned[node]:
+            continue
+        with np.errstate(invalid="ignore"):
+            loop = star_values[node, nodes] + star_values[nodes, node]
+        members = nodes[np.abs(loop) <= tol]
+        assigned[members] = True
+        classes.append(int(node))
+
+    # A strongly connected graph where each node has one successor is
+    # a single cycle; anything else contains two critical cycles
+    single_cycle = len(classes) == 1 and np.all(critical[nodes].sum(axis=1) == 1)
+    is_ghost = not single_cycle or bool(ghost[critical].any())
+    return star_values, star_ghost, critical, classes, is_ghost
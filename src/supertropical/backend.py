@@ -0,0 +1,242 @@
+# src/supertropical/backend.py
+"""
+Execution backend for the heavy matrix routines.
+
+By default everything runs on the calling thread. ``set_backend(workers=N)``
+splits independent work across a pool of N workers:
+
+- matrix products (``A * B``, mapped products): blocks of output rows
+- adjoint (and so solve, factorize, pseudo_inverse): blocks of columns,
+  since the minors sharing a removed column are computed together
+
+``kind="thread"`` uses a thread pool; NumPy releases the GIL inside its
+kernels, so the row blocks of a product run in parallel with no copies.
+``kind="process"`` uses a process pool: operands are copied once into
+shared memory and workers attach to them, so the Python-level loops of
+the adjoint scale as well.
+
+``kernels`` chooses the implementation of the inner loops (products,
+matrix-vector products, closure and the assignment solver): "numpy"
+for the vectorized kernels, "numba" for the fused compiled loops in
+``_jit``. The default, "auto", picks Numba when it is installed; the
+``SUPERTROPICAL_KERNELS`` environment variable overrides it at import.
+The compiled loops are float64 only; float32 and integer matrices always
+use the NumPy kernels.
+"""
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from . import _jit
+from ._kernels import DEFAULT_BLOCK_ELEMENTS, cast_values, maxplus_matmul, result_dtype
+
+KINDS = ("thread", "process")
+KERNELS = ("auto", "numpy", "numba")
+
+# Products with fewer terms than this are not worth splitting
+MIN_PARALLEL_TERMS = 1 << 18
+
+_workers = 1
+_kind = "thread"
+_kernels = "numpy"
+_executor = None
+
+
+def _resolve_kernels(kernels):
+    if kernels not in KERNELS:
+        raise ValueError(f"Unknown kernels {kernels!r}; use one of {KERNELS}.")
+    if kernels == "auto":
+        return "numba" if _jit.AVAILABLE else "numpy"
+    if kernels == "numba" and not _jit.AVAILABLE:
+        raise ValueError("Numba kernels requested but numba is not installed.")
+    return kernels
+
+
+def set_backend(workers=1, kind="thread", kernels=None):
+    """
+    Selects how heavy routines are executed.
+
+    Args:
+        workers (int or None): Number of workers; 1 runs everything on the
+                               calling thread, None uses all CPUs.
+        kind (str): "thread" or "process".
+        kernels (str or None): "auto", "numpy" or "numba"; None keeps the
+                               current kernels.
+
+    Raises:
+        ValueError: If workers < 1, the kind or kernels are unknown, or
+                    Numba kernels are requested without numba installed.
+    """
+    global _workers, _kind, _kernels
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    if kind not in KINDS:
+        raise ValueError(f"Unknown backend kind {kind!r}; use one of {KINDS}.")
+    kernels = _kernels if kernels is None else _resolve_kernels(kernels)
+    _shutdown()
+    _workers = int(workers)
+    _kind = kind
+    _kernels = kernels
+
+
+def get_backend():
+    """
+    Returns the current backend settings.
+
+    Returns:
+        dict: {"workers": int, "kind": str, "kernels": str}
+    """
+    return {"workers": _workers, "kind": _kind, "kernels": _kernels}
+
+
+def kernel(name, fallback, dtype=np.float64):
+    """
+    Returns the compiled kernel ``name`` if Numba kernels are selected and
+    the values are float64, else ``fallback``.
+    """
+    if _kernels == "numba" and np.dtype(dtype) == np.float64:
+        return getattr(_jit, name)
+    return fallback
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        pool = ThreadPoolExecutor if _kind == "thread" else ProcessPoolExecutor
+        _executor = pool(max_workers=_workers)
+    return _executor
+
+
+def _shutdown():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+atexit.register(_shutdown)
+_kernels = _resolve_kernels(os.environ.get("SUPERTROPICAL_KERNELS", "auto"))
+
+
+def split(total, parts):
+    """Splits range(total) into at most ``parts`` contiguous (start, stop) blocks."""
+    parts = max(1, min(parts, total))
+    bounds = np.linspace(0, total, parts + 1).astype(np.int64)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def _share(arrays, handles):
+    """Copies arrays into new shared memory blocks; returns their descriptors."""
+    descriptors = {}
+    for name, array in arrays.items():
+        shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        handles.append(shm)
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        view[...] = array
+        descriptors[name] = (shm.name, array.shape, array.dtype.str)
+    return descriptors
+
+
+def _attach(descriptors, handles):
+    """Maps shared memory blocks created by _share in a worker."""
+    arrays = {}
+    for name, (shm_name, shape, dtype) in descriptors.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        handles.append(shm)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    return arrays
+
+
+def _process_task(func, input_descriptors, output_descriptors, start, stop, args):
+    handles = []
+    try:
+        inputs = _attach(input_descriptors, handles)
+        outputs = _attach(output_descriptors, handles)
+        func(inputs, outputs, start, stop, *args)
+        # Drop the views before closing their buffers
+        del inputs, outputs
+    finally:
+        for shm in handles:
+            shm.close()
+
+
+def run_blocks(func, inputs, outputs, blocks, *args):
+    """
+    Runs ``func(inputs, outputs, start, stop, *args)`` for every block.
+
+    ``inputs`` and ``outputs`` are dicts of arrays; each call writes its
+    part of the outputs in place. Blocks run on the configured pool, or
+    one after another when there is a single worker or block. ``func``
+    must be a module-level function so that process workers can load it.
+    """
+    if _workers == 1 or len(blocks) <= 1:
+        for start, stop in blocks:
+            func(inputs, outputs, start, stop, *args)
+        return
+
+    executor = _get_executor()
+    if _kind == "thread":
+        futures = [executor.submit(func, inputs, outputs, start, stop, *args)
+                   for start, stop in blocks]
+        for future in futures:
+            future.result()
+        return
+
+    input_handles, output_handles = [], []
+    try:
+        input_descriptors = _share(inputs, input_handles)
+        output_descriptors = _share(outputs, output_handles)
+        futures = [
+            executor.submit(_process_task, func, input_descriptors, output_descriptors,
+                            start, stop, args)
+            for start, stop in blocks
+        ]
+        for future in futures:
+            future.result()
+        for array, shm in zip(outputs.values(), output_handles):
+            array[...] = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    finally:
+        for shm in input_handles + output_handles:
+            shm.close()
+            shm.unlink()
+
+
+def _matmul_rows(inputs, outputs, start, stop, block_elements):
+    values, ghost = kernel("maxplus_matmul", maxplus_matmul, inputs["a_values"].dtype)(
+        inputs["a_values"][start:stop], inputs["a_ghost"][start:stop],
+        inputs["b_values"], inputs["b_ghost"], block_elements,
+    )
+    outputs["values"][start:stop] = values
+    outputs["ghost"][start:stop] = ghost
+
+
+def matmul(a_values, a_ghost, b_values, b_ghost, block_elements=DEFAULT_BLOCK_ELEMENTS):
+    """
+    maxplus_matmul split into blocks of output rows on the current backend.
+
+    Operands with different values dtypes are promoted first (see
+    ``_kernels.result_dtype``).
+
+    Returns:
+        tuple: (values, ghost) arrays of the product.
+    """
+    dtype = result_dtype(a_values, b_values)
+    a_values, b_values = cast_values(a_values, dtype), cast_values(b_values, dtype)
+    m, k = a_values.shape
+    n = b_values.shape[1]
+    if _workers == 1 or m < 2 or m * k * n < MIN_PARALLEL_TERMS:
+        return kernel("maxplus_matmul", maxplus_matmul, dtype)(
+            a_values, a_ghost, b_values, b_ghost, block_elements
+        )
+
+    outputs = {"values": np.empty((m, n), dtype=dtype), "ghost": np.empty((m, n), dtype=bool)}
+    inputs = {"a_values": a_values, "a_ghost": a_ghost,
+              "b_values": b_values, "b_ghost": b_ghost}
+    # Each worker gets its share of the term budget
+    per_worker = max(1, block_elements // _workers)
+    run_blocks(_matmul_rows, inputs, outputs, split(m, _workers), per_worker)
+    return outputs["values"], outputs["ghost"]
+
@@ -0,0 +1,204 @@
+# src/supertropical/cache.py
+"""
+Optional LRU cache for permanents and adjoints.
+
+Disabled by default. ``enable_cache()`` installs a process-wide
+ResultCache; SupertropicalMatrix.permanent() and adjoint() then look up
+their result by a content hash of the value and ghost arrays before
+computing it. solve(), factorize() and pseudo_inverse() go through
+those two methods, so repeated systems reuse the same entries.
+
+Matrices are mutable, so the key is recomputed from the arrays on every
+call (one BLAKE2 pass, O(n²)); changing a matrix in place simply gives
+a different key. Cached arrays are copied on the way in and out.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+from ._kernels import to_float64
+
+# Nominal size of a cached scalar result (e.g. a permanent)
+SCALAR_BYTES = 16
+
+_cache = None
+
+
+def content_key(kind, values, ghost):
+    """
+    Hashable key for a result of ``kind`` on the (values, ghost) pair.
+
+    Values are hashed as float64 with ε = -inf, so a matrix has the same
+    key whatever its values dtype (the integer ε sentinel included).
+
+    Returns:
+        tuple: (kind, shape, 32-byte BLAKE2b digest).
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(np.ascontiguousarray(to_float64(values)).tobytes())
+    digest.update(np.packbits(ghost).tobytes())
+    return kind, tuple(values.shape), digest.digest()
+
+
+def _size(result):
+    return sum(part.nbytes if isinstance(part, np.ndarray) else SCALAR_BYTES
+               for part in result)
+
+
+def _copy(result):
+    return tuple(part.copy() if isinstance(part, np.ndarray) else part for part in result)
+
+
+class ResultCache:
+    """
+    Bounded least-recently-used cache of computed results.
+
+    Entries are evicted oldest-first when either limit is exceeded. A
+    single result larger than ``max_bytes`` is returned but not stored.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None):
+        """
+        Args:
+            max_entries (int or None): Maximum number of entries.
+            max_bytes (int or None): Maximum total size of cached arrays.
+
+        Raises:
+            ValueError: If a limit is negative.
+        """
+        if (max_entries is not None and max_entries < 0) or (max_bytes is not None and max_bytes < 0):
+            raise ValueError("Cache limits must be non-negative.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return (f"ResultCache(entries={len(self._entries)}, bytes={self._bytes}, "
+                f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def info(self):
+        """
+        Cache statistics.
+
+        Returns:
+            dict: hits, misses, evictions, entries, bytes and the limits.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def get_or_compute(self, kind, values, ghost, compute):
+        """
+        Returns the cached result for the arrays, computing and storing it
+        on a miss.
+
+        Args:
+            kind (str): Name of the computation, e.g. "permanent".
+            values, ghost: The input arrays.
+            compute (callable): Returns the result as a tuple.
+
+        Returns:
+            tuple: The result (arrays are fresh copies).
+        """
+        key = content_key(kind, values, ghost)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy(result)
+            self.misses += 1
+
+        result = compute()
+        self._store(key, _copy(result))
+        return result
+
+    def _store(self, key, result):
+        size = _size(result)
+        with self._lock:
+            if key in self._entries or (self.max_bytes is not None and size > self.max_bytes):
+                return
+            self._entries[key] = result
+            self._bytes += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= _size(evicted)
+                self.evictions += 1
+
+    def invalidate(self, matrix=None):
+        """
+        Drops cached results.
+
+        Args:
+            matrix (SupertropicalMatrix, optional): Only drop the results
+                for this matrix's current content; all when omitted.
+        """
+        if matrix is None:
+            with self._lock:
+                self._entries.clear()
+                self._bytes = 0
+            return
+        content = content_key(None, matrix.values, matrix.ghost)[1:]
+        with self._lock:
+            for key in [key for key in self._entries if key[1:] == content]:
+                self._bytes -= _size(self._entries.pop(key))
+
+
+def enable_cache(max_entries=128, max_bytes=None):
+    """
+    Installs a new process-wide cache for permanents and adjoints.
+
+    Args:
+        max_entries (int or None): Maximum number of cached results.
+        max_bytes (int or None): Maximum total size of cached arrays.
+
+    Returns:
+        ResultCache: The installed cache.
+    """
+    global _cache
+    _cache = ResultCache(max_entries=max_entries, max_bytes=max_bytes)
+    return _cache
+
+
+def disable_cache():
+    """Removes the process-wide cache and frees its entries."""
+    global _cache
+    _cache = None
+
+
+def get_cache():
+    """
+    Returns:
+        ResultCache or None: The installed cache, if any.
+    """
+    return _cache
+
+
+def invalidate_cache(matrix=None):
+    """Drops all cached results, or only those of ``matrix``."""
+    if _cache is not None:
+        _cache.invalidate(matrix)
+
+
+def cached(kind, values, ghost, compute):
+    """Runs ``compute`` through the process-wide cache when one is enabled."""
+    if _cache is None:
+        return compute()
+    return _cache.get_or_compute(kind, values, ghost, compute)
@@ -10,8 +10,14 @@ class SupertropicalElement:
     """
     Represents a single element in supertropical algebra,
     which can be either tangible or ghost.
+
+    Elements are immutable and hashable. They use __slots__, so they
+    carry no per-instance __dict__, and operations may return one of
+    their operands (or a shared constant) instead of a new object.
     """
 
+    __slots__ = ("value", "is_ghost")
+
     def __init__(self, value: float, is_ghost: bool = False):
         """
         Initializes the element.
@@ -24,12 +30,30 @@ class SupertropicalElement:
         if not isinstance(value, (int, float)):
             raise TypeError("Value must be an int or float.")
             
-        self.value = float(value)
-        self.is_ghost = is_ghost
+        _set_value(self, float(value))
+        _set_is_ghost(self, bool(is_ghost))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SupertropicalElement is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("SupertropicalElement is immutable.")
+
+    def __reduce__(self):
+        # Rebuild through __init__ since attributes cannot be set later
+        return (SupertropicalElement, (self.value, self.is_ghost))
+
+    def __hash__(self):
+        # Tangible elements compare equal to plain numbers, so they
+        # must hash like them
+        if self.is_ghost:
+            return hash((self.value, True))
+        return hash(self.value)
 
     def _coerce(self, other):
         """Converts int, float, or other elements for operations."""
-        if isinstance(other, SupertropicalElement):
+        if type(other) is SupertropicalElement or isinstance(other, SupertropicalElement):
+            # No allocation on the common element-element path
             return other
         if isinstance(other, (int, float)):
             # Standard numbers are treated as tangible elements
@@ -43,7 +67,8 @@ class SupertropicalElement:
         Performs supertropical addition (oplus, $\oplus$).
 
         Rules:
-        1. a + b = max(a, b)
+        1. a + b = max(a, b), keeping the ghost status of the larger one
+           (e.g. 5 + 3ν = 5, 3 + 5ν = 5ν)
         2. a + a = aν (becomes ghost)
         3. a + aν = aν
         4. aν + aν = aν
@@ -52,21 +77,17 @@ class SupertropicalElement:
         if other is NotImplemented:
             return NotImplemented
 
-        # Rules 3 & 4: If one or both are ghost
-        if self.is_ghost or other.is_ghost:
-            # a + bν -> max(a, b)ν (if a!= b)
-            # aν + bν -> max(a, b)ν
-            # a + aν -> aν
-            new_val = max(self.value, other.value)
-            return SupertropicalElement(new_val, is_ghost=True)
-
-        # Rules 1 & 2: Both are tangible
-        if self.value == other.value:
-            # Rule 2: a + a = aν 
-            return SupertropicalElement(self.value, is_ghost=True)
-        else:
-            # Rule 1: a + b = max(a, b)
-            return SupertropicalElement(max(self.value, other.value))
+        # Rule 1: different values -> the larger element wins as-is
+        # (elements are immutable, so the operand itself is returned)
+        if self.value != other.value:
+            return self if self.value > other.value else other
+
+        # Rules 2, 3 & 4: equal values always give a ghost
+        if self.is_ghost:
+            return self
+        if other.is_ghost:
+            return other
+        return SupertropicalElement(self.value, is_ghost=True)
 
     def __radd__(self, other):
         # Ensures '5 + element' works [34]
@@ -85,6 +106,12 @@ class SupertropicalElement:
         if other is NotImplemented:
             return NotImplemented
 
+        # The unit 0 leaves the other operand unchanged
+        if other.value == 0.0 and not other.is_ghost:
+            return self
+        if self.value == 0.0 and not self.is_ghost:
+            return other
+
         # Rules 1, 2, 3: Classical addition on values
         new_val = self.value + other.value
         
@@ -122,7 +149,9 @@ class SupertropicalElement:
         
         if exponent == 0:
             # a^0 = 0 (multiplicative identity in supertropical)
-            return SupertropicalElement(0, is_ghost=False)
+            return UNIT
+        if exponent == 1:
+            return self
         
         # a^k = k * a (works for both positive and negative k)
         new_val = exponent * self.value
@@ -189,4 +218,19 @@ class SupertropicalElement:
             return False
         
         # x ⊨ y if x has same value as y and x is ghost
-        return self.value == other.value and self.is_ghost
\ No newline at end of file
+        return self.value == other.value and self.is_ghost
+
+
+# Slot setters used by __init__, bypassing the immutable __setattr__
+_set_value = SupertropicalElement.value.__set__
+_set_is_ghost = SupertropicalElement.is_ghost.__set__
+
+# Shared constants; elements are immutable, so these are safe to reuse.
+EPSILON = SupertropicalElement(-math.inf)
+"""The zero element ε = -inf (additive identity)."""
+
+GHOST_EPSILON = SupertropicalElement(-math.inf, is_ghost=True)
+"""ε as a ghost, as used off the diagonal of identity and pseudo-zero matrices."""
+
+UNIT = SupertropicalElement(0.0)
+"""The unit 0 (multiplicative identity)."""
@@ -0,0 +1,211 @@
+# src/supertropical/factorization.py
+import numpy as np
+from ._assignment import assignment_state, solve_columns, state_permanent, update_row
+from ._kernels import cast_values, result_dtype, to_float64
+from .element import SupertropicalElement
+from .matrix import SupertropicalMatrix
+from .profiling import instrumented
+
+
+class SupertropicalFactorization:
+    """
+    Precomputed permanent and adjoint of a square SupertropicalMatrix.
+
+    Created by SupertropicalMatrix.factorize(). The expensive parts of
+    Cramer's rule (per(A) and adj(A)) are computed once, so repeated
+    solves and pseudo-inverses only cost a matrix product. Instances are
+    plain Python objects holding NumPy arrays and can be pickled to send
+    them to worker processes.
+
+    update() and update_row() change entries of A and repair the optimal
+    assignment behind per(A) in O(n²) instead of refactorizing. The
+    adjoint is then recomputed only if it is asked for; solve() uses the
+    assignment directly, also in O(n²) per right-hand side.
+    """
+
+    @instrumented
+    def __init__(self, matrix: SupertropicalMatrix):
+        """
+        Factorizes the matrix.
+
+        Args:
+            matrix (SupertropicalMatrix): The (n, n) matrix A.
+
+        Raises:
+            ValueError: If the matrix is not square.
+        """
+        if len(matrix.shape) != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("Only square (n x n) matrices can be factorized.")
+
+        self.matrix = matrix
+        self.permanent = matrix.permanent()
+        # solve() needs the adjoint only for a tangible per(A); otherwise
+        # it is left to the adjoint property (pseudo-inverse)
+        if self.permanent.is_ghost:
+            self._adjoint = None
+        else:
+            self._adjoint = matrix.adjoint()
+        # Optimal assignment of A and the float64 values it works on,
+        # built by the first update
+        self._state = None
+        self._sigma = None
+        self._values = None
+
+    def __repr__(self):
+        return (f"SupertropicalFactorization(shape={self.matrix.shape}, "
+                f"permanent={self.permanent})")
+
+    @property
+    def adjoint(self):
+        """adj(A), or None if per(A) is ε; computed lazily if A is singular or was updated."""
+        if self._adjoint is None and self.permanent.value != -np.inf:
+            self._adjoint = self.matrix.adjoint()
+        return self._adjoint
+
+    @property
+    def is_singular(self) -> bool:
+        """True if per(A) is ghost, i.e. A * x = b cannot be solved."""
+        return self.permanent.is_ghost
+
+    @instrumented
+    def solve(self, b: SupertropicalMatrix):
+        """
+        Solves A * x = b with the cached permanent and adjoint:
+        x = adj(A) * b * (per(A))^{-1}
+
+        Args:
+            b (SupertropicalMatrix): The (n,), (n, 1) or (n, k)
+                                     right-hand side(s).
+
+        Returns:
+            SupertropicalMatrix: The (n, 1) or (n, k) solution.
+
+        Raises:
+            ValueError: If the matrix is singular (permanent is ghost)
+                        or dimensions are incorrect.
+        """
+        n = self.matrix.shape[0]
+        # b must have the same number of rows as A, allow (n,), (n,1) or (n,k)
+        if len(b.shape) not in (1, 2) or b.shape[0] != n:
+            raise ValueError(f"Dimension mismatch. A is {self.matrix.shape} but b is {b.shape}.")
+
+        # A matrix is nonsingular if its permanent is tangible [7, 19]
+        if self.is_singular:
+            raise ValueError("Matrix is singular (permanent is ghost). Cannot solve.")
+
+        # (1/a) in supertropical algebra is -a (classical)
+        per_A_inv = SupertropicalElement(-self.permanent.value, is_ghost=False)
+
+        # Reshape b if needed to ensure column vector
+        if len(b.shape) == 1:
+            b = SupertropicalMatrix._from_arrays(
+                b.values.reshape(-1, 1), b.ghost.reshape(-1, 1)
+            )
+
+        if self._adjoint is not None:
+            # Lazy chain: per(A)^{-1} is added in place to the product
+            return (self._adjoint.lazy() * b * per_A_inv).compute()
+
+        # After an update: Cramer's rule along the repaired assignment
+        state = self._state
+        values, ghost = solve_columns(
+            self._values, self.matrix.ghost, self._sigma,
+            state[2][1:], state[3][1:], to_float64(b.values), b.ghost,
+        )
+        dtype = result_dtype(self.matrix.values, b.values)
+        return SupertropicalMatrix._from_arrays(cast_values(values, dtype), ghost)
+
+    @instrumented
+    def update(self, i: int, j: int, value):
+        """
+        Sets A[i, j] = value and repairs the factorization in O(n²).
+
+        Args:
+            i (int): Row index.
+            j (int): Column index.
+            value (SupertropicalElement or number): The new entry; numbers
+                                                    are tangible.
+
+        Returns:
+            SupertropicalFactorization: self, so that
+            ``F.update(i, j, value).solve(b)`` returns the new solution.
+
+        Raises:
+            IndexError: If (i, j) is out of range.
+        """
+        n = self.matrix.shape[0]
+        i, j = range(n)[i], range(n)[j]
+        values = to_float64(self.matrix.values[i]).copy()
+        ghost = self.matrix.ghost[i].copy()
+        if isinstance(value, SupertropicalElement):
+            values[j], ghost[j] = value.value, value.is_ghost
+        else:
+            values[j], ghost[j] = float(value), False
+        return self.update_row(i, SupertropicalMatrix._from_arrays(values, ghost))
+
+    @instrumented
+    def update_row(self, i: int, row):
+        """
+        Replaces row i of A and repairs the factorization in O(n²).
+
+        Only the assignment of row i is redone (one augmenting path of
+        the Hungarian method); per(A) follows from the repaired
+        assignment. The factorization works on its own copy of A, so the
+        matrix it was created from is left unchanged.
+
+        Args:
+            i (int): Row index.
+            row (SupertropicalMatrix or list): The n new entries.
+
+        Returns:
+            SupertropicalFactorization: self.
+
+        Raises:
+            IndexError: If i is out of range.
+            ValueError: If the row does not have n entries.
+        """
+        n = self.matrix.shape[0]
+        i = range(n)[i]
+        if not isinstance(row, SupertropicalMatrix):
+            row = SupertropicalMatrix(row)
+        if row.values.size != n:
+            raise ValueError(f"Row must have {n} entries, got shape {row.shape}.")
+
+        if self._state is None:
+            self.matrix = SupertropicalMatrix(self.matrix)
+            # Shares the values of float64 matrices
+            self._values = to_float64(self.matrix.values)
+            self._state = assignment_state(self._values)
+        self.matrix.values[i] = cast_values(row.values.reshape(n), self.matrix.values.dtype)
+        self.matrix.ghost[i] = row.ghost.reshape(n)
+        if self._values is not self.matrix.values:
+            self._values[i] = to_float64(self.matrix.values[i])
+        if not update_row(self._state, self._values, i):
+            # New entries outside the range the ε penalty was chosen for
+            self._state = assignment_state(self._values)
+
+        value, is_ghost, self._sigma = state_permanent(
+            self._values, self.matrix.ghost, self._state
+        )
+        self.permanent = SupertropicalElement(value, is_ghost=is_ghost)
+        self._adjoint = None
+        return self
+
+    @instrumented
+    def pseudo_inverse(self):
+        """
+        Pseudo-inverse A^♯ = (1_R / |A|) ⊗ adj(A), with (1_R / |A|)^ν
+        when |A| is ghost.
+
+        Returns:
+            SupertropicalMatrix: The pseudo-inverse matrix
+
+        Raises:
+            ValueError: If the permanent is epsilon
+        """
+        if self.permanent.value == -np.inf:
+            raise ValueError("Matrix permanent is epsilon, pseudo-inverse undefined")
+
+        # In supertropical: 1/a = -a (classical negation)
+        inv_perm = SupertropicalElement(-self.permanent.value, is_ghost=self.permanent.is_ghost)
+        return self.adjoint * inv_perm
@@ -0,0 +1,261 @@
+# src/supertropical/lazy.py
+"""
+Lazy supertropical expressions.
+
+``A.lazy()`` wraps a matrix in a LazySupertropicalMatrix. Its ``*`` and
+``+`` operators record an expression graph instead of computing, and
+nothing is evaluated until ``compute()`` or element access:
+
+    >>> x = (A.lazy() * B * C * v * SupertropicalElement(-3)).compute()
+
+On evaluation a chain of products is flattened and
+
+- multiplied in the order with the fewest scalar terms, found by the
+  classic matrix-chain dynamic program (⊙ is associative, so any order
+  gives the same matrix; for non-integer data up to rounding);
+- all scalar factors are folded into one element, applied once to the
+  smallest operand or, in place, to the result;
+- chains of sums are accumulated into one buffer.
+
+Operands are held by reference, and the result is kept after the first
+evaluation.
+"""
+import numpy as np
+from ._kernels import cast_values, result_dtype, value_product
+from .backend import matmul as parallel_matmul
+from .element import SupertropicalElement
+from .matrix import SupertropicalMatrix
+from .profiling import instrumented
+
+
+def chain_order(dims):
+    """
+    Cheapest parenthesization of a matrix chain (matrix-chain DP, O(k³)).
+
+    Args:
+        dims (sequence of int): k + 1 dimensions; factor i is
+                                dims[i] x dims[i + 1].
+
+    Returns:
+        tuple: (terms, order) where terms is the number of scalar
+        ⊙ terms of the best order and order is a nested tuple of factor
+        indices, e.g. ((0, 1), 2).
+    """
+    k = len(dims) - 1
+    cost = np.zeros((k, k))
+    split = np.zeros((k, k), dtype=np.int64)
+    for length in range(2, k + 1):
+        for i in range(k - length + 1):
+            j = i + length - 1
+            cost[i, j] = np.inf
+            for s in range(i, j):
+                c = cost[i, s] + cost[s + 1, j] + dims[i] * dims[s + 1] * dims[j + 1]
+                if c < cost[i, j]:
+                    cost[i, j] = c
+                    split[i, j] = s
+
+    def order(i, j):
+        if i == j:
+            return i
+        s = int(split[i, j])
+        return order(i, s), order(s + 1, j)
+
+    return int(cost[0, k - 1]), order(0, k - 1)
+
+
+def _element(value):
+    if isinstance(value, SupertropicalElement):
+        return value
+    return SupertropicalElement(value)
+
+
+class LazySupertropicalMatrix:
+    """
+    Deferred supertropical matrix expression.
+
+    A node is a leaf (a SupertropicalMatrix), a product chain of matrix
+    nodes and scalar elements, or a sum of nodes and elements. Shapes are
+    checked when the expression is built.
+    """
+
+    def __init__(self, matrix: SupertropicalMatrix):
+        """
+        Wraps a matrix as a leaf expression.
+
+        Args:
+            matrix (SupertropicalMatrix): The operand (not copied).
+        """
+        self._op = "leaf"
+        self._operands = (matrix,)
+        self._scalars = ()
+        self.shape = matrix.shape
+        self._result = matrix
+
+    @classmethod
+    def _node(cls, op, operands, scalars, shape):
+        node = cls.__new__(cls)
+        node._op = op
+        node._operands = tuple(operands)
+        node._scalars = tuple(scalars)
+        node.shape = shape
+        node._result = None
+        return node
+
+    def __repr__(self):
+        state = "computed" if self._result is not None else "pending"
+        return f"LazySupertropicalMatrix({self._op}, shape={self.shape}, {state})"
+
+    def lazy(self):
+        """Returns self."""
+        return self
+
+    # --- Building expressions ---
+
+    @staticmethod
+    def _wrap(other):
+        """Lazy node, element, or None for unsupported operands."""
+        if isinstance(other, LazySupertropicalMatrix):
+            return other
+        if isinstance(other, SupertropicalMatrix):
+            return LazySupertropicalMatrix(other)
+        if isinstance(other, (SupertropicalElement, int, float)):
+            return _element(other)
+        return None
+
+    def _factors(self):
+        if self._op == "product":
+            return self._operands, self._scalars
+        return (self,), ()
+
+    def _product(self, left, right):
+        factors, scalars = [], []
+        for part in (left, right):
+            if isinstance(part, SupertropicalElement):
+                scalars.append(part)
+                continue
+            if len(part.shape) != 2:
+                raise ValueError(f"Lazy products need 2-D operands, got shape {part.shape}.")
+            part_factors, part_scalars = part._factors()
+            factors.extend(part_factors)
+            scalars.extend(part_scalars)
+        for a, b in zip(factors, factors[1:]):
+            if a.shape[1] != b.shape[0]:
+                raise ValueError(f"Matrix dimensions do not match: {a.shape} * {b.shape}.")
+        shape = (factors[0].shape[0], factors[-1].shape[1])
+        return LazySupertropicalMatrix._node("product", factors, scalars, shape)
+
+    def __mul__(self, other):
+        """Deferred A ⊙ B, or scalar multiplication by an element or number."""
+        other = self._wrap(other)
+        if other is None:
+            raise TypeError("Can only multiply by SupertropicalMatrix, SupertropicalElement or scalar.")
+        return self._product(self, other)
+
+    def __rmul__(self, other):
+        other = self._wrap(other)
+        if other is None:
+            raise TypeError("Can only multiply by SupertropicalMatrix, SupertropicalElement or scalar.")
+        return self._product(other, self)
+
+    def __add__(self, other):
+        """Deferred elementwise A ⊕ B (broadcasting like NumPy)."""
+        other = self._wrap(other)
+        if other is None:
+            return NotImplemented
+        operands, scalars = [], []
+        for part in (self, other):
+            if isinstance(part, SupertropicalElement):
+                scalars.append(part)
+            elif part._op == "sum":
+                operands.extend(part._operands)
+                scalars.extend(part._scalars)
+            else:
+                operands.append(part)
+        shape = np.broadcast_shapes(*(part.shape for part in operands))
+        return LazySupertropicalMatrix._node("sum", operands, scalars, shape)
+
+    __radd__ = __add__
+
+    # --- Evaluation ---
+
+    @instrumented
+    def compute(self):
+        """
+        Evaluates the expression.
+
+        Returns:
+            SupertropicalMatrix: The result (kept for later calls).
+        """
+        return self._evaluate()
+
+    def _evaluate(self):
+        if self._result is None:
+            if self._op == "product":
+                self._result = self._compute_product()
+            else:
+                self._result = self._compute_sum()
+        return self._result
+
+    def _compute_product(self):
+        matrices = [factor._evaluate() for factor in self._operands]
+        scalar = None
+        if self._scalars:
+            scalar = SupertropicalElement(
+                sum(s.value for s in self._scalars),
+                is_ghost=any(s.is_ghost for s in self._scalars),
+            )
+        sizes = [m.values.size for m in matrices]
+        result_size = self.shape[0] * self.shape[1]
+        if scalar is not None and min(sizes) < result_size:
+            # Scaling the smallest factor is cheaper than scaling the result
+            i = int(np.argmin(sizes))
+            matrices[i] = matrices[i] * scalar
+            scalar = None
+
+        dims = [m.shape[0] for m in matrices] + [matrices[-1].shape[1]]
+        _, order = chain_order(dims)
+
+        def evaluate(node):
+            if isinstance(node, int):
+                return matrices[node].values, matrices[node].ghost
+            left, right = evaluate(node[0]), evaluate(node[1])
+            return parallel_matmul(*left, *right)
+
+        values, ghost = evaluate(order)
+        if isinstance(order, int):
+            values, ghost = values.copy(), ghost.copy()
+        if scalar is not None:
+            value = np.float64(scalar.value)
+            dtype = result_dtype(values, value)
+            values = cast_values(values, dtype)
+            value_product(values, cast_values(value, dtype), out=values)
+            ghost |= scalar.is_ghost
+        return SupertropicalMatrix._from_arrays(values, ghost)
+
+    def _compute_sum(self):
+        from .ufuncs import add
+        parts = [operand._evaluate() for operand in self._operands] + list(self._scalars)
+        result = add(parts[0], parts[1])
+        if result.shape != self.shape:
+            # Later operands broadcast against the full shape
+            result = SupertropicalMatrix._from_arrays(
+                np.broadcast_to(result.values, self.shape).copy(),
+                np.broadcast_to(result.ghost, self.shape).copy(),
+            )
+        for part in parts[2:]:
+            add(result, part, out=result)
+        return result
+
+    def __getitem__(self, key):
+        """Evaluates the expression and indexes the result."""
+        return self.compute()[key]
+
+    @property
+    def values(self):
+        """Values of the evaluated expression."""
+        return self.compute().values
+
+    @property
+    def ghost(self):
+        """Ghost mask of the evaluated expression."""
+        return self.compute().ghost
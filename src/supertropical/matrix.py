@@ -1,59 +1,286 @@
 # src/supertropical/matrix.py
 import numpy as np
-import itertools
-from.element import SupertropicalElement
+from.element import GHOST_EPSILON, SupertropicalElement
+from ._assignment import adjoint as assignment_adjoint
+from ._assignment import permanent as assignment_permanent
+from ._assignment import characteristic_coefficients
+from ._kernels import VALUE_DTYPES, cast_values, epsilon, kleene_star, to_float64, value_dtype
+from .backend import kernel
+from .cache import cached
+from .profiling import instrumented
+from .backend import matmul as parallel_matmul
+from ._spectral import critical_analysis, cycle_mean
+
+def _numeric_array(data):
+    """``data`` as a numeric ndarray, or None if it holds other objects."""
+    try:
+        array = np.array(data)
+    except ValueError:
+        # Ragged nesting
+        return None
+    if array.dtype.kind not in "biuf":
+        return None
+    if array.size == 0 and array.ndim < 2:
+        array = array.reshape(0, 0)
+    return array
+
 
 class SupertropicalMatrix:
     """
     Represents a matrix over the supertropical algebra.
     """
 
-    def __init__(self, data):
+    def __init__(self, data, dtype=None):
         """
         Initializes from a list of lists or a numpy array.
+
+        Entries may be numbers (treated as tangible) or SupertropicalElement
+        objects. Internally the matrix is stored as two dense arrays:
+        ``values`` and ``ghost`` (bool), so no element objects are kept
+        alive per entry.
+
+        Args:
+            data: Nested lists, a NumPy array or a SupertropicalMatrix.
+            dtype (optional): dtype of ``values``: float64 (the default),
+                float32, int64 or int32. Integer matrices store ε as the
+                dtype's minimum and give exact ties in ghost detection;
+                entries must then be integers or ε. The smaller dtypes
+                halve memory and bandwidth in products and closures.
+
+        Raises:
+            ValueError: If the dtype is unsupported or the entries do not
+                        fit it.
         """
-        if not isinstance(data, np.ndarray):
-            # Convert list of (float, int, or SupertropicalElement)
-            # to a numpy array of SupertropicalElement objects
-            if isinstance(data, list):
-                # Get shape from nested list
-                rows = len(data)
-                cols = len(data[0]) if rows > 0 else 0
-                object_array = np.empty((rows, cols), dtype=object)
-                
-                for i in range(rows):
-                    for j in range(cols):
-                        val = data[i][j]
-                        if not isinstance(val, SupertropicalElement):
-                            val = SupertropicalElement(val)
-                        object_array[i, j] = val
-                self.data = object_array
+        if dtype is not None:
+            dtype = value_dtype(dtype)
+        if not isinstance(data, (SupertropicalMatrix, np.ndarray)):
+            # Nested lists of plain numbers are converted in one pass
+            numeric = _numeric_array(data)
+            if numeric is not None:
+                data = numeric
+        if isinstance(data, SupertropicalMatrix):
+            values, ghost = data.values.copy(), data.ghost.copy()
+        elif isinstance(data, np.ndarray) and data.dtype != object:
+            # Plain numeric arrays are read as tangible values; integer
+            # arrays converted to an integer dtype keep their sentinel as ε
+            if dtype is not None and data.dtype.kind in "iu":
+                values = np.array(cast_values(data, dtype))
             else:
-                # If it's already a numpy array
-                self.data = np.array(data, dtype=object)
+                values = np.array(data, dtype=np.float64)
+            ghost = np.zeros(values.shape, dtype=bool)
         else:
-            self.data = data
-            
-        self.shape = self.data.shape
+            object_array = np.array(data, dtype=object)
+            if object_array.size == 0 and object_array.ndim < 2:
+                object_array = object_array.reshape(0, 0)
+
+            values = np.empty(object_array.shape, dtype=np.float64)
+            ghost = np.zeros(object_array.shape, dtype=bool)
+            flat_values = values.reshape(-1)
+            flat_ghost = ghost.reshape(-1)
+            for idx, val in enumerate(object_array.flat):
+                if isinstance(val, SupertropicalElement):
+                    flat_values[idx] = val.value
+                    flat_ghost[idx] = val.is_ghost
+                elif isinstance(val, (int, float)):
+                    flat_values[idx] = val
+                else:
+                    raise TypeError("Value must be an int or float.")
+
+        if dtype is not None:
+            values = cast_values(values, dtype)
+        self.values = values
+        self.ghost = ghost
+        self.shape = values.shape
+
+    @classmethod
+    def _from_arrays(cls, values, ghost):
+        """Wraps existing value and ghost arrays without any conversion."""
+        matrix = cls.__new__(cls)
+        matrix.values = values
+        matrix.ghost = ghost
+        matrix.shape = values.shape
+        return matrix
+
+    @classmethod
+    def from_arrays(cls, values, ghost_mask=None, dtype=None):
+        """
+        Builds a matrix from a values array and a ghost mask.
+
+        Nothing is copied when ``values`` already has a supported dtype
+        (float64, float32, int64 or int32) and ``ghost_mask`` is bool:
+        the matrix shares their memory. Other numeric arrays are
+        converted to float64.
+
+        Args:
+            values (array_like): Numeric values; -inf (or the integer
+                                 sentinel) marks ε.
+            ghost_mask (array_like, optional): Bool mask of ghost entries,
+                                               same shape; all tangible
+                                               when omitted.
+            dtype (optional): Values dtype to convert to.
+
+        Returns:
+            SupertropicalMatrix: The matrix.
+
+        Raises:
+            TypeError: If ``values`` is not numeric.
+            ValueError: If the shapes differ or the values do not fit the
+                        dtype.
+        """
+        values = np.asarray(values)
+        if values.dtype.kind not in "biuf":
+            raise TypeError(f"values must be a numeric array, got dtype {values.dtype}.")
+        if dtype is not None:
+            values = cast_values(values, value_dtype(dtype))
+        elif values.dtype not in VALUE_DTYPES:
+            values = values.astype(np.float64)
+        if ghost_mask is None:
+            ghost = np.zeros(values.shape, dtype=bool)
+        else:
+            ghost = np.asarray(ghost_mask, dtype=bool)
+            if ghost.shape != values.shape:
+                raise ValueError(f"ghost_mask has shape {ghost.shape}, expected {values.shape}.")
+        return cls._from_arrays(values, ghost)
+
+    @classmethod
+    def from_numpy(cls, values, dtype=None):
+        """
+        Builds a tangible matrix from a numeric array, without copying
+        when its dtype is supported (see from_arrays).
+
+        Args:
+            values (array_like): Numeric values; -inf (or the integer
+                                 sentinel) marks ε.
+            dtype (optional): Values dtype to convert to.
+
+        Returns:
+            SupertropicalMatrix: The matrix.
+        """
+        return cls.from_arrays(values, None, dtype=dtype)
+
+    @classmethod
+    def from_edges(cls, rows, cols, values, ghosts=None, shape=None, dtype=None):
+        """
+        Builds the matrix of a weighted graph from its edge list.
+
+        Entry (rows[e], cols[e]) gets values[e]; all other entries are
+        ghost ε, as in SparseSupertropicalMatrix.to_dense(). Parallel
+        edges are summed (⊕): the largest weight wins, and the entry is
+        ghost if that weight occurs twice or on a ghost edge.
+
+        Args:
+            rows, cols (array_like): Integer endpoints of the edges.
+            values (array_like): Edge weights.
+            ghosts (array_like, optional): Bool ghost flag per edge.
+            shape (tuple, optional): (m, n); by default just large enough
+                                     for the edges.
+            dtype (optional): Values dtype; by default that of ``values``
+                              if supported, else float64.
+
+        Returns:
+            SupertropicalMatrix: The dense (m, n) matrix.
+
+        Raises:
+            ValueError: If the edge arrays differ in length or an edge
+                        lies outside ``shape``.
+        """
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        cols = np.asarray(cols, dtype=np.int64).reshape(-1)
+        weights = cls.from_arrays(np.asarray(values).reshape(-1), ghosts, dtype=dtype)
+        edge_values, edge_ghost = weights.values, weights.ghost.reshape(-1)
+        if not rows.shape == cols.shape == edge_values.shape:
+            raise ValueError("rows, cols, values and ghosts must have one entry per edge.")
+        if shape is None:
+            shape = (int(rows.max()) + 1 if rows.size else 0,
+                     int(cols.max()) + 1 if cols.size else 0)
+        m, n = int(shape[0]), int(shape[1])
+        if rows.size and (rows.min() < 0 or cols.min() < 0 or rows.max() >= m or cols.max() >= n):
+            raise ValueError(f"Edges lie outside a matrix of shape {(m, n)}.")
+
+        eps = epsilon(edge_values.dtype)
+        out_values = np.full(m * n, eps)
+        out_ghost = np.ones(m * n, dtype=bool)
+        flat = rows * n + cols
+        # Duplicates found in O(E log E), independent of the matrix size
+        sorted_flat = np.sort(flat)
+        if (sorted_flat[1:] == sorted_flat[:-1]).any():
+            # Parallel edges: sort by entry, then weight; the last edge of
+            # each entry has the largest weight
+            order = np.lexsort((edge_values, flat))
+            flat, edge_values, edge_ghost = flat[order], edge_values[order], edge_ghost[order]
+            same = flat[1:] == flat[:-1]
+            last = np.append(~same, True)
+            tie = np.insert(same & (edge_values[1:] == edge_values[:-1]), 0, False)
+            flat, edge_ghost = flat[last], edge_ghost[last] | tie[last]
+            edge_values = edge_values[last]
+        out_values[flat] = edge_values
+        out_ghost[flat] = edge_ghost | (edge_values == eps)
+        return cls._from_arrays(out_values.reshape(m, n), out_ghost.reshape(m, n))
+
+    @property
+    def dtype(self):
+        """dtype of the values array (float64, float32, int64 or int32)."""
+        return self.values.dtype
+
+    def astype(self, dtype):
+        """
+        Converts the values to another dtype, mapping ε to -inf or to the
+        integer sentinel.
+
+        Args:
+            dtype: float64, float32, int64 or int32.
+
+        Returns:
+            SupertropicalMatrix: The converted matrix (self if the dtype
+            already matches).
+
+        Raises:
+            ValueError: If the dtype is unsupported or the entries do not
+                        fit it.
+        """
+        dtype = value_dtype(dtype)
+        if dtype == self.values.dtype:
+            return self
+        return SupertropicalMatrix._from_arrays(cast_values(self.values, dtype), self.ghost.copy())
+
+    @property
+    def data(self):
+        """
+        Object array of SupertropicalElement entries.
+
+        Built on demand from ``values`` and ``ghost``; kept for code that
+        works with individual elements.
+        """
+        object_array = np.empty(self.shape, dtype=object)
+        values = to_float64(self.values)
+        for idx in np.ndindex(*self.shape):
+            object_array[idx] = SupertropicalElement(
+                float(values[idx]), is_ghost=bool(self.ghost[idx])
+            )
+        return object_array
 
     def __repr__(self):
         """String representation showing matrix in readable 2D array format."""
+        if len(self.shape) > 2:
+            # Stacked matrices: one block per leading index
+            return "[\n" + ",\n".join(repr(self[i]) for i in range(self.shape[0])) + "\n]"
+        values = np.atleast_2d(to_float64(self.values))
+        ghost = np.atleast_2d(self.ghost)
         rows = []
-        for i in range(self.shape[0]):
+        for i in range(values.shape[0]):
             row = []
-            for j in range(self.shape[1]):
-                elem = self.data[i, j]
+            for j in range(values.shape[1]):
                 # Format: number with 'v' for ghost, plain number for tangible
-                if elem.is_ghost:
-                    row.append(f"{elem.value}v")
+                if ghost[i, j]:
+                    row.append(f"{float(values[i, j])}v")
                 else:
-                    row.append(f"{elem.value}")
+                    row.append(f"{float(values[i, j])}")
             rows.append(row)
         
         # Calculate column widths for alignment
         col_widths = []
-        for j in range(self.shape[1]):
-            max_width = max(len(rows[i][j]) for i in range(self.shape[0]))
+        for j in range(values.shape[1]):
+            max_width = max(len(rows[i][j]) for i in range(values.shape[0]))
             col_widths.append(max_width)
         
         # Build the string with proper alignment
@@ -65,8 +292,59 @@ class SupertropicalMatrix:
         return "[\n" + "\n".join(lines) + "\n]"
 
     def __getitem__(self, key):
-        return self.data[key]
+        """
+        Returns a SupertropicalElement for a single entry, or a
+        SupertropicalMatrix for slices.
+        """
+        values = self.values[key]
+        ghost = self.ghost[key]
+        if np.ndim(values) == 0:
+            return SupertropicalElement(float(to_float64(values)), is_ghost=bool(ghost))
+        return SupertropicalMatrix._from_arrays(values, ghost)
+
+    @instrumented
+    def __add__(self, other):
+        """
+        Elementwise supertropical addition A ⊕ B (broadcasting like NumPy).
+
+        [A ⊕ B]_ij = a_ij ⊕ b_ij; ``other`` may be a matrix, an element or
+        a number.
+        """
+        from .lazy import LazySupertropicalMatrix
+        from .ufuncs import add
+        if isinstance(other, LazySupertropicalMatrix):
+            return NotImplemented
+        return add(self, other)
+
+    @instrumented
+    def __radd__(self, other):
+        from .ufuncs import add
+        return add(other, self)
+
+    @instrumented
+    def __iadd__(self, other):
+        """In-place A ⊕= B, reusing the storage of A."""
+        from .ufuncs import add
+        return add(self, other, out=self)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Routes NumPy ufuncs to the supertropical elementwise operations
+        (see ``supertropical.ufuncs``): np.add and np.maximum are ⊕,
+        np.multiply is elementwise ⊙ and np.power is elementwise power.
+        """
+        from .ufuncs import UFUNC_HANDLERS
+        handler = UFUNC_HANDLERS.get(ufunc)
+        out = kwargs.pop("out", None)
+        if method != "__call__" or handler is None or kwargs:
+            return NotImplemented
+        if out is not None:
+            if len(out) != 1:
+                return NotImplemented
+            out = out[0]
+        return handler(*inputs, out=out)
 
+    @instrumented
     def __mul__(self, other):
         """
         Matrix multiplication or scalar multiplication.
@@ -80,38 +358,29 @@ class SupertropicalMatrix:
             if self.shape[1] != other.shape[0]:
                 raise ValueError(f"Matrix dimensions do not match: {self.shape} * {other.shape}.")
 
-            new_shape = (self.shape[0], other.shape[1])
-            result_matrix = np.empty(new_shape, dtype=object)
-
-            for i in range(new_shape[0]):
-                for j in range(new_shape[1]):
-                    # Initialize C_ij with the zero element (-inf)
-                    sum_val = SupertropicalElement(-np.inf)
-                    
-                    for k in range(self.shape[1]):
-                        # Calculate A_ik ⊙ B_kj (using element multiplication)
-                        prod = self[i, k] * other[k, j]
-                        # Perform C_ij = C_ij ⊕ (A_ik ⊙ B_kj) (using element addition)
-                        sum_val = sum_val + prod
-                    
-                    result_matrix[i, j] = sum_val
-
-            return SupertropicalMatrix(result_matrix)
+            # Blocked max-plus kernel; C_ij is ghost when the maximum is
+            # attained twice or by a term with a ghost factor
+            values, ghost = parallel_matmul(
+                self.values, self.ghost, other.values, other.ghost
+            )
+            return SupertropicalMatrix._from_arrays(values, ghost)
             
         elif isinstance(other, SupertropicalElement):
-            # Scalar multiplication
-            result = np.empty(self.shape, dtype=object)
-            for i in range(self.shape[0]):
-                for j in range(self.shape[1]):
-                    result[i, j] = self[i, j] * other
-            return SupertropicalMatrix(result)
+            # Scalar multiplication: a_ij ⊙ s = (a_ij + s), ghost if either is ghost
+            from .ufuncs import multiply
+            return multiply(self, other)
             
         elif isinstance(other, (int, float)):
             return self * SupertropicalElement(other)
             
         else:
+            from .lazy import LazySupertropicalMatrix
+            if isinstance(other, LazySupertropicalMatrix):
+                # Let the lazy expression record the product
+                return NotImplemented
             raise TypeError("Can only multiply by SupertropicalMatrix, SupertropicalElement or scalar.")
 
+    @instrumented
     def __rmul__(self, other):
         if isinstance(other, (int, float, SupertropicalElement)):
             return self.__mul__(other)
@@ -120,6 +389,7 @@ class SupertropicalMatrix:
     
     # --- Linear Algebra Methods ---
 
+    @instrumented
     def get_minor(self, i: int, j: int):
         """
         Returns the minor matrix by removing row i and column j.
@@ -131,10 +401,13 @@ class SupertropicalMatrix:
         Returns:
             SupertropicalMatrix: The (n-1)x(n-1) minor matrix.
         """
-        data_without_row = np.delete(self.data, i, axis=0)
-        data_without_col = np.delete(data_without_row, j, axis=1)
-        return SupertropicalMatrix(data_without_col)
+        rows = np.arange(self.shape[0]) != i
+        cols = np.arange(self.shape[1]) != j
+        return SupertropicalMatrix._from_arrays(
+            self.values[np.ix_(rows, cols)], self.ghost[np.ix_(rows, cols)]
+        )
 
+    @instrumented
     def permanent(self):
         """
         Calculates the supertropical permanent of the matrix.
@@ -144,33 +417,29 @@ class SupertropicalMatrix:
         
         This is used as the supertropical equivalent of the determinant. [5, 19]
 
+        Ties between assignments are exact for integer-valued matrices.
+        For other float data, two assignments whose weights differ by
+        less than 8·n·eps·max|a_ij| (``_kernels.tie_tolerance``) count
+        as tied, so the result is ghost where an exact comparison of the
+        rounded sums could still find a single maximum.
+
         Returns:
             SupertropicalElement: The permanent of the matrix.
         """
         if self.shape[0] != self.shape[1]:
             raise ValueError("Permanent is only defined for square matrices.")
             
-        n = self.shape[0]
-        if n == 0:
-            return SupertropicalElement(0.0) # Multiplicative identity
-
-        # Use itertools.permutations to sum over all permutations
-        perms = itertools.permutations(range(n))
-        
-        # Start with the additive identity (-inf)
-        total_sum = SupertropicalElement(-np.inf)
-
-        for perm in perms:
-            # Start with the multiplicative identity (0.0)
-            term_prod = SupertropicalElement(0.0)
-            for i in range(n):
-                term_prod = term_prod * self[i, perm[i]]
-            
-            # Add the product of this permutation to the total sum
-            total_sum = total_sum + term_prod
-            
-        return total_sum
+        # Solved as a maximum-weight assignment in O(n³); ghost status
+        # comes from ghost entries on, or non-uniqueness of, the optimum.
+        # The assignment runs in float64, exact for integers below 2^53
+        values = to_float64(self.values)
+        value, is_ghost = cached(
+            "permanent", values, self.ghost,
+            lambda: assignment_permanent(values, self.ghost),
+        )
+        return SupertropicalElement(value, is_ghost=is_ghost)
 
+    @instrumented
     def adjoint(self):
         """
         Calculates the supertropical adjoint matrix.
@@ -179,23 +448,57 @@ class SupertropicalMatrix:
         The (i, j)-th entry of the adjoint is the (j, i)-th cofactor.
         The (j, i)-th cofactor is the permanent of the minor M_ji. [5, 11]
 
+        All n² minors are derived from one optimal assignment in O(n³).
+        When per(A) itself has several optimal assignments, minors whose
+        ghost status cannot be read from the tight graph are checked one
+        by one, so the worst case is O(n⁴). Ties are decided with the same
+        tolerance as in permanent(): exact for integer-valued matrices,
+        within 8·n·eps·max|a_ij| otherwise.
+
         Returns:
             SupertropicalMatrix: The adjoint matrix of self.
         """
         if self.shape[0] != self.shape[1]:
             raise ValueError("Adjoint is only defined for square matrices.")
 
-        n = self.shape[0]
-        adj_matrix_data = np.empty(self.shape, dtype=object)
-        
-        for i in range(n):
-            for j in range(n):
-                # Adjoint(i, j) = Cofactor(j, i) = permanent(Minor(j, i))
-                minor = self.get_minor(j, i) 
-                adj_matrix_data[i, j] = minor.permanent()
-                
-        return SupertropicalMatrix(adj_matrix_data)
+        # Adjoint(i, j) = permanent(Minor(j, i)); all n² minors are derived
+        # from one optimal assignment instead of n² separate permanents
+        float_values = to_float64(self.values)
+        values, ghost = cached(
+            "adjoint", float_values, self.ghost,
+            lambda: assignment_adjoint(float_values, self.ghost),
+        )
+        return SupertropicalMatrix._from_arrays(cast_values(values, self.values.dtype), ghost)
+
+    def lazy(self):
+        """
+        Starts a lazy expression: ``*`` and ``+`` on the result build an
+        expression graph that is evaluated by ``compute()`` or element
+        access, with the multiplication order of product chains optimized
+        and scalar factors folded into one pass.
+
+        Returns:
+            LazySupertropicalMatrix: A leaf expression wrapping this matrix.
+        """
+        from .lazy import LazySupertropicalMatrix
+        return LazySupertropicalMatrix(self)
+
+    @instrumented
+    def factorize(self):
+        """
+        Computes per(A) and adj(A) once for repeated solves.
 
+        Returns:
+            SupertropicalFactorization: Object exposing ``permanent``,
+            ``adjoint``, ``solve(b)`` and ``pseudo_inverse()``.
+
+        Raises:
+            ValueError: If the matrix is not square.
+        """
+        from .factorization import SupertropicalFactorization
+        return SupertropicalFactorization(self)
+
+    @instrumented
     def solve(self, b: 'SupertropicalMatrix'):
         """
         Solves the supertropical linear system A * x = b using
@@ -205,50 +508,81 @@ class SupertropicalMatrix:
         x = adj(A) * b * (per(A))^{-1}
         
         This provides the unique maximal tangible solution to the
-        system $Ax \mid_{gs}= b$. 
+        system $Ax \mid_{gs}= b$. per(A) and adj(A) are computed once
+        and shared by all right-hand sides of a system.
+
+        Stacked systems are solved when A has shape (batch, n, n); b is
+        then (batch, n) or (batch, n, k).
 
         Args:
-            b (SupertropicalMatrix): The (n, 1) vector on the 
-                                     right-hand side.
+            b (SupertropicalMatrix): The (n,), (n, 1) or (n, k)
+                                     right-hand side(s).
 
         Returns:
-            SupertropicalMatrix: The (n, 1) solution vector x.
+            SupertropicalMatrix: The (n, 1) solution vector x, the (n, k)
+                                 solutions for k right-hand sides, or
+                                 the stacked (batch, n, k) solutions.
             
         Raises:
             ValueError: If the matrix is singular (permanent is ghost)
-                        or dimensions are incorrect.
+                        or dimensions are incorrect. For stacked
+                        systems the message names the failing system.
         """
+        if len(self.shape) == 3:
+            return self._solve_stacked(b)
         if self.shape[0] != self.shape[1]:
             raise ValueError("System must be square (n x n) to solve.")
-        # b must be a column vector with same number of rows as A, allow (n,1) or (n,)
-        if b.shape != (self.shape[0], 1) and b.shape != (self.shape[0],):
+        # b must have the same number of rows as A, allow (n,), (n,1) or (n,k)
+        if len(b.shape) not in (1, 2) or b.shape[0] != self.shape[0]:
             raise ValueError(f"Dimension mismatch. A is {self.shape} but b is {b.shape}.")
 
-        # 1. Calculate the permanent (supertropical determinant)
-        per_A = self.permanent()
-        
-        # A matrix is nonsingular if its permanent is tangible [7, 19]
-        if per_A.is_ghost:
-            raise ValueError("Matrix is singular (permanent is ghost). Cannot solve.")
+        # per(A) and adj(A) are computed once for all columns of b
+        return self.factorize().solve(b)
 
-        # 2. Calculate the inverse of the permanent
-        # (1/a) in supertropical algebra is -a (classical)
-        per_A_inv = SupertropicalElement(-per_A.value, is_ghost=per_A.is_ghost)
+    def solve_system(self, b: 'SupertropicalMatrix', fallback=True):
+        """
+        Solves A * x ⊨ b for a rectangular (m, n) matrix by residuation.
 
-        # 3. Calculate the tangible adjoint matrix 
-        adj_A = self.adjoint()
-        
-        # 4. Calculate solution x = adj(A) * b * per(A)^-1
-        # Reshape b if needed to ensure column vector
-        if len(b.shape) == 1:
-            b_reshaped = SupertropicalMatrix(b.data.reshape(-1, 1))
-        else:
-            b_reshaped = b
-            
-        x = (adj_A * b_reshaped) * per_A_inv
-        
-        return x
+        The greatest x with A * x ≤ b (in values) is found in O(mn) per
+        right-hand side on the value arrays, and each equation is then
+        classified as holding exactly, only up to ghost (A * x ghost-
+        surpasses b_i), or not at all. For a square nonsingular A whose
+        greatest subsolution is not exact, the Cramer solution of
+        solve() is used instead (disable with ``fallback=False``).
+
+        Args:
+            b (SupertropicalMatrix): The (m,), (m, 1) or (m, k)
+                                     right-hand side(s).
+            fallback (bool): Allow the O(n³) Cramer fallback.
+
+        Returns:
+            SupertropicalSystemSolution: Exposes ``x``, ``method``,
+            ``exact``, ``ghost_only``, ``satisfied`` and ``is_solution``.
+
+        Raises:
+            ValueError: If dimensions are incorrect.
+        """
+        from .residuation import solve_system
+        return solve_system(self, b, fallback=fallback)
+
+    def _solve_stacked(self, b):
+        """Solves a (batch, n, n) stack of systems one system at a time."""
+        batch = self.shape[0]
+        if len(b.shape) not in (2, 3) or b.shape[0] != batch:
+            raise ValueError(f"Dimension mismatch. A is {self.shape} but b is {b.shape}.")
+
+        solutions = []
+        for idx in range(batch):
+            try:
+                solutions.append(self[idx].solve(b[idx]))
+            except ValueError as exc:
+                raise ValueError(f"System {idx}: {exc}") from exc
+
+        values = np.stack([x.values for x in solutions])
+        ghost = np.stack([x.ghost for x in solutions])
+        return SupertropicalMatrix._from_arrays(values, ghost)
     
+    @instrumented
     def transpose(self):
         """
         Returns the transpose of the matrix A^T.
@@ -258,19 +592,15 @@ class SupertropicalMatrix:
         Returns:
             SupertropicalMatrix: The transposed matrix
         """
-        transposed_data = np.empty((self.shape[1], self.shape[0]), dtype=object)
-        
-        for i in range(self.shape[0]):
-            for j in range(self.shape[1]):
-                transposed_data[j, i] = self.data[i, j]
-        
-        return SupertropicalMatrix(transposed_data)
+        return SupertropicalMatrix._from_arrays(self.values.T, self.ghost.T)
     
+    @instrumented
     def __pow__(self, k):
         """
         Matrix power: A^k = A * A * ... * A (k times).
         
-        Uses supertropical matrix multiplication.
+        Uses supertropical matrix multiplication with exponentiation by
+        squaring, so only O(log k) products are formed.
         
         Args:
             k (int): Non-negative integer exponent
@@ -286,15 +616,192 @@ class SupertropicalMatrix:
         
         if k == 0:
             # A^0 = I (identity matrix)
-            return SupertropicalMatrix.identity(self.shape[0])
+            return SupertropicalMatrix.identity(self.shape[0]).astype(self.dtype)
         
-        result = self
-        for _ in range(k - 1):
-            result = result * self
+        result = None
+        base = self
+        while k:
+            if k & 1:
+                result = base if result is None else result * base
+            k >>= 1
+            if k:
+                base = base * base
         
         return result
+
+    @instrumented
+    def closure(self):
+        """
+        Kleene star A* = I ⊕ A ⊕ A^2 ⊕ A^3 ⊕ ...
+
+        [A*]_ij is the weight of the heaviest walk from i to j (longest
+        path). It is computed in O(n³) with a Floyd–Warshall style
+        elimination. An entry is ghost when the heaviest walk is not
+        unique (for instance when it can go around a zero-weight cycle)
+        or uses a ghost entry.
+
+        Returns:
+            SupertropicalMatrix: The closure A*
+
+        Raises:
+            ValueError: If the matrix is not square or has a cycle of
+                        positive weight (the series diverges).
+        """
+        if len(self.shape) != 2 or self.shape[0] != self.shape[1]:
+            raise ValueError("Matrix must be square for closure")
+
+        values, ghost = kernel("kleene_star", kleene_star, self.values.dtype)(self.values, self.ghost)
+        return SupertropicalMatrix._from_arrays(values, ghost)
     
+    @instrumented
+    def characteristic_polynomial(self):
+        """
+        Supertropical characteristic polynomial f_A(x) = per(A ⊕ x·I).
+
+        The coefficient of x^k is the supertropical sum of the permanents
+        of all (n-k)×(n-k) principal submatrices. The essential
+        coefficients (those on the upper hull, which determine f_A and
+        its corners) and their ghost status are found from O(n)
+        parametric assignment problems, O(n⁴) overall; coefficients that
+        never attain the maximum are ε. The largest corner is the
+        eigenvalue λ.
+
+        Returns:
+            SupertropicalPolynomial: f_A, of degree n.
+
+        Raises:
+            ValueError: If the matrix is not square.
+        """
+        from .polynomial import SupertropicalPolynomial
+        if len(self.shape) != 2 or self.shape[0] != self.shape[1]:
+            raise ValueError("Characteristic polynomial requires a square (n x n) matrix.")
+        return SupertropicalPolynomial._from_arrays(
+            *characteristic_coefficients(to_float64(self.values), self.ghost)
+        )
+
+    @instrumented
+    def eigenvalue(self, method="karp"):
+        """
+        Supertropical eigenvalue λ of the matrix: the maximum cycle mean
+        of its weighted graph, so that A * v = λ * v for some v.
+
+        λ is ghost when it is attained by more than one elementary cycle
+        or by a cycle through a ghost entry. A matrix without cycles has
+        eigenvalue ε.
+
+        Args:
+            method (str): "karp" (Karp's O(n·m) algorithm) or "howard"
+                          (Howard's policy iteration).
+
+        Returns:
+            SupertropicalElement: The eigenvalue λ.
+
+        Raises:
+            ValueError: If the matrix is not square or the method is unknown.
+        """
+        if len(self.shape) != 2 or self.shape[0] != self.shape[1]:
+            raise ValueError("Eigenvalue is only defined for square matrices.")
+
+        values = to_float64(self.values)
+        value = cycle_mean(values, method)
+        if value == -np.inf:
+            return GHOST_EPSILON
+        *_, is_ghost = critical_analysis(values, self.ghost, value)
+        return SupertropicalElement(value, is_ghost=is_ghost)
+
+    @instrumented
+    def eigenvectors(self, method="karp"):
+        """
+        Fundamental eigenvectors for the eigenvalue λ.
+
+        Returns one column of (λ^{-1} * A)* per strongly connected
+        component of the critical graph (the cycles attaining λ); every
+        eigenvector is a max-plus combination of these columns when A is
+        irreducible.
+
+        Args:
+            method (str): "karp" or "howard", as for eigenvalue().
+
+        Returns:
+            SupertropicalMatrix: (n, p) matrix whose columns v satisfy
+            A * v = λ * v.
+
+        Raises:
+            ValueError: If the matrix is not square, the method is
+                        unknown, or the matrix has no cycle.
+        """
+        if len(self.shape) != 2 or self.shape[0] != self.shape[1]:
+            raise ValueError("Eigenvectors are only defined for square matrices.")
+
+        values = to_float64(self.values)
+        value = cycle_mean(values, method)
+        if value == -np.inf:
+            raise ValueError("Matrix has no cycle, so no finite eigenvalue.")
+        star_values, _, _, classes, _ = critical_analysis(values, self.ghost, value)
+        vectors = star_values[:, classes]
+        return SupertropicalMatrix._from_arrays(vectors, vectors == -np.inf)
+
+    @instrumented
+    def iterate(self, x0: 'SupertropicalMatrix', steps: int, chunk_size=1024, out=None,
+                detect_period=False, atol=0.0, max_period=None):
+        """
+        Streams the trajectory x(k+1) = A * x(k), k = 0 .. steps - 1.
+
+        Args:
+            x0 (SupertropicalMatrix): (n,) or (n, 1) initial state.
+            steps (int): Number of steps.
+            chunk_size (int): Number of states per yielded chunk.
+            out (SupertropicalMatrix or tuple, optional): (steps + 1, n)
+                storage for the states, e.g. a pair of np.memmap arrays.
+            detect_period (bool): Stop once x(k + c) = (c·λ) * x(k).
+            atol (float): Tolerance for the periodicity test.
+            max_period (int, optional): Longest period to detect; bounds the
+                                        memory of period detection, which
+                                        is O(steps) by default.
+
+        Returns:
+            SupertropicalTrajectory: Iterable over (rows, n) chunks of
+            states, exposing ``transient``, ``period`` and ``cycle_time``
+            once periodicity is detected.
+
+        Raises:
+            ValueError: If the matrix is not square or shapes do not match.
+        """
+        from .trajectory import SupertropicalTrajectory
+        return SupertropicalTrajectory(self, x0, steps, chunk_size=chunk_size, out=out,
+                                       detect_period=detect_period, atol=atol,
+                                       max_period=max_period)
+
+    @instrumented
+    def save(self, path):
+        """
+        Writes the matrix to a binary file (see ``supertropical.storage``).
+
+        Args:
+            path (str or os.PathLike): Destination file.
+        """
+        from .storage import save
+        save(self, path)
+
     @staticmethod
+    @instrumented
+    def load(path, mmap=False):
+        """
+        Reads a matrix written by save().
+
+        Args:
+            path (str or os.PathLike): Source file.
+            mmap (bool): Return a MappedSupertropicalMatrix that reads rows
+                         from disk on demand instead of loading the file.
+
+        Returns:
+            SupertropicalMatrix or MappedSupertropicalMatrix: The matrix.
+        """
+        from .storage import load
+        return load(path, mmap=mmap)
+
+    @staticmethod
+    @instrumented
     def identity(n):
         """
         Creates an n×n identity matrix I.
@@ -311,19 +818,14 @@ class SupertropicalMatrix:
         Returns:
             SupertropicalMatrix: n×n identity matrix
         """
-        import math
-        identity_data = np.empty((n, n), dtype=object)
-        
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    identity_data[i, j] = SupertropicalElement(0, is_ghost=False)
-                else:
-                    identity_data[i, j] = SupertropicalElement(-math.inf, is_ghost=True)
-        
-        return SupertropicalMatrix(identity_data)
+        values = np.full((n, n), -np.inf)
+        np.fill_diagonal(values, 0.0)
+        # Off-diagonal ε entries are ghost, the diagonal 0 is tangible
+        ghost = ~np.eye(n, dtype=bool)
+        return SupertropicalMatrix._from_arrays(values, ghost)
     
     @staticmethod
+    @instrumented
     def pseudo_zero(n):
         """
         Creates an n×n pseudo-zero matrix Z_G.
@@ -342,16 +844,12 @@ class SupertropicalMatrix:
         Returns:
             SupertropicalMatrix: n×n pseudo-zero matrix
         """
-        import math
-        pseudo_zero_data = np.empty((n, n), dtype=object)
-        
-        for i in range(n):
-            for j in range(n):
-                # All entries are ε (ghost -infinity)
-                pseudo_zero_data[i, j] = SupertropicalElement(-math.inf, is_ghost=True)
-        
-        return SupertropicalMatrix(pseudo_zero_data)
+        # All entries are ε (ghost -infinity)
+        values = np.full((n, n), -np.inf)
+        ghost = np.ones((n, n), dtype=bool)
+        return SupertropicalMatrix._from_arrays(values, ghost)
     
+    @instrumented
     def pseudo_inverse(self):
         """
         Calculates the pseudo-inverse A^♯ of the matrix.
@@ -371,20 +869,4 @@ class SupertropicalMatrix:
         if self.shape[0] != self.shape[1]:
             raise ValueError("Matrix must be square for pseudo-inverse")
         
-        # Calculate permanent
-        perm = self.permanent()
-        
-        # Check if permanent is epsilon (not invertible)
-        if perm.value == -np.inf:
-            raise ValueError("Matrix permanent is epsilon, pseudo-inverse undefined")
-        
-        # Calculate adjoint
-        adj_A = self.adjoint()
-        
-        # Calculate (1/|A|) or (1/|A|)^ν
-        # In supertropical: 1/a = -a (classical negation)
-        inv_perm_value = -perm.value
-        inv_perm = SupertropicalElement(inv_perm_value, is_ghost=perm.is_ghost)
-        
-        # Pseudo-inverse = inv_perm ⊗ adj(A)
-        return adj_A * inv_perm
\ No newline at end of file
+        return self.factorize().pseudo_inverse()
\ No newline at end of file
@@ -0,0 +1,341 @@
+# src/supertropical/polynomial.py
+"""
+Supertropical polynomials in one variable.
+
+f(x) = ⊕_k c_k ⊙ x^k = max_k (c_k + k·x): a convex piecewise-linear
+function. Only coefficients on the upper convex hull of the points
+(k, c_k) can attain the maximum, so evaluation, corner roots and
+products all work on that hull:
+
+- evaluation looks up each point among the h hull pieces by binary
+  search, O(log h) per point, fully vectorized;
+- the corners (tangible roots) are the breakpoints between pieces, with
+  multiplicity the difference in degree;
+- a product's hull is the Minkowski sum of the factors' hulls, merged
+  by slope in O(h_f + h_g).
+
+A value f(x) is ghost when two terms attain the maximum (x is a corner),
+when the attaining coefficient is ghost, when x is ghost and the
+attaining term has positive degree, or when f(x) = ε.
+"""
+import numpy as np
+from ._kernels import to_float64
+from .element import SupertropicalElement
+from .matrix import SupertropicalMatrix
+from .profiling import instrumented
+
+
+def _upper_hull(degrees, values):
+    """
+    Indices of the strict upper hull vertices of points sorted by degree
+    (monotone chain, O(d)); collinear points are dropped.
+    """
+    hull = []
+    for p in range(len(degrees)):
+        while len(hull) >= 2:
+            o, a = hull[-2], hull[-1]
+            cross = ((degrees[a] - degrees[o]) * (values[p] - values[o])
+                     - (values[a] - values[o]) * (degrees[p] - degrees[o]))
+            if cross < 0:
+                break
+            hull.pop()
+        hull.append(p)
+    return np.asarray(hull, dtype=np.int64)
+
+
+def _points(points):
+    """(values, ghost, is_scalar) arrays for evaluation points."""
+    if isinstance(points, SupertropicalElement):
+        return np.array(points.value, dtype=float), np.array(points.is_ghost), True
+    if isinstance(points, SupertropicalMatrix):
+        return to_float64(points.values), points.ghost, False
+    values = np.asarray(points, dtype=float)
+    return values, np.zeros(values.shape, dtype=bool), values.ndim == 0
+
+
+class SupertropicalPolynomial:
+    """
+    Supertropical polynomial with coefficients stored as two arrays:
+    ``values`` (float64, -inf for ε) and ``ghost`` (bool), indexed by
+    degree. Trailing ε coefficients are dropped.
+    """
+
+    def __init__(self, coefficients):
+        """
+        Initializes from coefficients in increasing degree.
+
+        Args:
+            coefficients: Sequence of numbers (tangible) or
+                          SupertropicalElement objects, a 1-D numeric
+                          array, or a 1-D SupertropicalMatrix.
+
+        Raises:
+            ValueError: If the coefficients are not one-dimensional.
+        """
+        if not isinstance(coefficients, SupertropicalMatrix):
+            if not isinstance(coefficients, np.ndarray):
+                coefficients = list(coefficients)
+            coefficients = SupertropicalMatrix(coefficients)
+        if coefficients.values.ndim != 1 or coefficients.values.size == 0:
+            raise ValueError(f"Coefficients must be a non-empty 1-D sequence, got shape {coefficients.shape}.")
+        # Copied, so that the polynomial does not share the matrix's arrays
+        self._set(to_float64(coefficients.values).copy(), coefficients.ghost.astype(bool))
+
+    @staticmethod
+    def _from_arrays(values, ghost):
+        """Creates a polynomial from coefficient arrays without copying."""
+        poly = SupertropicalPolynomial.__new__(SupertropicalPolynomial)
+        poly._set(values, ghost)
+        return poly
+
+    def _set(self, values, ghost):
+        finite = np.flatnonzero(np.isfinite(values))
+        size = finite[-1] + 1 if finite.size else 1
+        self.values = values[:size]
+        self.ghost = ghost[:size] | ~np.isfinite(self.values)
+        self._hull = None
+
+    def __repr__(self):
+        return f"SupertropicalPolynomial({self})"
+
+    def __str__(self):
+        terms = []
+        for k in np.flatnonzero(np.isfinite(self.values)):
+            coefficient = str(SupertropicalElement(float(self.values[k]), bool(self.ghost[k])))
+            terms.append(coefficient if k == 0 else
+                         f"{coefficient}⊙x" if k == 1 else f"{coefficient}⊙x^{k}")
+        return " ⊕ ".join(terms) if terms else "-inf"
+
+    @property
+    def degree(self) -> int:
+        """Highest degree with a non-ε coefficient (-1 for ε)."""
+        finite = np.flatnonzero(np.isfinite(self.values))
+        return int(finite[-1]) if finite.size else -1
+
+    def __getitem__(self, k):
+        """Coefficient of x^k as a SupertropicalElement."""
+        if 0 <= k < self.values.shape[0]:
+            return SupertropicalElement(float(self.values[k]), is_ghost=bool(self.ghost[k]))
+        return SupertropicalElement(-np.inf, is_ghost=True)
+
+    def hull(self):
+        """
+        Essential terms: the upper convex hull of the points (k, c_k).
+
+        Returns:
+            np.ndarray: Degrees of the hull vertices, increasing.
+        """
+        if self._hull is None:
+            degrees = np.flatnonzero(np.isfinite(self.values))
+            self._hull = degrees[_upper_hull(degrees, self.values[degrees])]
+        return self._hull
+
+    def essential(self):
+        """
+        The polynomial reduced to its hull terms; it takes the same value
+        everywhere, and the same ghost status at every tangible point.
+
+        Returns:
+            SupertropicalPolynomial: Polynomial with ε off the hull.
+        """
+        degrees = self.hull()
+        values = np.full(self.values.shape, -np.inf)
+        ghost = np.ones(self.values.shape, dtype=bool)
+        values[degrees] = self.values[degrees]
+        ghost[degrees] = self.ghost[degrees]
+        return SupertropicalPolynomial._from_arrays(values, ghost)
+
+    def roots(self):
+        """
+        Corner roots: points where two hull terms attain the maximum.
+
+        Returns:
+            tuple: (locations, multiplicities) arrays in increasing order;
+            the multiplicities sum to the degree span of the hull.
+        """
+        degrees = self.hull()
+        values = self.values[degrees]
+        steps = np.diff(degrees)
+        return -np.diff(values) / steps, steps
+
+    # --- Evaluation ---
+
+    @instrumented
+    def evaluate(self, points):
+        """
+        Evaluates f at one or many points.
+
+        Args:
+            points: A number or SupertropicalElement, a NumPy array or
+                    nested list of numbers (tangible), or a
+                    SupertropicalMatrix of points.
+
+        Returns:
+            SupertropicalElement for a single point, otherwise a
+            SupertropicalMatrix with the shape of ``points``.
+        """
+        x, x_ghost, scalar = _points(points)
+        degrees = self.hull()
+        out_values = np.full(x.shape, -np.inf)
+        out_ghost = np.ones(x.shape, dtype=bool)
+        if degrees.size:
+            out_values, out_ghost = self._evaluate_hull(degrees, x, x_ghost)
+        if scalar:
+            return SupertropicalElement(float(out_values), is_ghost=bool(out_ghost))
+        return SupertropicalMatrix._from_arrays(out_values, out_ghost)
+
+    __call__ = evaluate
+
+    def _evaluate_hull(self, degrees, x, x_ghost):
+        coefficients = self.values[degrees]
+        corners = -np.diff(coefficients) / np.diff(degrees)
+        piece = np.searchsorted(corners, x)
+        h = degrees.size
+
+        best = np.full(x.shape, -np.inf)
+        count = np.zeros(x.shape, dtype=np.int64)
+        best_piece = np.zeros(x.shape, dtype=np.int64)
+        # The maximizer is the located piece or, at or next to a corner,
+        # a neighbour; comparing all three keeps ties exact
+        with np.errstate(invalid="ignore"):
+            for offset in (-1, 0, 1):
+                candidate = piece + offset
+                valid = (candidate >= 0) & (candidate < h)
+                candidate = np.clip(candidate, 0, h - 1)
+                k = degrees[candidate]
+                term = np.where(k == 0, coefficients[candidate], coefficients[candidate] + k * x)
+                term = np.where(valid, term, -np.inf)
+                higher = term > best
+                equal = valid & (term == best)
+                count = np.where(higher, 1, count + equal)
+                best_piece = np.where(higher, candidate, best_piece)
+                best = np.where(higher, term, best)
+
+        winner = degrees[best_piece]
+        ghost = ((count >= 2) | self.ghost[winner] | (x_ghost & (winner > 0))
+                 | (best == -np.inf))
+        return best, ghost
+
+    # --- Arithmetic ---
+
+    @staticmethod
+    def _coerce(other):
+        if isinstance(other, SupertropicalPolynomial):
+            return other
+        if isinstance(other, SupertropicalElement):
+            return SupertropicalPolynomial._from_arrays(
+                np.array([other.value]), np.array([other.is_ghost])
+            )
+        if isinstance(other, (int, float)):
+            return SupertropicalPolynomial._from_arrays(np.array([float(other)]), np.array([False]))
+        return None
+
+    @instrumented
+    def __add__(self, other):
+        """Coefficientwise f ⊕ g; numbers and elements are constants."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        from ._kernels import supertropical_add
+        size = max(self.values.shape[0], other.values.shape[0])
+        a_values, a_ghost = self._padded(size)
+        b_values, b_ghost = other._padded(size)
+        return SupertropicalPolynomial._from_arrays(
+            *supertropical_add(a_values, a_ghost, b_values, b_ghost)
+        )
+
+    __radd__ = __add__
+
+    def _padded(self, size):
+        values = np.full(size, -np.inf)
+        ghost = np.ones(size, dtype=bool)
+        values[:self.values.shape[0]] = self.values
+        ghost[:self.values.shape[0]] = self.ghost
+        return values, ghost
+
+    @instrumented
+    def __mul__(self, other):
+        """
+        Product f ⊙ g as the Minkowski sum of the two hulls.
+
+        Returns the essential part of the product: its hull vertices are
+        exact, including their ghost status (each vertex is the sum of a
+        unique pair of hull vertices), and other coefficients are ε.
+        Multiplying by a number or element shifts every coefficient.
+        """
+        if isinstance(other, (int, float, SupertropicalElement)):
+            other = self._coerce(other)
+            return SupertropicalPolynomial._from_arrays(
+                self.values + other.values[0], self.ghost | other.ghost[0]
+            )
+        if not isinstance(other, SupertropicalPolynomial):
+            return NotImplemented
+
+        f, g = self.hull(), other.hull()
+        size = self.values.shape[0] + other.values.shape[0] - 1
+        values = np.full(size, -np.inf)
+        ghost = np.ones(size, dtype=bool)
+        if f.size == 0 or g.size == 0:
+            return SupertropicalPolynomial._from_arrays(values, ghost)
+
+        slopes_f = np.diff(self.values[f]) / np.diff(f)
+        slopes_g = np.diff(other.values[g]) / np.diff(g)
+        i = j = 0
+        while True:
+            k = f[i] + g[j]
+            values[k] = self.values[f[i]] + other.values[g[j]]
+            ghost[k] = self.ghost[f[i]] or other.ghost[g[j]]
+            if i == f.size - 1 and j == g.size - 1:
+                break
+            # Upper hull edges come in decreasing slope; take the steeper
+            if j == g.size - 1 or (i < f.size - 1 and slopes_f[i] > slopes_g[j]):
+                i += 1
+            elif i == f.size - 1 or slopes_g[j] > slopes_f[i]:
+                j += 1
+            else:
+                i += 1
+                j += 1
+        return SupertropicalPolynomial._from_arrays(values, ghost)
+
+    __rmul__ = __mul__
+
+
+@instrumented
+def evaluate_characteristic(matrix, points):
+    """
+    Evaluates the characteristic polynomial f_A(x) = per(A ⊕ x·I) of a
+    square matrix at one or many tangible or ghost points.
+
+    A few points are evaluated as permanents, O(n³) each; for more than
+    2(n + 1) points f_A is built once with
+    SupertropicalMatrix.characteristic_polynomial() and evaluated
+    vectorized.
+
+    Args:
+        matrix (SupertropicalMatrix): The (n, n) matrix A.
+        points: As for SupertropicalPolynomial.evaluate.
+
+    Returns:
+        SupertropicalElement for a single point, otherwise a
+        SupertropicalMatrix with the shape of ``points``.
+
+    Raises:
+        ValueError: If the matrix is not square.
+    """
+    from ._assignment import shifted_permanent
+    if len(matrix.shape) != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Characteristic polynomial requires a square (n x n) matrix.")
+
+    x, x_ghost, scalar = _points(points)
+    if x.size > 2 * (matrix.shape[0] + 1):
+        return matrix.characteristic_polynomial().evaluate(points)
+    values = to_float64(matrix.values)
+    out_values = np.empty(x.shape)
+    out_ghost = np.empty(x.shape, dtype=bool)
+    for idx in np.ndindex(x.shape):
+        out_values[idx], out_ghost[idx] = shifted_permanent(
+            values, matrix.ghost, x[idx], x_ghost[idx]
+        )
+    if scalar:
+        return SupertropicalElement(float(out_values), is_ghost=bool(out_ghost))
+    return SupertropicalMatrix._from_arrays(out_values, out_ghost)
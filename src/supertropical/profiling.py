@@ -0,0 +1,229 @@
+# src/supertropical/profiling.py
+"""
+Opt-in profiling of the public matrix methods.
+
+Public SupertropicalMatrix and SupertropicalFactorization methods are
+wrapped with ``instrumented``. While no profiler is active the wrapper
+only checks one module-level list before calling the method. Inside a
+``profile()`` block every call is recorded with its wall time, the
+shapes of its matrix arguments and the number of SupertropicalElement
+objects created during the call:
+
+    >>> with supertropical.profile() as prof:
+    ...     x = A.solve(b)
+    >>> prof.as_dict()["methods"]["SupertropicalMatrix.adjoint"]["calls"]
+    1
+    >>> prof.to_chrome_trace("solve.json")  # open in chrome://tracing
+
+Element allocations are counted by temporarily wrapping
+SupertropicalElement.__init__, only while a profiler is active.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from .element import SupertropicalElement
+
+# Profilers currently recording; the disabled fast path only tests this
+_active = []
+_local = threading.local()
+_lock = threading.Lock()
+_original_init = SupertropicalElement.__init__
+
+
+class _Frame:
+    """An instrumented call in progress."""
+
+    __slots__ = ("name", "start", "shapes", "allocations", "child_time")
+
+    def __init__(self, name, start, shapes):
+        self.name = name
+        self.start = start
+        self.shapes = shapes
+        self.allocations = 0
+        self.child_time = 0
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _counting_init(self, *args, **kwargs):
+    _original_init(self, *args, **kwargs)
+    stack = _stack()
+    if stack:
+        stack[-1].allocations += 1
+
+
+def _shapes(args):
+    """Shapes of the array-like arguments (matrices), in order."""
+    return [tuple(arg.shape) for arg in args
+            if isinstance(getattr(arg, "shape", None), tuple)]
+
+
+def _record(name, func, args, kwargs):
+    stack = _stack()
+    frame = _Frame(name, time.perf_counter_ns(), _shapes(args))
+    stack.append(frame)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        end = time.perf_counter_ns()
+        stack.pop()
+        duration = end - frame.start
+        if stack:
+            # Allocations are inclusive: a parent counts its children's
+            stack[-1].allocations += frame.allocations
+            stack[-1].child_time += duration
+        event = {
+            "name": name,
+            "start_ns": frame.start,
+            "duration_ns": duration,
+            "self_ns": duration - frame.child_time,
+            "shapes": frame.shapes,
+            "allocations": frame.allocations,
+            "depth": len(stack),
+            "thread": threading.get_ident(),
+        }
+        for profiler in list(_active):
+            profiler._events.append(event)
+
+
+def instrumented(func):
+    """
+    Decorator recording calls to ``func`` while a profiler is active.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _active:
+            return func(*args, **kwargs)
+        return _record(name, func, args, kwargs)
+    return wrapper
+
+
+class Profiler:
+    """
+    Collects instrumented calls between start() and stop(), or inside a
+    ``with`` block. Several profilers may be active at once; each gets
+    every call recorded while it is active.
+    """
+
+    def __init__(self):
+        self._events = []
+        self._origin = None
+
+    def __repr__(self):
+        return f"Profiler(events={len(self._events)}, active={self in _active})"
+
+    def start(self):
+        """Starts recording."""
+        with _lock:
+            if self in _active:
+                return self
+            if not _active:
+                SupertropicalElement.__init__ = _counting_init
+            if self._origin is None:
+                self._origin = time.perf_counter_ns()
+            _active.append(self)
+        return self
+
+    def stop(self):
+        """Stops recording; collected events are kept."""
+        with _lock:
+            if self in _active:
+                _active.remove(self)
+            if not _active:
+                SupertropicalElement.__init__ = _original_init
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def reset(self):
+        """Discards all collected events."""
+        self._events = []
+        self._origin = time.perf_counter_ns() if self in _active else None
+
+    @property
+    def events(self):
+        """Recorded calls in completion order (list of dicts)."""
+        return list(self._events)
+
+    def as_dict(self):
+        """
+        Aggregates the recorded calls per method.
+
+        Returns:
+            dict: {"methods": {name: {"calls", "total_s", "self_s",
+            "allocations", "shapes"}}, "events": [...]} where total_s
+            includes nested instrumented calls and self_s does not,
+            and shapes counts the argument shapes seen.
+        """
+        methods = {}
+        for event in self._events:
+            entry = methods.setdefault(event["name"], {
+                "calls": 0, "total_s": 0.0, "self_s": 0.0, "allocations": 0, "shapes": {},
+            })
+            entry["calls"] += 1
+            entry["total_s"] += event["duration_ns"] * 1e-9
+            entry["self_s"] += event["self_ns"] * 1e-9
+            entry["allocations"] += event["allocations"]
+            key = " ".join(str(shape) for shape in event["shapes"])
+            entry["shapes"][key] = entry["shapes"].get(key, 0) + 1
+        return {"methods": methods, "events": self.events}
+
+    def to_chrome_trace(self, path=None):
+        """
+        Exports the calls in the Chrome trace event format (complete
+        "X" events, microseconds), viewable in chrome://tracing or
+        Perfetto.
+
+        Args:
+            path (str or os.PathLike, optional): File to write the JSON to.
+
+        Returns:
+            dict: The trace document.
+        """
+        origin = self._origin or 0
+        trace = {
+            "traceEvents": [
+                {
+                    "name": event["name"],
+                    "cat": "supertropical",
+                    "ph": "X",
+                    "ts": (event["start_ns"] - origin) / 1e3,
+                    "dur": event["duration_ns"] / 1e3,
+                    "pid": os.getpid(),
+                    "tid": event["thread"],
+                    "args": {
+                        "shapes": [list(shape) for shape in event["shapes"]],
+                        "allocations": event["allocations"],
+                    },
+                }
+                for event in self._events
+            ],
+            "displayTimeUnit": "ms",
+        }
+        if path is not None:
+            with open(path, "w") as fh:
+                json.dump(trace, fh)
+        return trace
+
+
+def profile():
+    """
+    Returns a new Profiler to use as a context manager.
+
+    Returns:
+        Profiler: Records instrumented calls inside the ``with`` block.
+    """
+    return Profiler()
@@ -0,0 +1,186 @@
+# src/supertropical/residuation.py
+"""
+Residuation solver for m×n supertropical systems A ⊙ x ⊨ b.
+
+The greatest subsolution of A ⊙ x ≤ b (in values) is
+
+    x̂_j = min_i (b_i - a_ij)   over the non-ε a_ij,
+
+computed on the value arrays in row blocks, O(mn) per right-hand side
+with no (m, n) temporaries beyond one block. A ⊙ x̂ is then formed with
+the blocked product kernel and compared with b equation by equation:
+an equation holds exactly when (A ⊙ x̂)_i = b_i, and only up to ghost
+when (A ⊙ x̂)_i ghost-surpasses b_i, i.e. (A ⊙ x̂)_i = b_i ⊕ z for a
+ghost z (a ghost with the same or a larger value). For non-integer data
+values and ties between terms are compared up to
+``_kernels.tie_tolerance``, the slack that permanent() and adjoint()
+use for ties.
+
+For a square nonsingular A whose greatest subsolution is not exact,
+the Cramer solution adj(A) ⊙ b ⊙ per(A)⁻¹ is returned instead.
+"""
+import numpy as np
+from ._kernels import DEFAULT_BLOCK_ELEMENTS, cast_values, result_dtype, tie_tolerance, to_float64
+from .backend import matmul as parallel_matmul
+from .matrix import SupertropicalMatrix
+from .profiling import instrumented
+
+
+def greatest_subsolution(a_values, b_values, block_elements=DEFAULT_BLOCK_ELEMENTS):
+    """
+    Greatest x with A ⊙ x ≤ b in values (max-plus residuation).
+
+    Args:
+        a_values (np.ndarray): (m, n) values of A; -inf marks ε.
+        b_values (np.ndarray): (m, k) values of the right-hand sides.
+        block_elements (int): Maximum number of entries of A per block.
+
+    Returns:
+        np.ndarray: (n, k) values; +inf where column j of A is all ε.
+    """
+    m, n = a_values.shape
+    k = b_values.shape[1]
+    x = np.full((n, k), np.inf)
+    rows = max(1, block_elements // max(n, 1))
+    for r0 in range(0, m, rows):
+        block = a_values[r0:r0 + rows]
+        finite = np.isfinite(block)
+        for c in range(k):
+            with np.errstate(invalid="ignore"):
+                residual = np.where(finite, b_values[r0:r0 + rows, c, None] - block, np.inf)
+            np.minimum(x[:, c], residual.min(axis=0), out=x[:, c])
+    return x
+
+
+def near_ties(a_values, x_values, y_values, atol, block_elements=DEFAULT_BLOCK_ELEMENTS):
+    """
+    Sums of A ⊙ x whose maximum y is attained by two terms up to ``atol``.
+
+    The product kernel decides ties exactly; this recounts them with the
+    tolerance used for permanents, in row blocks like
+    greatest_subsolution().
+
+    Returns:
+        np.ndarray: (m, k) bool mask.
+    """
+    m, n = a_values.shape
+    k = x_values.shape[1]
+    ties = np.zeros((m, k), dtype=bool)
+    rows = max(1, block_elements // max(n, 1))
+    for r0 in range(0, m, rows):
+        block = a_values[r0:r0 + rows]
+        for c in range(k):
+            near = block + x_values[None, :, c] >= y_values[r0:r0 + rows, c, None] - atol
+            ties[r0:r0 + rows, c] = near.sum(axis=1) >= 2
+    return ties
+
+
+def _check(matrix, a_values, x, b_values, b_ghost, atol):
+    """(holds, exact) masks of the equations of A ⊙ x ⊨ b."""
+    values, ghost = parallel_matmul(matrix.values, matrix.ghost, x.values, x.ghost)
+    values = to_float64(values)
+    if atol:
+        ghost = ghost | near_ties(a_values, to_float64(x.values), values, atol)
+    return ghost_surpasses(values, ghost, b_values, b_ghost, atol)
+
+
+def ghost_surpasses(values, ghost, b_values, b_ghost, atol=0.0):
+    """
+    Elementwise y ⊨ b on arrays: y = b, or y is ghost with y ≥ b.
+
+    This is the full definition y = b ⊕ z for a ghost z, which a ghost
+    with a larger value also satisfies. SupertropicalElement.ghost_surpasses
+    is narrower: it only accepts a ghost y with the same value as b.
+
+    Returns:
+        tuple: (holds, exact) bool arrays; exact marks y = b.
+    """
+    with np.errstate(invalid="ignore"):
+        same = (values == b_values) | (np.abs(values - b_values) <= atol)
+        exact = same & (ghost == b_ghost)
+        holds = exact | (ghost & (same | (values > b_values)))
+    return holds, exact
+
+
+class SupertropicalSystemSolution:
+    """
+    Result of SupertropicalMatrix.solve_system().
+
+    Attributes:
+        x (SupertropicalMatrix): The (n, 1) or (n, k) solution.
+        method (str): "residuation" or "cramer".
+        exact (np.ndarray): (m, k) mask of equations with A ⊙ x = b.
+        ghost_only (np.ndarray): (m, k) mask of equations that hold only
+                                 up to ghost (A ⊙ x ⊨ b, not equal).
+    """
+
+    def __init__(self, x, method, exact, ghost_only):
+        self.x = x
+        self.method = method
+        self.exact = exact
+        self.ghost_only = ghost_only
+
+    def __repr__(self):
+        return (f"SupertropicalSystemSolution(method={self.method!r}, shape={self.x.shape}, "
+                f"exact={int(self.exact.sum())}, ghost_only={int(self.ghost_only.sum())}, "
+                f"unsatisfied={int((~self.satisfied).sum())})")
+
+    @property
+    def satisfied(self):
+        """(m, k) mask of equations with A ⊙ x ⊨ b."""
+        return self.exact | self.ghost_only
+
+    @property
+    def is_solution(self) -> bool:
+        """True if every equation holds, at least up to ghost."""
+        return bool(self.satisfied.all())
+
+
+@instrumented
+def solve_system(matrix, b, fallback=True):
+    """
+    Solves A ⊙ x ⊨ b for an (m, n) matrix by residuation.
+
+    Args:
+        matrix (SupertropicalMatrix): The (m, n) matrix A.
+        b (SupertropicalMatrix): The (m,), (m, 1) or (m, k) right-hand
+                                 side(s).
+        fallback (bool): For square A, use the Cramer solution when the
+                         greatest subsolution is not exact and A is
+                         nonsingular. This costs O(n³).
+
+    Returns:
+        SupertropicalSystemSolution: The solution and, per equation,
+        whether it holds exactly or only up to ghost. Variables whose
+        column of A is all ε do not occur in the system and are ε.
+
+    Raises:
+        ValueError: If dimensions are incorrect.
+    """
+    if len(matrix.shape) != 2:
+        raise ValueError(f"A must be two-dimensional, got shape {matrix.shape}.")
+    m, n = matrix.shape
+    if len(b.shape) not in (1, 2) or b.shape[0] != m:
+        raise ValueError(f"Dimension mismatch. A is {matrix.shape} but b is {b.shape}.")
+    if len(b.shape) == 1:
+        b = SupertropicalMatrix._from_arrays(b.values.reshape(-1, 1), b.ghost.reshape(-1, 1))
+
+    # Residuals are formed in float64; x takes the dtype of A and b
+    a_values, b_values = to_float64(matrix.values), to_float64(b.values)
+    x_values = greatest_subsolution(a_values, b_values)
+    free = x_values == np.inf
+    x_values[free] = -np.inf
+    dtype = result_dtype(matrix.values, b.values)
+    x = SupertropicalMatrix._from_arrays(cast_values(x_values, dtype), free)
+    method = "residuation"
+
+    atol = tie_tolerance(a_values, b_values, terms=n)
+    holds, exact = _check(matrix, a_values, x, b_values, b.ghost, atol)
+
+    # Cramer's rule needs a tangible per(A); check it before factorizing
+    if fallback and m == n and not exact.all() and not matrix.permanent().is_ghost:
+        x = matrix.factorize().solve(b)
+        method = "cramer"
+        holds, exact = _check(matrix, a_values, x, b_values, b.ghost, atol)
+
+    return SupertropicalSystemSolution(x, method, exact, holds & ~exact)
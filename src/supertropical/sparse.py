@@ -0,0 +1,256 @@
+# src/supertropical/sparse.py
+import numpy as np
+from .element import GHOST_EPSILON, SupertropicalElement
+from .matrix import SupertropicalMatrix
+from ._kernels import DEFAULT_BLOCK_ELEMENTS, to_float64
+
+
+def _segment_sums(terms, term_ghost, starts):
+    """
+    Supertropical sums ⊕ over consecutive segments of ``terms``.
+
+    Segments begin at ``starts`` (non-empty, increasing) and run along
+    axis 0. Returns (values, ghost): a segment is ghost when its maximum
+    is attained twice or by a ghost term.
+    """
+    values = np.maximum.reduceat(terms, starts, axis=0)
+    lengths = np.diff(np.append(starts, terms.shape[0]))
+    at_max = terms == np.repeat(values, lengths, axis=0)
+    count = np.add.reduceat(at_max, starts, axis=0)
+    ghost_hit = np.logical_or.reduceat(at_max & term_ghost, starts, axis=0)
+    return values, (count >= 2) | ghost_hit | (values == -np.inf)
+
+
+class SparseSupertropicalMatrix:
+    """
+    A supertropical matrix in compressed sparse row (CSR) form.
+
+    Only entries different from ε = -inf are stored; every missing entry
+    is ε (a ghost). Stored entries are kept as three arrays like SciPy's
+    CSR layout: ``values`` (float64) and ``ghost`` (bool) per stored
+    entry, their column ``indices``, and the row pointer ``indptr``.
+    """
+
+    def __init__(self, values, ghost, indices, indptr, shape):
+        """
+        Initializes from CSR arrays.
+
+        Args:
+            values (array_like): Values of the stored entries, row by row.
+            ghost (array_like): Ghost flags of the stored entries.
+            indices (array_like): Column index of each stored entry.
+            indptr (array_like): Row i is entries indptr[i]:indptr[i+1].
+            shape (tuple): (rows, cols) of the matrix.
+        """
+        self.values = np.asarray(values, dtype=np.float64)
+        self.ghost = np.asarray(ghost, dtype=bool)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+        if self.indptr.shape != (self.shape[0] + 1,):
+            raise ValueError("indptr must have one entry per row plus one.")
+        if not (self.values.shape == self.ghost.shape == self.indices.shape
+                == (self.indptr[-1],)):
+            raise ValueError("values, ghost and indices must match indptr[-1].")
+
+    @classmethod
+    def from_dense(cls, matrix: SupertropicalMatrix):
+        """
+        Converts a 2D SupertropicalMatrix, dropping its ε entries.
+
+        Returns:
+            SparseSupertropicalMatrix: The same matrix in CSR form.
+        """
+        if len(matrix.shape) != 2:
+            raise ValueError("Only 2D matrices can be converted to sparse form.")
+        values = to_float64(matrix.values)
+        stored = values > -np.inf
+        rows, cols = np.nonzero(stored)
+        indptr = np.zeros(matrix.shape[0] + 1, dtype=np.int64)
+        np.cumsum(stored.sum(axis=1), out=indptr[1:])
+        return cls(values[rows, cols], matrix.ghost[rows, cols], cols, indptr, matrix.shape)
+
+    def to_dense(self):
+        """
+        Converts to a dense SupertropicalMatrix (missing entries become ε).
+
+        Returns:
+            SupertropicalMatrix: The dense matrix.
+        """
+        values = np.full(self.shape, -np.inf)
+        ghost = np.ones(self.shape, dtype=bool)
+        rows = self._row_of_entries()
+        values[rows, self.indices] = self.values
+        ghost[rows, self.indices] = self.ghost
+        return SupertropicalMatrix._from_arrays(values, ghost)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (non-ε) entries."""
+        return int(self.indptr[-1])
+
+    def _row_of_entries(self):
+        """Row index of every stored entry."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def __repr__(self):
+        return f"SparseSupertropicalMatrix(shape={self.shape}, nnz={self.nnz})"
+
+    def __getitem__(self, key):
+        """Returns the SupertropicalElement at (i, j)."""
+        i, j = key
+        i = range(self.shape[0])[i]
+        j = range(self.shape[1])[j]
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        hit = np.flatnonzero(self.indices[start:stop] == j)
+        if hit.size == 0:
+            return GHOST_EPSILON
+        idx = start + hit[0]
+        return SupertropicalElement(float(self.values[idx]), is_ghost=bool(self.ghost[idx]))
+
+    def transpose(self):
+        """
+        Returns the transpose A^T, also in CSR form.
+
+        Returns:
+            SparseSupertropicalMatrix: The transposed matrix
+        """
+        rows = self._row_of_entries()
+        order = np.lexsort((rows, self.indices))
+        indptr = np.zeros(self.shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=self.shape[1]), out=indptr[1:])
+        return SparseSupertropicalMatrix(
+            self.values[order], self.ghost[order], rows[order], indptr,
+            (self.shape[1], self.shape[0]),
+        )
+
+    def __mul__(self, other):
+        """
+        Max-plus product or scalar multiplication.
+
+        - SparseSupertropicalMatrix: sparse result, C_ij = ⊕_k (A_ik ⊙ B_kj)
+        - SupertropicalMatrix: dense result of the same product
+        - scalar (SupertropicalElement, int, float): scales stored entries
+        """
+        if isinstance(other, SparseSupertropicalMatrix):
+            if self.shape[1] != other.shape[0]:
+                raise ValueError(f"Matrix dimensions do not match: {self.shape} * {other.shape}.")
+            return self._mul_sparse(other)
+        if isinstance(other, SupertropicalMatrix):
+            if len(other.shape) != 2 or self.shape[1] != other.shape[0]:
+                raise ValueError(f"Matrix dimensions do not match: {self.shape} * {other.shape}.")
+            values, ghost = self._mul_dense(other.values, other.ghost)
+            return SupertropicalMatrix._from_arrays(values, ghost)
+        if isinstance(other, (int, float)):
+            other = SupertropicalElement(other)
+        if isinstance(other, SupertropicalElement):
+            if other.value == -np.inf:
+                return SparseSupertropicalMatrix(
+                    [], [], [], np.zeros(self.shape[0] + 1, dtype=np.int64), self.shape
+                )
+            return SparseSupertropicalMatrix(
+                self.values + other.value, self.ghost | other.is_ghost,
+                self.indices.copy(), self.indptr.copy(), self.shape,
+            )
+        raise TypeError(
+            "Can only multiply by SparseSupertropicalMatrix, SupertropicalMatrix, "
+            "SupertropicalElement or scalar."
+        )
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float, SupertropicalElement)):
+            return self.__mul__(other)
+        raise TypeError("Left multiplication only supported for scalars.")
+
+    def matvec(self, x: SupertropicalMatrix):
+        """
+        Matrix-vector product A ⊙ x.
+
+        Args:
+            x (SupertropicalMatrix): (n,) or (n, 1) vector.
+
+        Returns:
+            SupertropicalMatrix: The product, with the same shape as x.
+        """
+        if x.shape not in ((self.shape[1],), (self.shape[1], 1)):
+            raise ValueError(f"Dimension mismatch. A is {self.shape} but x is {x.shape}.")
+        values, ghost = self._mul_dense(x.values.reshape(-1, 1), x.ghost.reshape(-1, 1))
+        shape = (self.shape[0],) + x.shape[1:]
+        return SupertropicalMatrix._from_arrays(values.reshape(shape), ghost.reshape(shape))
+
+    def _mul_dense(self, b_values, b_ghost, block_elements=DEFAULT_BLOCK_ELEMENTS):
+        """Sparse × dense product on raw arrays, in blocks of rows."""
+        # Stored values are float64; the integer ε sentinel becomes -inf
+        b_values = to_float64(b_values)
+        m, n = self.shape[0], b_values.shape[1]
+        values = np.full((m, n), -np.inf)
+        ghost = np.ones((m, n), dtype=bool)
+
+        rows = np.flatnonzero(np.diff(self.indptr))
+        per_block = max(1, block_elements // max(n, 1))
+        r0 = 0
+        while r0 < rows.size:
+            # Take rows until the block holds about per_block entries
+            first = self.indptr[rows[r0]]
+            r1 = int(np.searchsorted(self.indptr[rows + 1], first + per_block, side="right"))
+            r1 = max(r1, r0 + 1)
+            block_rows = rows[r0:r1]
+            start, stop = first, self.indptr[block_rows[-1] + 1]
+            cols = self.indices[start:stop]
+
+            terms = self.values[start:stop, None] + b_values[cols]
+            term_ghost = self.ghost[start:stop, None] | b_ghost[cols]
+            starts = self.indptr[block_rows] - start
+            values[block_rows], ghost[block_rows] = _segment_sums(terms, term_ghost, starts)
+            r0 = r1
+        return values, ghost
+
+    def _mul_sparse(self, other, block_elements=DEFAULT_BLOCK_ELEMENTS):
+        """Sparse × sparse product by expanding and merging all terms."""
+        m, n = self.shape[0], other.shape[1]
+        row_nnz = np.diff(other.indptr)
+        # Number of terms produced by each stored entry of self
+        fanout = row_nnz[self.indices]
+        entry_rows = self._row_of_entries()
+
+        out_rows, out_cols, out_values, out_ghost = [], [], [], []
+        terms_per_row = np.bincount(entry_rows, weights=fanout, minlength=m)
+        bounds = np.concatenate(([0], np.cumsum(terms_per_row)))
+        r0 = 0
+        while r0 < m:
+            r1 = int(np.searchsorted(bounds, bounds[r0] + block_elements, side="right")) - 1
+            r1 = min(max(r1, r0 + 1), m)
+            start, stop = self.indptr[r0], self.indptr[r1]
+            counts = fanout[start:stop]
+            total = int(counts.sum())
+            if total:
+                # Expand every (i, k) entry into its terms (i, j) with k -> j
+                src = np.repeat(np.arange(start, stop), counts)
+                offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                dst = other.indptr[self.indices[src]] + offsets
+                keys = entry_rows[src] * n + other.indices[dst]
+                order = np.argsort(keys, kind="stable")
+                keys = keys[order]
+                terms = (self.values[src] + other.values[dst])[order]
+                term_ghost = (self.ghost[src] | other.ghost[dst])[order]
+
+                starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+                values, ghost = _segment_sums(terms, term_ghost, starts)
+                out_rows.append(keys[starts] // n)
+                out_cols.append(keys[starts] % n)
+                out_values.append(values)
+                out_ghost.append(ghost)
+            r0 = r1
+
+        if out_rows:
+            rows = np.concatenate(out_rows)
+            cols = np.concatenate(out_cols)
+            values = np.concatenate(out_values)
+            ghost = np.concatenate(out_ghost)
+        else:
+            rows = cols = np.zeros(0, dtype=np.int64)
+            values, ghost = np.zeros(0), np.zeros(0, dtype=bool)
+        indptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=m), out=indptr[1:])
+        return SparseSupertropicalMatrix(values, ghost, cols, indptr, (m, n))
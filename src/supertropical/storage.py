@@ -0,0 +1,361 @@
+# src/supertropical/storage.py
+"""
+Binary on-disk format for SupertropicalMatrix.
+
+Layout (all integers little-endian):
+
+- header, 64 bytes: magic ``b"SUPTROP\\0"``, format version (uint16),
+  ndim (uint16), values dtype (uint16: 0 float64, 1 float32, 2 int64,
+  3 int32), 2 reserved bytes, then up to 6 dimensions (uint64 each,
+  unused ones zero)
+- value block: the values in C order in their own dtype (integer ε as
+  the dtype's minimum), starting at byte 64
+- ghost bitmap: the ghost flags packed 8 per byte (least significant
+  bit first), each row padded to whole bytes, so row i occupies bytes
+  [i * row_bytes, (i + 1) * row_bytes) of the bitmap
+
+The value block and bitmap can be mapped with ``np.memmap``, so opening
+a file costs the same for any size; rows are read only when used.
+"""
+import numpy as np
+from .element import SupertropicalElement
+from .matrix import SupertropicalMatrix
+from ._kernels import (
+    DEFAULT_BLOCK_ELEMENTS, VALUE_DTYPES, cast_values, epsilon, result_dtype, to_float64,
+    value_dtype,
+)
+from .backend import matmul as parallel_matmul
+
+MAGIC = b"SUPTROP\0"
+VERSION = 1
+HEADER_SIZE = 64
+MAX_NDIM = 6
+
+_HEADER = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u2"),
+    ("ndim", "<u2"),
+    ("dtype", "<u2"),
+    ("reserved", "<u2"),
+    ("shape", "<u8", (MAX_NDIM,)),
+])
+
+
+def _layout(shape, dtype):
+    """(rows, cols, row_bytes, bitmap_offset) of a matrix stored in a file."""
+    cols = shape[-1]
+    rows = int(np.prod(shape[:-1], dtype=np.int64))
+    row_bytes = (cols + 7) // 8
+    return rows, cols, row_bytes, HEADER_SIZE + dtype.itemsize * rows * cols
+
+
+def _file_dtype(dtype):
+    """Little-endian dtype of the value block."""
+    return np.dtype(dtype).newbyteorder("<")
+
+
+def _write_header(fh, shape, dtype):
+    header = np.zeros((), dtype=_HEADER)
+    header["magic"] = MAGIC
+    header["version"] = VERSION
+    header["ndim"] = len(shape)
+    header["dtype"] = VALUE_DTYPES.index(np.dtype(dtype))
+    header["shape"][:len(shape)] = shape
+    fh.write(header.tobytes())
+
+
+def _read_header(path):
+    """Returns the shape and values dtype stored in the header of ``path``."""
+    with open(path, "rb") as fh:
+        raw = fh.read(HEADER_SIZE)
+    if len(raw) != HEADER_SIZE:
+        raise ValueError(f"{path} is not a supertropical matrix file (header too short).")
+    # Compared on the raw bytes: "S8" drops the trailing NUL of MAGIC
+    if raw[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a supertropical matrix file (bad magic).")
+    header = np.frombuffer(raw, dtype=_HEADER)[0]
+    if header["version"] != VERSION:
+        raise ValueError(f"Unsupported format version {int(header['version'])}.")
+    if header["dtype"] >= len(VALUE_DTYPES):
+        raise ValueError(f"Unsupported values dtype code {int(header['dtype'])}.")
+    ndim = int(header["ndim"])
+    shape = tuple(int(d) for d in header["shape"][:ndim])
+    return shape, VALUE_DTYPES[header["dtype"]]
+
+
+def _pack_ghost(ghost):
+    """Packs a (rows, cols) bool array into (rows, row_bytes) bytes."""
+    return np.packbits(ghost, axis=1, bitorder="little")
+
+
+def _unpack_ghost(packed, cols):
+    """Inverse of _pack_ghost."""
+    return np.unpackbits(packed, axis=1, count=cols, bitorder="little").astype(bool)
+
+
+def save(matrix: SupertropicalMatrix, path, block_elements=DEFAULT_BLOCK_ELEMENTS):
+    """
+    Writes a matrix to ``path`` in the binary format, in row blocks.
+
+    Args:
+        matrix (SupertropicalMatrix): Matrix with 1 to 6 dimensions.
+        path (str or os.PathLike): Destination file.
+        block_elements (int): Maximum number of entries written at once.
+
+    Raises:
+        ValueError: If the matrix has no or more than 6 dimensions.
+    """
+    shape = matrix.shape
+    if not 1 <= len(shape) <= MAX_NDIM:
+        raise ValueError(f"Only matrices with 1 to {MAX_NDIM} dimensions can be saved.")
+    dtype = matrix.values.dtype
+    rows, cols, _, _ = _layout(shape, dtype)
+    values = matrix.values.reshape(rows, cols)
+    ghost = matrix.ghost.reshape(rows, cols)
+    step = max(1, block_elements // max(cols, 1))
+
+    with open(path, "wb") as fh:
+        _write_header(fh, shape, dtype)
+        for r0 in range(0, rows, step):
+            block = values[r0:r0 + step]
+            fh.write(np.ascontiguousarray(block, dtype=_file_dtype(dtype)).tobytes())
+        for r0 in range(0, rows, step):
+            fh.write(_pack_ghost(ghost[r0:r0 + step]).tobytes())
+
+
+def load(path, mmap=False):
+    """
+    Reads a matrix written by save().
+
+    Args:
+        path (str or os.PathLike): Source file.
+        mmap (bool): Map the file instead of reading it (2D matrices only).
+
+    Returns:
+        SupertropicalMatrix or MappedSupertropicalMatrix: The matrix in
+        memory, or a mapped view of the file when ``mmap`` is True.
+
+    Raises:
+        ValueError: If the file is not in the expected format.
+    """
+    if mmap:
+        return MappedSupertropicalMatrix(path)
+    shape, dtype = _read_header(path)
+    rows, cols, row_bytes, offset = _layout(shape, dtype)
+    with open(path, "rb") as fh:
+        fh.seek(HEADER_SIZE)
+        values = np.fromfile(fh, dtype=_file_dtype(dtype), count=rows * cols)
+        packed = np.fromfile(fh, dtype=np.uint8, count=rows * row_bytes)
+    if values.size != rows * cols or packed.size != rows * row_bytes:
+        raise ValueError(f"{path} is truncated.")
+    ghost = _unpack_ghost(packed.reshape(rows, row_bytes), cols)
+    return SupertropicalMatrix._from_arrays(
+        values.astype(dtype, copy=False).reshape(shape), ghost.reshape(shape)
+    )
+
+
+class MappedSupertropicalMatrix:
+    """
+    A 2D supertropical matrix kept on disk and mapped with np.memmap.
+
+    Opening is independent of the file size. Rows are read on demand:
+    products and matrix-vector products run over blocks of rows, so
+    only one block (plus the other operand) is in memory at a time.
+    """
+
+    def __init__(self, path, mode="r"):
+        """
+        Maps an existing file.
+
+        Args:
+            path (str or os.PathLike): File written by save() or create().
+            mode (str): "r" for read-only, "r+" to allow writing rows.
+
+        Raises:
+            ValueError: If the file is not a 2D matrix in the expected
+                        format, or the mode is not "r" or "r+".
+        """
+        if mode not in ("r", "r+"):
+            raise ValueError("mode must be 'r' or 'r+'.")
+        shape, dtype = _read_header(path)
+        if len(shape) != 2:
+            raise ValueError("Only 2D matrices can be mapped.")
+        rows, cols, row_bytes, offset = _layout(shape, dtype)
+
+        self.path = path
+        self.shape = shape
+        self.mode = mode
+        if rows * cols:
+            self.values = np.memmap(path, dtype=_file_dtype(dtype), mode=mode,
+                                    offset=HEADER_SIZE, shape=shape)
+        else:
+            self.values = np.zeros(shape, dtype=dtype)
+        if rows * row_bytes:
+            self.packed_ghost = np.memmap(path, dtype=np.uint8, mode=mode,
+                                          offset=offset, shape=(rows, row_bytes))
+        else:
+            self.packed_ghost = np.zeros((rows, row_bytes), dtype=np.uint8)
+
+    @classmethod
+    def create(cls, path, shape, dtype=np.float64):
+        """
+        Creates a file for a (rows, cols) matrix filled with ε and maps it
+        for writing.
+
+        Args:
+            path (str or os.PathLike): Destination file.
+            shape (tuple): (rows, cols).
+            dtype: Values dtype: float64, float32, int64 or int32.
+
+        Returns:
+            MappedSupertropicalMatrix: Writable mapping of the new file.
+
+        Raises:
+            ValueError: If the dtype is unsupported.
+        """
+        dtype = value_dtype(dtype)
+        rows, cols, row_bytes, offset = _layout(shape, dtype)
+        with open(path, "wb") as fh:
+            _write_header(fh, shape, dtype)
+            fh.truncate(offset + rows * row_bytes)
+        mapped = cls(path, mode="r+")
+        mapped.values[:] = epsilon(dtype)
+        mapped.packed_ghost[:] = 0xFF
+        return mapped
+
+    def __repr__(self):
+        return f"MappedSupertropicalMatrix(path={str(self.path)!r}, shape={self.shape})"
+
+    @property
+    def dtype(self):
+        """dtype of the stored values (float64, float32, int64 or int32)."""
+        return self.values.dtype.newbyteorder("=")
+
+    def __getitem__(self, key):
+        """Returns the SupertropicalElement at (i, j)."""
+        i, j = key
+        i = range(self.shape[0])[i]
+        j = range(self.shape[1])[j]
+        is_ghost = bool(self.packed_ghost[i, j // 8] >> (j % 8) & 1)
+        value = to_float64(self.values[i, j:j + 1])[0]
+        return SupertropicalElement(float(value), is_ghost=is_ghost)
+
+    def _block_rows(self, block_elements):
+        return max(1, block_elements // max(self.shape[1], 1))
+
+    def rows(self, start, stop):
+        """
+        Reads rows start:stop into memory.
+
+        Returns:
+            SupertropicalMatrix: The (stop - start, cols) block.
+        """
+        values = np.array(self.values[start:stop], dtype=self.dtype)
+        ghost = _unpack_ghost(np.asarray(self.packed_ghost[start:stop]), self.shape[1])
+        return SupertropicalMatrix._from_arrays(values, ghost)
+
+    def write_rows(self, start, block: SupertropicalMatrix):
+        """Writes a (rows, cols) block starting at row ``start``."""
+        if self.mode != "r+":
+            raise ValueError("Matrix is mapped read-only.")
+        if len(block.shape) != 2 or block.shape[1] != self.shape[1]:
+            raise ValueError(f"Block of shape {block.shape} does not fit {self.shape}.")
+        stop = start + block.shape[0]
+        self.values[start:stop] = cast_values(block.values, self.dtype)
+        self.packed_ghost[start:stop] = _pack_ghost(block.ghost)
+
+    def iter_row_blocks(self, block_elements=DEFAULT_BLOCK_ELEMENTS):
+        """
+        Yields (start, block) pairs covering all rows in order.
+
+        Args:
+            block_elements (int): Maximum number of entries per block.
+
+        Yields:
+            tuple: Start row and the SupertropicalMatrix block.
+        """
+        step = self._block_rows(block_elements)
+        for r0 in range(0, self.shape[0], step):
+            yield r0, self.rows(r0, min(r0 + step, self.shape[0]))
+
+    def to_dense(self):
+        """
+        Reads the whole matrix into memory.
+
+        Returns:
+            SupertropicalMatrix: The matrix.
+        """
+        return self.rows(0, self.shape[0])
+
+    def flush(self):
+        """Writes pending changes to disk."""
+        for array in (self.values, self.packed_ghost):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def matmul(self, other: SupertropicalMatrix, out=None,
+               block_elements=DEFAULT_BLOCK_ELEMENTS):
+        """
+        Max-plus product A ⊙ B, one block of rows of A at a time.
+
+        Args:
+            other (SupertropicalMatrix): The (cols, n) matrix B.
+            out (MappedSupertropicalMatrix, optional): Writable (rows, n)
+                mapping receiving the result, so that it never has to fit
+                in memory.
+            block_elements (int): Maximum number of entries per block.
+
+        Returns:
+            SupertropicalMatrix or MappedSupertropicalMatrix: The product
+            (``out`` when given).
+
+        Raises:
+            ValueError: If the dimensions do not match.
+        """
+        if len(other.shape) != 2 or self.shape[1] != other.shape[0]:
+            raise ValueError(f"Matrix dimensions do not match: {self.shape} * {other.shape}.")
+        shape = (self.shape[0], other.shape[1])
+        if out is not None and out.shape != shape:
+            raise ValueError(f"out must have shape {shape}.")
+
+        if out is None:
+            values = np.empty(shape, dtype=result_dtype(self.values, other.values))
+            ghost = np.empty(shape, dtype=bool)
+        for r0, block in self.iter_row_blocks(block_elements):
+            blk_values, blk_ghost = parallel_matmul(
+                block.values, block.ghost, other.values, other.ghost, block_elements
+            )
+            r1 = r0 + block.shape[0]
+            if out is None:
+                values[r0:r1] = blk_values
+                ghost[r0:r1] = blk_ghost
+            else:
+                out.write_rows(r0, SupertropicalMatrix._from_arrays(blk_values, blk_ghost))
+        if out is not None:
+            out.flush()
+            return out
+        return SupertropicalMatrix._from_arrays(values, ghost)
+
+    def __mul__(self, other):
+        """Max-plus product with a dense SupertropicalMatrix."""
+        if not isinstance(other, SupertropicalMatrix):
+            raise TypeError("Can only multiply by SupertropicalMatrix.")
+        return self.matmul(other)
+
+    def matvec(self, x: SupertropicalMatrix, block_elements=DEFAULT_BLOCK_ELEMENTS):
+        """
+        Matrix-vector product A ⊙ x, one block of rows at a time.
+
+        Args:
+            x (SupertropicalMatrix): (cols,) or (cols, 1) vector.
+
+        Returns:
+            SupertropicalMatrix: The product, with the same shape as x.
+        """
+        if x.shape not in ((self.shape[1],), (self.shape[1], 1)):
+            raise ValueError(f"Dimension mismatch. A is {self.shape} but x is {x.shape}.")
+        column = SupertropicalMatrix._from_arrays(x.values.reshape(-1, 1), x.ghost.reshape(-1, 1))
+        result = self.matmul(column, block_elements=block_elements)
+        shape = (self.shape[0],) + x.shape[1:]
+        return SupertropicalMatrix._from_arrays(result.values.reshape(shape),
+                                                result.ghost.reshape(shape))
@@ -0,0 +1,198 @@
+# src/supertropical/trajectory.py
+import hashlib
+from collections import deque
+import numpy as np
+from .element import SupertropicalElement
+from .matrix import SupertropicalMatrix
+from ._kernels import matvec_workspace, maxplus_matvec, to_float64
+from .backend import kernel
+
+
+class SupertropicalTrajectory:
+    """
+    Streaming iteration x(k+1) = A ⊙ x(k) of a square SupertropicalMatrix.
+
+    Created by SupertropicalMatrix.iterate(). Iterating over the object
+    yields the states x(0), x(1), ... in chunks: each chunk is a
+    SupertropicalMatrix whose rows are consecutive states. Every step
+    runs on preallocated buffers, so no per-step matrices or element
+    objects are created.
+
+    States can be written to ``out`` instead of fresh chunk arrays: a
+    SupertropicalMatrix or a (values, ghost) pair of arrays with one row
+    per state, for example two ``np.memmap`` arrays to stream a long
+    trajectory to disk. Chunks are then views into ``out``.
+
+    With ``detect_period=True`` the iteration stops as soon as the
+    trajectory becomes periodic, i.e. x(k + c) = (c·λ) ⊙ x(k) (same
+    ghost pattern). The transient k, period c and cycle time λ are then
+    available as attributes. Detection keeps one 16-byte digest per
+    step, so memory grows as O(steps); ``max_period`` bounds it to the
+    last max_period digests, which finds every period up to that length
+    at the same step and with the same transient.
+    """
+
+    def __init__(self, matrix: SupertropicalMatrix, x0: SupertropicalMatrix, steps: int,
+                 chunk_size=1024, out=None, detect_period=False, atol=0.0,
+                 max_period=None):
+        """
+        Prepares the iteration; nothing is computed until it is consumed.
+
+        Args:
+            matrix (SupertropicalMatrix): The (n, n) matrix A.
+            x0 (SupertropicalMatrix): (n,) or (n, 1) initial state.
+            steps (int): Number of steps; states x(0) .. x(steps) are produced.
+            chunk_size (int): Number of states per yielded chunk.
+            out (SupertropicalMatrix or tuple, optional): Storage for the
+                states, with shape (steps + 1, n).
+            detect_period (bool): Stop once the trajectory is periodic.
+            atol (float): Tolerance when comparing normalized states for
+                          periodicity; 0 compares them exactly.
+            max_period (int, optional): Remember only the last max_period
+                                        states, so longer periods are not
+                                        detected; all states by default.
+
+        Raises:
+            ValueError: If the matrix is not square, x0 or out have the
+                        wrong shape, or steps/chunk_size/max_period are
+                        invalid.
+        """
+        if len(matrix.shape) != 2 or matrix.shape[0] != matrix.shape[1] or matrix.shape[0] == 0:
+            raise ValueError("Only non-empty square (n x n) matrices can be iterated.")
+        n = matrix.shape[0]
+        if x0.shape not in ((n,), (n, 1)):
+            raise ValueError(f"Dimension mismatch. A is {matrix.shape} but x0 is {x0.shape}.")
+        if steps < 0 or chunk_size < 1:
+            raise ValueError("steps must be >= 0 and chunk_size >= 1.")
+        if max_period is not None and max_period < 1:
+            raise ValueError("max_period must be >= 1.")
+
+        if isinstance(out, SupertropicalMatrix):
+            out = (out.values, out.ghost)
+        if out is not None:
+            if out[0].shape != (steps + 1, n) or out[1].shape != (steps + 1, n):
+                raise ValueError(f"out must have shape {(steps + 1, n)}.")
+
+        self.matrix = matrix
+        self.x0 = x0
+        self.steps = steps
+        self.chunk_size = chunk_size
+        self.out = out
+        self.detect_period = detect_period
+        self.atol = atol
+        self.max_period = max_period
+
+        self.steps_done = 0
+        self.transient = None
+        self.period = None
+        self.cycle_time = None
+        self._seen = {}
+        self._order = deque()
+
+    def __repr__(self):
+        return (f"SupertropicalTrajectory(n={self.matrix.shape[0]}, steps={self.steps}, "
+                f"steps_done={self.steps_done}, period={self.period})")
+
+    @property
+    def is_periodic(self) -> bool:
+        """True once periodicity has been detected."""
+        return self.period is not None
+
+    def _state_key(self, values, ghost):
+        """Digest of the state normalized by its maximum."""
+        top = values.max()
+        normalized = values - top if top > -np.inf else values
+        if self.atol > 0:
+            normalized = np.round(normalized / self.atol)
+        # -0.0 and 0.0 must give the same key
+        normalized = normalized + 0.0
+        digest = hashlib.blake2b(normalized.tobytes(), digest_size=16)
+        digest.update(np.packbits(ghost).tobytes())
+        return digest.digest(), top
+
+    def _check_period(self, k, values, ghost):
+        """Records state k; returns True if it repeats an earlier one."""
+        key, top = self._state_key(values, ghost)
+        if key not in self._seen:
+            self._seen[key] = (k, top)
+            if self.max_period is not None:
+                # The first repeat lies exactly one period back, so older
+                # states are never needed for periods up to max_period
+                self._order.append(key)
+                if len(self._order) > self.max_period:
+                    del self._seen[self._order.popleft()]
+            return False
+        first, first_top = self._seen[key]
+        self.transient = first
+        self.period = k - first
+        if top == -np.inf:
+            self.cycle_time = SupertropicalElement(-np.inf, is_ghost=True)
+        else:
+            self.cycle_time = SupertropicalElement((top - first_top) / self.period)
+        self._seen.clear()
+        self._order.clear()
+        return True
+
+    def __iter__(self):
+        """
+        Yields chunks of states.
+
+        Yields:
+            SupertropicalMatrix: (rows, n) block of consecutive states.
+        """
+        n = self.matrix.shape[0]
+        # States are iterated in float64
+        a_values, a_ghost = to_float64(self.matrix.values), self.matrix.ghost
+        self.transient = self.period = self.cycle_time = None
+        self._seen = {}
+        self._order = deque()
+        work = matvec_workspace(n, n)
+        matvec = kernel("maxplus_matvec", maxplus_matvec)
+        state_values = to_float64(self.x0.values).reshape(n)
+        state_ghost = self.x0.ghost.reshape(n)
+
+        k = 0
+        done = False
+        while k <= self.steps and not done:
+            rows = min(self.chunk_size, self.steps + 1 - k)
+            if self.out is None:
+                values = np.empty((rows, n))
+                ghost = np.empty((rows, n), dtype=bool)
+            else:
+                values = self.out[0][k:k + rows]
+                ghost = self.out[1][k:k + rows]
+
+            for r in range(rows):
+                if k == 0:
+                    values[0] = state_values
+                    ghost[0] = state_ghost
+                else:
+                    matvec(a_values, a_ghost, state_values, state_ghost,
+                           values[r], ghost[r], work)
+                state_values, state_ghost = values[r], ghost[r]
+                self.steps_done = k
+                if self.detect_period and self._check_period(k, state_values, state_ghost):
+                    values, ghost = values[:r + 1], ghost[:r + 1]
+                    done = True
+                    break
+                k += 1
+
+            # The caller may modify the yielded chunk, so the state feeding
+            # the next chunk is a private copy
+            state_values, state_ghost = state_values.copy(), state_ghost.copy()
+            yield SupertropicalMatrix._from_arrays(values, ghost)
+
+    def run(self):
+        """
+        Consumes the whole iteration and returns the final state.
+
+        Only the last state is kept when ``out`` is not given.
+
+        Returns:
+            SupertropicalMatrix: The last computed state x(steps_done), as
+            an (n,) vector.
+        """
+        last = None
+        for chunk in self:
+            last = chunk
+        return last[-1]
@@ -0,0 +1,192 @@
+# src/supertropical/ufuncs.py
+"""
+Vectorized elementwise operations on SupertropicalMatrix.
+
+Every function takes SupertropicalMatrix, SupertropicalElement, plain
+numbers or numeric NumPy arrays (read as tangible), broadcasts them like
+NumPy, and works on the value and ghost arrays without Python loops.
+Matrices of different values dtypes are promoted like NumPy arrays;
+numbers keep the dtype of the matrices they meet, except that a
+non-integral number promotes an integer matrix to float64.
+An ``out`` SupertropicalMatrix receives the result in place; it may be
+one of the inputs.
+
+The same operations are reachable through NumPy, since
+SupertropicalMatrix implements ``__array_ufunc__``:
+
+- ``np.add(A, B)`` / ``np.maximum(A, B)`` / ``A + B``: elementwise ⊕
+- ``np.multiply(A, B)``: elementwise ⊙
+- ``np.power(A, k)``: elementwise power
+"""
+import numpy as np
+from ._kernels import cast_values, check_overflow, epsilon, result_dtype, value_product
+from .element import SupertropicalElement
+from .matrix import SupertropicalMatrix
+
+
+def _as_arrays(x):
+    """(values, ghost) arrays of any supported operand."""
+    if isinstance(x, SupertropicalMatrix):
+        return x.values, x.ghost
+    if isinstance(x, SupertropicalElement):
+        return np.float64(x.value), np.bool_(x.is_ghost)
+    if isinstance(x, (int, float, np.number)):
+        return np.float64(x), np.bool_(False)
+    if isinstance(x, np.ndarray) and x.dtype != object:
+        return x.astype(np.float64, copy=False), np.zeros(x.shape, dtype=bool)
+    raise TypeError(f"Unsupported operand type: {type(x).__name__}.")
+
+
+def _promote(*values):
+    """Casts value arrays to their common values dtype."""
+    dtype = result_dtype(*values)
+    return tuple(cast_values(v, dtype) for v in values)
+
+
+def _wrap(values, ghost, out):
+    """Builds the result, writing into ``out`` when given."""
+    if out is not None:
+        if out.values is not values:
+            np.copyto(out.values, values)
+        np.copyto(out.ghost, ghost)
+        return out
+    if np.ndim(values) == 0:
+        return SupertropicalElement(float(cast_values(values, np.float64)), is_ghost=bool(ghost))
+    return SupertropicalMatrix._from_arrays(values, np.asarray(ghost))
+
+
+def _check_out(out):
+    """Validates ``out`` and returns its values buffer (or None)."""
+    if out is None:
+        return None
+    if not isinstance(out, SupertropicalMatrix):
+        raise TypeError("out must be a SupertropicalMatrix.")
+    return out.values
+
+
+def add(a, b, out=None):
+    """
+    Elementwise supertropical addition a ⊕ b.
+
+    The larger value wins with its own ghost status; equal values give
+    a ghost (a ⊕ a = aν).
+
+    Args:
+        a, b: Operands (matrices, elements or numbers), broadcast together.
+        out (SupertropicalMatrix, optional): Buffer for the result.
+
+    Returns:
+        SupertropicalMatrix or SupertropicalElement: The result.
+    """
+    a_values, a_ghost = _as_arrays(a)
+    b_values, b_ghost = _as_arrays(b)
+    a_values, b_values = _promote(a_values, b_values)
+    # Ghost flags first: out may alias a or b
+    ghost = np.where(a_values == b_values, True,
+                     np.where(a_values > b_values, a_ghost, b_ghost))
+    values = np.maximum(a_values, b_values, out=_check_out(out))
+    return _wrap(values, ghost, out)
+
+
+def multiply(a, b, out=None):
+    """
+    Elementwise supertropical multiplication a ⊙ b (classical sum of
+    values, ghost if either operand is ghost).
+
+    Args:
+        a, b: Operands (matrices, elements or numbers), broadcast together.
+        out (SupertropicalMatrix, optional): Buffer for the result.
+
+    Returns:
+        SupertropicalMatrix or SupertropicalElement: The result.
+    """
+    a_values, a_ghost = _as_arrays(a)
+    b_values, b_ghost = _as_arrays(b)
+    a_values, b_values = _promote(a_values, b_values)
+    ghost = np.logical_or(a_ghost, b_ghost)
+    values = value_product(a_values, b_values, out=_check_out(out))
+    return _wrap(values, ghost, out)
+
+
+def power(a, exponent, out=None):
+    """
+    Elementwise power a^k = k * a (classical product of the value).
+
+    a^0 is the tangible unit 0; otherwise the ghost status of a is kept.
+
+    Args:
+        a: Base (matrix, element or number).
+        exponent (int or array of int): Exponent(s), broadcast with a.
+        out (SupertropicalMatrix, optional): Buffer for the result.
+
+    Returns:
+        SupertropicalMatrix or SupertropicalElement: The result.
+    """
+    _check_out(out)
+    a_values, a_ghost = _as_arrays(a)
+    exponent = np.asarray(exponent)
+    if not np.issubdtype(exponent.dtype, np.integer):
+        raise ValueError("Exponent must be an integer")
+    zero = exponent == 0
+    ghost = np.where(zero, False, a_ghost)
+    a_values = np.asarray(a_values)
+    with np.errstate(invalid="ignore", over="ignore"):
+        values = np.multiply(a_values, exponent.astype(a_values.dtype))
+    if a_values.dtype.kind in "iu":
+        # The ε sentinel stays ε (ε^k = ε for k > 0)
+        eps = a_values == epsilon(a_values.dtype)
+        # Dividing back recovers a only if the product did not wrap around
+        divisor = np.where(zero, 1, exponent).astype(a_values.dtype)
+        with np.errstate(over="ignore"):
+            quotient, remainder = np.divmod(values, divisor)
+        check_overflow(
+            ~eps & ~zero & ((quotient != a_values) | (remainder != 0) | (values == epsilon(a_values.dtype))),
+            a_values.dtype,
+        )
+        values = np.where(eps, a_values, values)
+    # -inf * 0 is nan; a^0 is the unit 0
+    values = np.where(zero, a_values.dtype.type(0), values)
+    return _wrap(values, ghost, out)
+
+
+def ghost(a, out=None):
+    """
+    Ghost projection a -> aν (every entry becomes ghost).
+
+    Args:
+        a: Operand (matrix, element or number).
+        out (SupertropicalMatrix, optional): Buffer for the result.
+
+    Returns:
+        SupertropicalMatrix or SupertropicalElement: The result.
+    """
+    _check_out(out)
+    a_values, a_ghost = _as_arrays(a)
+    values = a_values if out is not None else np.array(a_values)
+    return _wrap(values, np.ones(np.shape(a_ghost), dtype=bool), out)
+
+
+def tangible(a, out=None):
+    """
+    Tangible projection aν -> a (every entry becomes tangible).
+
+    Args:
+        a: Operand (matrix, element or number).
+        out (SupertropicalMatrix, optional): Buffer for the result.
+
+    Returns:
+        SupertropicalMatrix or SupertropicalElement: The result.
+    """
+    _check_out(out)
+    a_values, a_ghost = _as_arrays(a)
+    values = a_values if out is not None else np.array(a_values)
+    return _wrap(values, np.zeros(np.shape(a_ghost), dtype=bool), out)
+
+
+# NumPy ufuncs routed through SupertropicalMatrix.__array_ufunc__
+UFUNC_HANDLERS = {
+    np.add: add,
+    np.maximum: add,
+    np.multiply: multiply,
+    np.power: power,
+}
@@ -0,0 +1,32 @@
+"""
+Helpers shared by the test modules.
+"""
+import numpy as np
+from src.supertropical import SupertropicalMatrix
+
+
+def random_matrix(rng, shape, low=-3, high=4, epsilon=0.3, ghost=0.2):
+    """
+    Random integer-valued matrix with some ε and ghost entries.
+
+    Args:
+        rng (np.random.Generator): Source of randomness.
+        shape (tuple): Shape of the matrix.
+        low, high (int): Finite values are drawn from [low, high).
+        epsilon (float): Probability of an ε entry; ε entries are ghost.
+        ghost (float): Probability of a ghost finite entry.
+
+    Returns:
+        SupertropicalMatrix: The matrix, with float64 values.
+    """
+    values = rng.integers(low, high, size=shape).astype(float)
+    values[rng.random(shape) < epsilon] = -np.inf
+    is_ghost = (rng.random(shape) < ghost) | (values == -np.inf)
+    return SupertropicalMatrix._from_arrays(values, is_ghost)
+
+
+def assert_same(X, Y):
+    """Asserts equal shapes, values and ghost masks."""
+    assert X.shape == Y.shape
+    assert np.array_equal(X.values, Y.values)
+    assert np.array_equal(X.ghost, Y.ghost)
@@ -0,0 +1,142 @@
+"""
+Unit tests for the parallel execution backend.
+"""
+import pytest
+import numpy as np
+from src.supertropical import get_backend, set_backend
+from src.supertropical import _assignment, _jit, _kernels, backend
+from .helpers import assert_same, random_matrix
+
+
+@pytest.fixture
+def serial_backend():
+    """Restores the backend settings after each test."""
+    settings = get_backend()
+    yield
+    set_backend(**settings)
+
+
+class TestBackendSettings:
+    """Test set_backend / get_backend."""
+    
+    def test_default_is_serial(self):
+        """Test that the default backend runs on one worker."""
+        expected = {"workers": 1, "kind": "thread", "kernels": backend._resolve_kernels("auto")}
+        assert get_backend() == expected
+        
+    def test_set_backend(self, serial_backend):
+        """Test changing the settings."""
+        set_backend(workers=4, kind="process")
+        assert get_backend()["workers"] == 4
+        assert get_backend()["kind"] == "process"
+        
+    def test_workers_keep_kernels(self, serial_backend):
+        """Test that kernels=None leaves the kernel choice unchanged."""
+        set_backend(kernels="numpy")
+        set_backend(workers=2)
+        assert get_backend()["kernels"] == "numpy"
+        
+    def test_invalid_settings_raise_error(self, serial_backend):
+        """Test that invalid settings raise ValueError."""
+        with pytest.raises(ValueError):
+            set_backend(workers=0)
+        with pytest.raises(ValueError):
+            set_backend(workers=2, kind="gpu")
+            
+    def test_split(self):
+        """Test that blocks cover the range without overlap."""
+        assert backend.split(10, 3) == [(0, 3), (3, 6), (6, 10)]
+        assert backend.split(2, 8) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+class TestParallelResults:
+    """Test that parallel runs match the serial results."""
+    
+    def test_matrix_product(self, kind, serial_backend, monkeypatch):
+        """Test A * B split into row blocks."""
+        rng = np.random.default_rng(0)
+        A, B = random_matrix(rng, (33, 20)), random_matrix(rng, (20, 17))
+        expected = A * B
+        monkeypatch.setattr(backend, "MIN_PARALLEL_TERMS", 0)
+        set_backend(workers=3, kind=kind)
+        assert_same(A * B, expected)
+        
+    def test_adjoint(self, kind, serial_backend):
+        """Test adj(A) split into column blocks, with and without ties."""
+        rng = np.random.default_rng(1)
+        matrices = [
+            random_matrix(rng, (12, 12)),
+            random_matrix(rng, (10, 10), low=0, high=2, epsilon=0, ghost=0),
+        ]
+        expected = [A.adjoint() for A in matrices]
+        set_backend(workers=3, kind=kind)
+        for A, adj in zip(matrices, expected):
+            assert_same(A.adjoint(), adj)
+
+
+class TestCompiledKernels:
+    """Test the fused kernels against the NumPy kernels.
+
+    Without Numba installed the fused kernels run as plain Python, so
+    their results are still checked here.
+    """
+    
+    def test_matmul_and_matvec(self):
+        """Test fused products on random inputs, including empty ones."""
+        rng = np.random.default_rng(2)
+        for _ in range(100):
+            m, k, n = rng.integers(0, 5, size=3)
+            A, B = random_matrix(rng, (m, k)), random_matrix(rng, (k, n))
+            expected = _kernels.maxplus_matmul(A.values, A.ghost, B.values, B.ghost)
+            result = _jit.maxplus_matmul(A.values, A.ghost, B.values, B.ghost)
+            assert all(np.array_equal(x, y) for x, y in zip(result, expected))
+            if m == 0 or k == 0:
+                continue
+            x = random_matrix(rng, (k, 1))
+            outputs = [(np.empty(m), np.empty(m, dtype=bool)) for _ in range(2)]
+            _kernels.maxplus_matvec(A.values, A.ghost, x.values[:, 0], x.ghost[:, 0],
+                                    *outputs[0], _kernels.matvec_workspace(m, k))
+            _jit.maxplus_matvec(A.values, A.ghost, x.values[:, 0], x.ghost[:, 0],
+                                *outputs[1], None)
+            assert np.array_equal(outputs[0][0], outputs[1][0])
+            assert np.array_equal(outputs[0][1], outputs[1][1])
+            
+    def test_closure_and_assignment(self):
+        """Test the fused Kleene star and Hungarian solver."""
+        rng = np.random.default_rng(3)
+        for _ in range(100):
+            n = int(rng.integers(0, 6))
+            A = random_matrix(rng, (n, n), low=-4, high=1, epsilon=0.4)
+            values, ghost = A.values, A.ghost
+            expected = _kernels.kleene_star(values, ghost)
+            result = _jit.kleene_star(values, ghost)
+            assert all(np.array_equal(x, y) for x, y in zip(result, expected))
+            
+            costs, _ = _assignment._costs(values)
+            expected = _assignment._hungarian(costs)
+            result = _jit.hungarian(costs)
+            assert all(np.array_equal(x, y) for x, y in zip(result, expected))
+            
+    def test_positive_cycle_raises_error(self):
+        """Test that the fused closure rejects positive cycles."""
+        with pytest.raises(ValueError):
+            _jit.kleene_star(np.array([[1.0]]), np.array([[False]]))
+            
+    @pytest.mark.skipif(_jit.AVAILABLE, reason="numba is installed")
+    def test_numba_kernels_require_numba(self, serial_backend):
+        """Test that selecting Numba kernels without numba raises ValueError."""
+        with pytest.raises(ValueError):
+            set_backend(kernels="numba")
+            
+    @pytest.mark.skipif(not _jit.AVAILABLE, reason="numba is not installed")
+    def test_numba_backend_matches_numpy(self, serial_backend):
+        """Test public results with the compiled kernels selected."""
+        rng = np.random.default_rng(4)
+        A, B = random_matrix(rng, (9, 9)), random_matrix(rng, (9, 9))
+        set_backend(kernels="numpy")
+        expected = (A * B, A.adjoint(), A.permanent())
+        set_backend(kernels="numba")
+        assert_same(A * B, expected[0])
+        assert_same(A.adjoint(), expected[1])
+        assert A.permanent() == expected[2]
@@ -0,0 +1,128 @@
+"""
+Unit tests for the permanent/adjoint result cache.
+"""
+import pytest
+import numpy as np
+from src.supertropical import (
+    SupertropicalMatrix,
+    disable_cache,
+    enable_cache,
+    get_cache,
+    invalidate_cache,
+)
+from src.supertropical.cache import ResultCache
+
+
+@pytest.fixture
+def cache():
+    """Enables a small cache for one test."""
+    yield enable_cache(max_entries=4)
+    disable_cache()
+
+
+@pytest.fixture
+def system():
+    A = SupertropicalMatrix([[2, 1], [1, 3]])
+    b = SupertropicalMatrix([[5], [4]])
+    return A, b
+
+
+class TestResultCache:
+    """Test caching through the matrix methods."""
+    
+    def test_disabled_by_default(self):
+        """Test that no cache is installed unless enabled."""
+        assert get_cache() is None
+        
+    def test_repeated_permanent_hits(self, cache, system):
+        """Test that an equal matrix reuses the cached permanent."""
+        A, _ = system
+        first = A.permanent()
+        second = SupertropicalMatrix([[2, 1], [1, 3]]).permanent()
+        assert first == second
+        assert (cache.hits, cache.misses) == (1, 1)
+        
+    def test_solve_after_pseudo_inverse(self, cache, system):
+        """Test that solve reuses the permanent and adjoint of pseudo_inverse."""
+        A, b = system
+        A.pseudo_inverse()
+        misses = cache.misses
+        x = A.solve(b)
+        assert cache.misses == misses
+        assert cache.hits == 2
+        assert x.values.ravel().tolist() == [3.0, 1.0]
+        
+    def test_cached_arrays_are_copies(self, cache, system):
+        """Test that modifying a returned adjoint does not change the cache."""
+        A, _ = system
+        adj = A.adjoint()
+        adj.values[:] = 0
+        assert A.adjoint().values.tolist() == [[3.0, 1.0], [1.0, 2.0]]
+        
+    def test_in_place_change_misses(self, cache, system):
+        """Test that changing a matrix in place gives a new key."""
+        A, _ = system
+        A.permanent()
+        A.values[0, 0] = 10
+        assert A.permanent().value == 13
+        assert cache.misses == 2
+        
+    def test_ghost_is_part_of_key(self, cache):
+        """Test that matrices differing only in ghost status do not collide."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        B = SupertropicalMatrix._from_arrays(A.values.copy(), np.eye(2, dtype=bool))
+        assert not A.permanent().is_ghost
+        assert B.permanent().is_ghost
+
+
+class TestCacheLimits:
+    """Test eviction and invalidation."""
+    
+    def test_entry_limit_evicts_least_recent(self, cache):
+        """Test LRU eviction by number of entries."""
+        matrices = [SupertropicalMatrix([[float(k)]]) for k in range(5)]
+        for A in matrices:
+            A.permanent()
+        assert len(cache) == 4
+        assert cache.evictions == 1
+        matrices[0].permanent()
+        assert cache.misses == 6
+        
+    def test_byte_limit(self):
+        """Test eviction by total size and skipping oversized results."""
+        cache = ResultCache(max_entries=None, max_bytes=100)
+        big = (np.zeros(20), np.zeros(20, dtype=bool))
+        cache.get_or_compute("adjoint", np.zeros(1), np.zeros(1, dtype=bool), lambda: big)
+        assert len(cache) == 0
+        small = (np.zeros(5), np.zeros(5, dtype=bool))
+        for k in range(3):
+            cache.get_or_compute("adjoint", np.full(1, k), np.zeros(1, dtype=bool), lambda: small)
+        assert cache.info()["bytes"] <= 100
+        assert cache.evictions == 1
+        
+    def test_invalidate(self, cache, system):
+        """Test dropping one matrix's entries and all entries."""
+        A, _ = system
+        B = SupertropicalMatrix([[0, 1], [1, 0]])
+        A.permanent()
+        A.adjoint()
+        B.permanent()
+        invalidate_cache(A)
+        assert len(cache) == 1
+        invalidate_cache()
+        assert len(cache) == 0
+        assert cache.info()["bytes"] == 0
+        
+    def test_invalidate_integer_matrix(self, cache):
+        """Test invalidating an integer matrix whose ε is the sentinel."""
+        A = SupertropicalMatrix([[2, -np.inf], [1, 3]], dtype=np.int64)
+        A.permanent()
+        A.adjoint()
+        assert len(cache) == 2
+        invalidate_cache(A)
+        assert len(cache) == 0
+        
+    def test_negative_limit_raises_error(self):
+        """Test that negative limits are rejected."""
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=-1)
@@ -3,7 +3,7 @@ Unit tests for SupertropicalElement class.
 """
 import pytest
 import math
-from src.supertropical import SupertropicalElement
+from src.supertropical import EPSILON, GHOST_EPSILON, UNIT, SupertropicalElement
 
 
 class TestSupertropicalElementCreation:
@@ -79,6 +79,15 @@ class TestSupertropicalAddition:
         assert result.value == 5.0
         assert result.is_ghost
         
+    def test_addition_tangible_and_smaller_ghost(self):
+        """Test a ⊕ bν = a when a > b."""
+        a = SupertropicalElement(5)
+        b = SupertropicalElement(3, is_ghost=True)
+        result = a + b
+        assert result.value == 5.0
+        assert not result.is_ghost
+        assert (b + a) == result
+        
     def test_addition_with_python_int(self):
         """Test addition with Python int."""
         a = SupertropicalElement(5)
@@ -303,3 +312,42 @@ class TestSupertropicalMathematicalProperties:
         # Both should give the same result
         assert left.value == right.value
         assert left.is_ghost == right.is_ghost
+
+
+class TestSupertropicalElementStorage:
+    """Test the compact, immutable element layout."""
+    
+    def test_no_instance_dict(self):
+        """Test that elements use __slots__."""
+        elem = SupertropicalElement(5)
+        assert not hasattr(elem, "__dict__")
+        
+    def test_immutable(self):
+        """Test that attributes cannot be reassigned."""
+        elem = SupertropicalElement(5)
+        with pytest.raises(AttributeError):
+            elem.value = 3.0
+        with pytest.raises(AttributeError):
+            elem.is_ghost = True
+            
+    def test_hashable(self):
+        """Test hashing is consistent with equality."""
+        assert hash(SupertropicalElement(5)) == hash(5)
+        assert len({SupertropicalElement(5), SupertropicalElement(5.0), 5}) == 1
+        assert SupertropicalElement(5, is_ghost=True) in {SupertropicalElement(5, is_ghost=True)}
+        
+    def test_constants(self):
+        """Test the shared ε, ghost-ε and unit constants."""
+        assert EPSILON.value == -math.inf and not EPSILON.is_ghost
+        assert GHOST_EPSILON.value == -math.inf and GHOST_EPSILON.is_ghost
+        assert UNIT == SupertropicalElement(0)
+        a = SupertropicalElement(5)
+        assert (a * UNIT) is a
+        assert (a + EPSILON) is a
+        assert a ** 0 is UNIT
+        
+    def test_pickle_round_trip(self):
+        """Test that immutable elements can be pickled."""
+        import pickle
+        elem = SupertropicalElement(5, is_ghost=True)
+        assert pickle.loads(pickle.dumps(elem)) == elem
@@ -0,0 +1,147 @@
+"""
+Unit tests for SupertropicalFactorization class.
+"""
+import pickle
+import pytest
+import numpy as np
+from src.supertropical import (
+    SupertropicalElement,
+    SupertropicalFactorization,
+    SupertropicalMatrix,
+)
+from .helpers import random_matrix
+
+
+class TestFactorization:
+    """Test the cached permanent/adjoint factorization."""
+    
+    def test_factorize_returns_factorization(self):
+        """Test that factorize() caches permanent and adjoint."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        F = A.factorize()
+        assert isinstance(F, SupertropicalFactorization)
+        assert F.permanent == A.permanent()
+        assert np.array_equal(F.adjoint.values, A.adjoint().values)
+        assert not F.is_singular
+        
+    def test_solve_matches_matrix_solve(self):
+        """Test that repeated solves agree with SupertropicalMatrix.solve."""
+        A = SupertropicalMatrix([[1, 2, 0], [0, 1, 2], [2, 0, 1]])
+        F = A.factorize()
+        for rhs in ([[5], [4], [6]], [[0], [1], [2]]):
+            b = SupertropicalMatrix(rhs)
+            x = F.solve(b)
+            expected = A.solve(b)
+            assert np.array_equal(x.values, expected.values)
+            assert np.array_equal(x.ghost, expected.ghost)
+            
+    def test_pseudo_inverse(self):
+        """Test pseudo-inverse from the factorization."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        P = A.factorize().pseudo_inverse()
+        assert P[0, 0] == SupertropicalElement(-2)
+        assert P[1, 1] == SupertropicalElement(-3)
+        
+    def test_singular_solve_raises_error(self):
+        """Test that a ghost permanent makes solve raise ValueError."""
+        F = SupertropicalMatrix([[1, 1], [1, 1]]).factorize()
+        assert F.is_singular
+        with pytest.raises(ValueError):
+            F.solve(SupertropicalMatrix([[2], [2]]))
+        # The pseudo-inverse is still defined for a ghost permanent
+        assert F.pseudo_inverse()[0, 0].is_ghost
+        
+    def test_singular_skips_adjoint(self, monkeypatch):
+        """Test that a singular solve raises without computing the adjoint."""
+        calls = []
+        adjoint = SupertropicalMatrix.adjoint
+        monkeypatch.setattr(
+            SupertropicalMatrix, "adjoint", lambda self: calls.append(1) or adjoint(self)
+        )
+        F = SupertropicalMatrix([[1, 1], [1, 1]]).factorize()
+        with pytest.raises(ValueError):
+            F.solve(SupertropicalMatrix([[2], [2]]))
+        assert calls == []
+        assert F.adjoint[0, 0] == SupertropicalElement(1)
+        assert len(calls) == 1
+        
+    def test_non_square_raises_error(self):
+        """Test that non-square matrices cannot be factorized."""
+        with pytest.raises(ValueError):
+            SupertropicalMatrix([[1, 2, 3], [4, 5, 6]]).factorize()
+            
+    def test_pickle_round_trip(self):
+        """Test that a factorization survives pickling."""
+        F = SupertropicalMatrix([[2, 1], [1, 3]]).factorize()
+        G = pickle.loads(pickle.dumps(F))
+        b = SupertropicalMatrix([[5], [4]])
+        assert np.array_equal(G.solve(b).values, F.solve(b).values)
+        assert G.permanent == F.permanent
+
+
+class TestIncrementalUpdate:
+    """Test repairing a factorization after entries of A change."""
+    
+    def test_update_matches_fresh_factorization(self):
+        """Test that updated permanents and solutions match refactorizing."""
+        rng = np.random.default_rng(7)
+        for _ in range(60):
+            n = int(rng.integers(1, 6))
+            F = random_matrix(rng, (n, n), low=-5, high=6, epsilon=0.2, ghost=0).factorize()
+            for _ in range(5):
+                i, j = (int(k) for k in rng.integers(0, n, 2))
+                if rng.random() < 0.2:
+                    value = SupertropicalElement(-np.inf, is_ghost=True)
+                else:
+                    value = float(rng.integers(-5, 6))
+                F.update(i, j, value)
+                fresh = SupertropicalMatrix(F.matrix)
+                assert F.permanent == fresh.permanent()
+                assert F.permanent.is_ghost == fresh.permanent().is_ghost
+                if F.is_singular:
+                    continue
+                b = random_matrix(rng, (n, 2), low=-5, high=6, epsilon=0, ghost=0)
+                x, expected = F.solve(b), fresh.solve(b)
+                assert np.array_equal(x.values, expected.values)
+                assert np.array_equal(x.ghost, expected.ghost)
+                
+    def test_update_returns_factorization(self):
+        """Test that update() chains into solve()."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        x = A.factorize().update(0, 0, 5).solve(SupertropicalMatrix([5, 4]))
+        expected = SupertropicalMatrix([[5, 1], [1, 3]]).solve(SupertropicalMatrix([[5], [4]]))
+        assert np.array_equal(x.values, expected.values)
+        assert x.shape == (2, 1)
+        
+    def test_update_does_not_change_original(self):
+        """Test that the factorized matrix itself is left unchanged."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        A.factorize().update(1, 0, 7)
+        assert A[1, 0] == SupertropicalElement(1)
+        
+    def test_update_row(self):
+        """Test replacing a whole row, including a ghost entry."""
+        F = SupertropicalMatrix([[1, 2, 0], [0, 1, 2], [2, 0, 1]]).factorize()
+        F.update_row(2, [SupertropicalElement(4, is_ghost=True), 0, 6])
+        expected = SupertropicalMatrix([[1, 2, 0], [0, 1, 2], [4, 0, 6]])
+        expected.ghost[2, 0] = True
+        assert F.permanent == expected.permanent()
+        assert F.permanent.is_ghost == expected.permanent().is_ghost
+        assert np.array_equal(F.adjoint.values, expected.adjoint().values)
+        
+    def test_update_can_make_matrix_singular(self):
+        """Test that a tie created by an update makes solve raise."""
+        F = SupertropicalMatrix([[1, 0], [0, 1]]).factorize()
+        F.update(0, 1, 1)
+        F.update(1, 0, 1)
+        assert F.is_singular
+        with pytest.raises(ValueError):
+            F.solve(SupertropicalMatrix([[2], [2]]))
+            
+    def test_invalid_update_raises_error(self):
+        """Test out-of-range indices and wrong row lengths."""
+        F = SupertropicalMatrix([[2, 1], [1, 3]]).factorize()
+        with pytest.raises(IndexError):
+            F.update(2, 0, 1)
+        with pytest.raises(ValueError):
+            F.update_row(0, [1, 2, 3])
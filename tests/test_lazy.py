@@ -0,0 +1,107 @@
+"""
+Unit tests for lazy supertropical expressions.
+"""
+import pytest
+import numpy as np
+from src.supertropical import (
+    LazySupertropicalMatrix,
+    SupertropicalElement,
+    SupertropicalMatrix,
+)
+from src.supertropical.lazy import chain_order
+from .helpers import assert_same, random_matrix
+
+
+class TestChainOrder:
+    """Test the matrix-chain dynamic program."""
+    
+    def test_classic_chain(self):
+        """Test the textbook 10x100, 100x5, 5x50 chain."""
+        terms, order = chain_order([10, 100, 5, 50])
+        assert order == ((0, 1), 2)
+        assert terms == 10 * 100 * 5 + 10 * 5 * 50
+        
+    def test_matrix_vector_chain(self):
+        """Test that a chain ending in a vector is evaluated right to left."""
+        _, order = chain_order([50, 50, 50, 1])
+        assert order == (0, (1, 2))
+        
+    def test_single_factor(self):
+        """Test a chain of one matrix."""
+        assert chain_order([3, 4]) == (0, 0)
+
+
+class TestLazyEvaluation:
+    """Test that lazy expressions match eager evaluation."""
+    
+    def test_deferred_until_compute(self):
+        """Test that building an expression does not evaluate it."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        expr = A.lazy() * A
+        assert isinstance(expr, LazySupertropicalMatrix)
+        assert "pending" in repr(expr)
+        assert expr.shape == (2, 2)
+        assert_same(expr.compute(), A * A)
+        assert "computed" in repr(expr)
+        
+    def test_random_chains(self):
+        """Test product chains with scalars against left-to-right evaluation."""
+        rng = np.random.default_rng(11)
+        for _ in range(50):
+            dims = rng.integers(1, 6, size=int(rng.integers(2, 6)))
+            mats = [random_matrix(rng, (int(a), int(b))) for a, b in zip(dims, dims[1:])]
+            scalar = SupertropicalElement(float(rng.integers(-3, 4)), is_ghost=bool(rng.random() < 0.3))
+            expected = mats[0]
+            for M in mats[1:]:
+                expected = expected * M
+            expected = expected * scalar
+            expr = mats[0].lazy()
+            for M in mats[1:]:
+                expr = expr * M
+            assert_same((scalar * expr).compute(), expected)
+            
+    def test_scalars_are_folded(self):
+        """Test that several scalar factors are applied as one."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        expr = 2 * A.lazy() * SupertropicalElement(1, is_ghost=True) * A * 3
+        assert_same(expr.compute(), (A * A) * SupertropicalElement(6, is_ghost=True))
+        
+    def test_sums(self):
+        """Test chained sums, broadcasting and element operands."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        B = SupertropicalMatrix([[4, 2], [0, 4]])
+        row = SupertropicalMatrix([2, 5])
+        expr = A.lazy() + B + row + SupertropicalElement(3)
+        assert_same(expr.compute(), A + B + row + SupertropicalElement(3))
+        assert_same((row.lazy() + A).compute(), row + A)
+        
+    def test_mixed_expression(self):
+        """Test sums of products and products of sums."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        x = SupertropicalMatrix([[0], [1]])
+        expr = (A * A.lazy() + A) * x
+        assert_same(expr.compute(), (A * A + A) * x)
+        
+    def test_element_access(self):
+        """Test that indexing evaluates the expression."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        expr = A.lazy() * A
+        assert expr[1, 1] == (A * A)[1, 1]
+        assert np.array_equal(expr.values, (A * A).values)
+        
+    def test_operands_are_not_modified(self):
+        """Test that folding a scalar does not change the operands."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        x = SupertropicalMatrix([[0], [1]])
+        (A.lazy() * x * 5).compute()
+        (A.lazy() * 5).compute()
+        assert np.array_equal(A.values, [[1, 2], [3, 4]])
+        assert np.array_equal(x.values, [[0], [1]])
+        
+    def test_dimension_mismatch_raises_error(self):
+        """Test that shapes are checked when the expression is built."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        with pytest.raises(ValueError):
+            A.lazy() * SupertropicalMatrix([[1, 2, 3]])
+        with pytest.raises(TypeError):
+            A.lazy() * "x"
@@ -4,7 +4,8 @@ Unit tests for SupertropicalMatrix class.
 import pytest
 import numpy as np
 import math
-from src.supertropical import SupertropicalElement, SupertropicalMatrix
+from src.supertropical import SparseSupertropicalMatrix, SupertropicalElement, SupertropicalMatrix
+from .helpers import random_matrix
 
 
 class TestMatrixCreation:
@@ -36,6 +37,56 @@ class TestMatrixCreation:
         A = SupertropicalMatrix([[1, 2, 3], [4, 5, 6]])
         assert A.shape == (2, 3)
 
+    def test_array_backed_storage(self):
+        """Test that entries are stored as float64 values plus a ghost mask."""
+        g = SupertropicalElement(3, is_ghost=True)
+        A = SupertropicalMatrix([[1, g], [2, 4]])
+        assert A.values.dtype == np.float64
+        assert A.ghost.dtype == bool
+        assert A.values.tolist() == [[1.0, 3.0], [2.0, 4.0]]
+        assert A.ghost.tolist() == [[False, True], [False, False]]
+        
+    def test_create_from_numeric_array(self):
+        """Test that a plain numeric ndarray becomes tangible entries."""
+        A = SupertropicalMatrix(np.array([[1, 2], [3, 4]]))
+        assert A[1, 0].value == 3.0
+        assert A[1, 0].is_tangible()
+        
+    def test_slice_returns_matrix(self):
+        """Test that slicing returns a SupertropicalMatrix."""
+        A = SupertropicalMatrix([[1, 2, 3], [4, 5, 6]])
+        row = A[1, :]
+        assert isinstance(row, SupertropicalMatrix)
+        assert row.shape == (3,)
+        assert row[2].value == 6.0
+
+
+class TestSpecialMatrices:
+    """Test identity, pseudo-zero and transpose."""
+    
+    def test_identity(self):
+        """Test identity matrix layout."""
+        I = SupertropicalMatrix.identity(3)
+        assert I[1, 1] == SupertropicalElement(0)
+        assert I[0, 2].value == -math.inf
+        assert I[0, 2].is_ghost
+        
+    def test_pseudo_zero(self):
+        """Test pseudo-zero matrix is all ghost ε."""
+        Z = SupertropicalMatrix.pseudo_zero(2)
+        assert np.all(Z.values == -np.inf)
+        assert np.all(Z.ghost)
+        
+    def test_transpose(self):
+        """Test transpose keeps values and ghost flags."""
+        g = SupertropicalElement(7, is_ghost=True)
+        A = SupertropicalMatrix([[1, g, 3], [4, 5, 6]])
+        T = A.transpose()
+        assert T.shape == (3, 2)
+        assert T[1, 0].value == 7.0
+        assert T[1, 0].is_ghost
+        assert T[2, 1].value == 6.0
+
 
 class TestMatrixMultiplication:
     """Test matrix multiplication (⊙)."""
@@ -79,6 +130,47 @@ class TestMatrixMultiplication:
         with pytest.raises(ValueError):
             C = A * B
 
+    def test_multiply_theory_example(self):
+        """Test Example 3.2 from the theory guide."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        B = SupertropicalMatrix([[5, SupertropicalElement(4, is_ghost=True)], [2, 1]])
+        C = A * B
+        assert C.values.tolist() == [[7.0, 6.0], [6.0, 5.0]]
+        assert C.ghost.tolist() == [[False, True], [False, True]]
+        
+    def test_multiply_tie_becomes_ghost(self):
+        """Test that two tangible terms tying at the maximum give a ghost."""
+        A = SupertropicalMatrix([[1, 2]])
+        B = SupertropicalMatrix([[3], [2]])
+        C = A * B
+        assert C[0, 0].value == 4.0
+        assert C[0, 0].is_ghost
+        
+    def test_multiply_matches_elementwise_reference(self):
+        """Test the blocked kernel against an element-by-element product."""
+        A = random_matrix(np.random.default_rng(0), (7, 5), epsilon=0.2, ghost=0.3)
+        B = A.transpose()
+        C = A * B
+        for i in range(7):
+            for j in range(7):
+                expected = SupertropicalElement(-math.inf)
+                for k in range(5):
+                    expected = expected + A[i, k] * B[k, j]
+                assert C[i, j].value == expected.value
+                if expected.value > -math.inf:
+                    assert C[i, j].is_ghost == expected.is_ghost
+        
+    def test_multiply_small_blocks(self):
+        """Test that block splitting does not change the result."""
+        from src.supertropical._kernels import maxplus_matmul
+        rng = np.random.default_rng(1)
+        A = random_matrix(rng, (6, 9), low=0, high=3, epsilon=0)
+        B = random_matrix(rng, (9, 4), low=0, high=3, epsilon=0)
+        full = maxplus_matmul(A.values, A.ghost, B.values, B.ghost)
+        blocked = maxplus_matmul(A.values, A.ghost, B.values, B.ghost, block_elements=7)
+        assert np.array_equal(full[0], blocked[0])
+        assert np.array_equal(full[1], blocked[1])
+
 
 class TestScalarMultiplication:
     """Test scalar multiplication."""
@@ -147,6 +239,35 @@ class TestMatrixPermanent:
         with pytest.raises(ValueError):
             A.permanent()
 
+    def test_permanent_tied_optimum_is_ghost(self):
+        """Test that two optimal permutations give a ghost permanent."""
+        A = SupertropicalMatrix([[1, 1], [1, 1]])
+        perm = A.permanent()
+        assert perm.value == 2.0
+        assert perm.is_ghost
+        
+    def test_permanent_all_epsilon(self):
+        """Test that a permanent with no finite permutation is ghost ε."""
+        A = SupertropicalMatrix([[1, 2], [-math.inf, -math.inf]])
+        perm = A.permanent()
+        assert perm.value == -math.inf
+        assert perm.is_ghost
+        
+    def test_permanent_matches_brute_force(self):
+        """Test the assignment solver against all permutations on integer data."""
+        import itertools
+        rng = np.random.default_rng(2)
+        for _ in range(200):
+            n = int(rng.integers(1, 6))
+            A = random_matrix(rng, (n, n), low=-2, high=3, epsilon=0.2, ghost=0.15)
+            expected = SupertropicalElement(-math.inf)
+            for perm in itertools.permutations(range(n)):
+                term = SupertropicalElement(0.0)
+                for i in range(n):
+                    term = term * A[i, perm[i]]
+                expected = expected + term
+            assert A.permanent() == expected
+
 
 class TestMatrixAdjoint:
     """Test adjoint matrix calculation."""
@@ -164,6 +285,32 @@ class TestMatrixAdjoint:
         adj = A.adjoint()
         assert adj.shape == (3, 3)
         
+    def test_permanent_float_near_tie_is_ghost(self):
+        """Test that assignments differing only by rounding count as tied."""
+        A = SupertropicalMatrix([[0.1, 0.3], [0.0, 0.2]])
+        # 0.1 + 0.2 != 0.3 + 0.0 in float64, but within the tie tolerance
+        assert 0.1 + 0.2 != 0.3
+        assert A.permanent().is_ghost
+        
+    def test_adjoint_matches_minor_permanents(self):
+        """Test that every adjoint entry equals the permanent of its minor."""
+        rng = np.random.default_rng(3)
+        for _ in range(100):
+            n = int(rng.integers(1, 6))
+            A = random_matrix(rng, (n, n), low=-2, high=3, epsilon=0.2, ghost=0.15)
+            adj = A.adjoint()
+            for i in range(n):
+                for j in range(n):
+                    assert adj[i, j] == A.get_minor(j, i).permanent()
+        
+    def test_adjoint_2x2_values(self):
+        """Test adj([[a, b], [c, d]]) = [[d, b], [c, a]]."""
+        g = SupertropicalElement(1, is_ghost=True)
+        A = SupertropicalMatrix([[2, g], [4, 3]])
+        adj = A.adjoint()
+        assert adj.values.tolist() == [[3.0, 1.0], [4.0, 2.0]]
+        assert adj.ghost.tolist() == [[False, True], [False, False]]
+        
     def test_adjoint_non_square_raises_error(self):
         """Test that adjoint of non-square matrix raises ValueError."""
         A = SupertropicalMatrix([[1, 2, 3], [4, 5, 6]])
@@ -232,6 +379,37 @@ class TestLinearSystemSolver:
             with pytest.raises(ValueError):
                 A.solve(b)
                 
+    def test_solve_multiple_right_hand_sides(self):
+        """Test that an (n, k) right-hand side solves each column."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        B = SupertropicalMatrix([[5, 1], [4, 7]])
+        X = A.solve(B)
+        assert X.shape == (2, 2)
+        for j, column in enumerate(([[5], [4]], [[1], [7]])):
+            x = A.solve(SupertropicalMatrix(column))
+            assert X[0, j] == x[0, 0]
+            assert X[1, j] == x[1, 0]
+            
+    def test_solve_stacked_systems(self):
+        """Test solving a (batch, n, n) stack of systems."""
+        systems = [[[2, 1], [1, 3]], [[0, 4], [1, 0]]]
+        rhs = [[5, 4], [2, 3]]
+        A = SupertropicalMatrix(np.array(systems))
+        b = SupertropicalMatrix(np.array(rhs))
+        X = A.solve(b)
+        assert X.shape == (2, 2, 1)
+        for idx in range(2):
+            x = SupertropicalMatrix(systems[idx]).solve(SupertropicalMatrix(rhs[idx]))
+            assert np.array_equal(X.values[idx], x.values)
+            assert np.array_equal(X.ghost[idx], x.ghost)
+            
+    def test_solve_stacked_reports_singular_system(self):
+        """Test that a singular system in a stack is named in the error."""
+        A = SupertropicalMatrix(np.array([[[2, 1], [1, 3]], [[1, 1], [1, 1]]]))
+        b = SupertropicalMatrix(np.array([[5, 4], [2, 2]]))
+        with pytest.raises(ValueError, match="System 1"):
+            A.solve(b)
+            
     def test_solve_non_square_raises_error(self):
         """Test that solving non-square system raises ValueError."""
         A = SupertropicalMatrix([[1, 2, 3], [4, 5, 6]])
@@ -289,3 +467,320 @@ class TestMatrixWithGhostElements:
         perm = A.permanent()
         # Permanent might be ghost depending on the values
         assert isinstance(perm, SupertropicalElement)
+
+
+class TestMatrixPowerAndClosure:
+    """Test matrix powers and the Kleene star."""
+    
+    def test_power_zero_is_identity(self):
+        """Test A^0 = I."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        P = A ** 0
+        assert np.array_equal(P.values, SupertropicalMatrix.identity(2).values)
+        
+    def test_power_matches_repeated_product(self):
+        """Test that squaring gives the same result as repeated products."""
+        g = SupertropicalElement(-1, is_ghost=True)
+        A = SupertropicalMatrix([[-2, 0, g], [-6, -math.inf, 0], [1, -5, -4]])
+        expected = A
+        for k in range(2, 12):
+            expected = expected * A
+            P = A ** k
+            assert np.array_equal(P.values, expected.values)
+            assert np.array_equal(P.ghost, expected.ghost)
+            
+    def test_power_negative_raises_error(self):
+        """Test that negative exponents raise ValueError."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        with pytest.raises(ValueError):
+            A ** -1
+            
+    def test_closure_longest_paths(self):
+        """Test A* on a graph with only negative cycles."""
+        ninf = -math.inf
+        A = SupertropicalMatrix([[ninf, 2, ninf], [ninf, ninf, 3], [-6, ninf, ninf]])
+        C = A.closure()
+        assert C.values.tolist() == [[0.0, 2.0, 5.0], [-3.0, 0.0, 3.0], [-6.0, -4.0, 0.0]]
+        assert not C.ghost.any()
+        
+    def test_closure_matches_power_series(self):
+        """Test A* against I ⊕ A ⊕ ... ⊕ A^(n-1) when cycles are negative."""
+        A = SupertropicalMatrix([[-1, -2, -5], [-3, -4, 1], [-2, -7, -3]])
+        C = A.closure()
+        S = SupertropicalMatrix.identity(3)
+        P = SupertropicalMatrix.identity(3)
+        for _ in range(3):
+            P = P * A
+            for i in range(3):
+                for j in range(3):
+                    assert C[i, j].value >= P[i, j].value
+            S = SupertropicalMatrix([[S[i, j] + P[i, j] for j in range(3)] for i in range(3)])
+        assert np.array_equal(C.values, S.values)
+        assert np.array_equal(C.ghost, S.ghost)
+        
+    def test_closure_zero_cycle_is_ghost(self):
+        """Test that a zero-weight cycle makes the walks through it ghost."""
+        A = SupertropicalMatrix([[-math.inf, 1], [-1, -math.inf]])
+        C = A.closure()
+        assert C.values.tolist() == [[0.0, 1.0], [-1.0, 0.0]]
+        assert C.ghost.all()
+        
+    def test_closure_positive_cycle_raises_error(self):
+        """Test that a positive cycle raises ValueError."""
+        A = SupertropicalMatrix([[1, 0], [0, -1]])
+        with pytest.raises(ValueError):
+            A.closure()
+
+
+class TestMatrixEigen:
+    """Test the max-plus eigenvalue and eigenvectors."""
+    
+    @pytest.mark.parametrize("method", ["karp", "howard"])
+    def test_eigenvalue_is_max_cycle_mean(self, method):
+        """Test λ = maximum cycle mean with a unique critical cycle."""
+        ninf = -math.inf
+        # Cycles: 0->1->0 has mean 3, 2->2 has mean 2
+        A = SupertropicalMatrix([[ninf, 5, ninf], [1, ninf, 0], [ninf, ninf, 2]])
+        lam = A.eigenvalue(method=method)
+        assert lam.value == 3.0
+        assert lam.is_tangible()
+        
+    @pytest.mark.parametrize("method", ["karp", "howard"])
+    def test_eigenvalue_tied_cycles_is_ghost(self, method):
+        """Test that two cycles attaining λ give a ghost eigenvalue."""
+        A = SupertropicalMatrix([[2, 0], [0, 2]])
+        lam = A.eigenvalue(method=method)
+        assert lam.value == 2.0
+        assert lam.is_ghost
+        
+    def test_engines_agree_on_random_matrices(self):
+        """Test that Karp and Howard give the same eigenvalue."""
+        rng = np.random.default_rng(4)
+        for _ in range(50):
+            A = random_matrix(rng, (6, 6), low=-5, high=6, epsilon=0.5, ghost=0)
+            karp = A.eigenvalue(method="karp")
+            howard = A.eigenvalue(method="howard")
+            assert karp.value == pytest.approx(howard.value)
+            assert karp.is_ghost == howard.is_ghost
+            
+    def test_acyclic_matrix_has_epsilon_eigenvalue(self):
+        """Test that a matrix without cycles has eigenvalue ε."""
+        ninf = -math.inf
+        A = SupertropicalMatrix([[ninf, 1], [ninf, ninf]])
+        assert A.eigenvalue().value == -math.inf
+        with pytest.raises(ValueError):
+            A.eigenvectors()
+            
+    def test_eigenvectors_satisfy_eigen_equation(self):
+        """Test A * v = λ * v for every returned eigenvector."""
+        A = SupertropicalMatrix([[1, 4, -1], [2, 0, 3], [0, 1, 2]])
+        lam = A.eigenvalue()
+        V = A.eigenvectors(method="howard")
+        assert V.shape[0] == 3
+        assert np.allclose((A * V).values, V.values + lam.value)
+        
+    def test_unknown_method_raises_error(self):
+        """Test that an unknown engine name raises ValueError."""
+        with pytest.raises(ValueError):
+            SupertropicalMatrix([[1]]).eigenvalue(method="power")
+
+
+class TestMatrixDtypes:
+    """Test float32 and integer-valued matrices."""
+
+    def test_default_dtype_is_float64(self):
+        """Test that matrices keep float64 values by default."""
+        assert SupertropicalMatrix([[1, 2]]).dtype == np.float64
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.int64, np.int32])
+    def test_epsilon_storage(self, dtype):
+        """Test that ε is -inf in float32 and the minimum in integer dtypes."""
+        A = SupertropicalMatrix([[1, -math.inf]], dtype=dtype)
+        assert A.dtype == dtype
+        expected = -np.inf if np.dtype(dtype).kind == "f" else np.iinfo(dtype).min
+        assert A.values[0, 1] == expected
+        assert A[0, 1].value == -math.inf
+        assert A[0, 0].value == 1.0
+
+    def test_integer_array_keeps_sentinel(self):
+        """Test that the integer minimum of an int64 array is read as ε."""
+        eps = np.iinfo(np.int64).min
+        A = SupertropicalMatrix(np.array([[eps, 3]]), dtype=np.int64)
+        assert A[0, 0].value == -math.inf
+        assert A[0, 1].value == 3.0
+
+    def test_astype_round_trip(self):
+        """Test float64 -> int32 -> float64 conversion is lossless."""
+        A = random_matrix(np.random.default_rng(0), (4, 4), low=-50, high=50)
+        B = A.astype(np.int32).astype(np.float64)
+        assert np.array_equal(A.values, B.values)
+        assert A.astype(np.float64) is A
+
+    def test_invalid_entries_raise_error(self):
+        """Test that non-integral entries and unsupported dtypes are rejected."""
+        with pytest.raises(ValueError):
+            SupertropicalMatrix([[1.5]], dtype=np.int32)
+        with pytest.raises(ValueError):
+            SupertropicalMatrix([[2.0 ** 40]], dtype=np.int32)
+        with pytest.raises(ValueError):
+            SupertropicalMatrix([[1]], dtype=np.int8)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.int64, np.int32])
+    def test_product_matches_float64(self, dtype):
+        """Test that products agree with float64, ghosts included."""
+        A = random_matrix(np.random.default_rng(1), (7, 5), low=-50, high=50)
+        B = random_matrix(np.random.default_rng(2), (5, 6), low=-50, high=50)
+        expected = A * B
+        result = A.astype(dtype) * B.astype(dtype)
+        assert result.dtype == dtype
+        assert np.array_equal(result.astype(np.float64).values, expected.values)
+        assert np.array_equal(result.ghost, expected.ghost)
+
+    def test_integer_product_with_large_entries(self):
+        """Test the sentinel stays absorbing for entries near the dtype limit."""
+        A = SupertropicalMatrix([[2 ** 29, -math.inf], [1, 2]], dtype=np.int32)
+        result = A * A
+        assert result[0, 1].value == -math.inf
+        assert result[0, 1].is_ghost
+        assert result[1, 0].value == 2 ** 29 + 1
+
+    def test_integer_overflow_raises_error(self):
+        """Test that sums out of the integer range raise instead of wrapping."""
+        A = SupertropicalMatrix([[1_500_000_000, 0], [0, 1_500_000_000]], dtype=np.int32)
+        with pytest.raises(OverflowError):
+            A * A
+        result = A.astype(np.int64) * A.astype(np.int64)
+        assert result[0, 0] == SupertropicalElement(3_000_000_000)
+        assert result[0, 1] == SupertropicalElement(1_500_000_000, is_ghost=True)
+        chain = np.full((3, 3), -np.inf)
+        chain[0, 1] = chain[1, 2] = -1_500_000_000
+        with pytest.raises(OverflowError):
+            SupertropicalMatrix(chain, dtype=np.int32).closure()
+
+    def test_integer_ties_are_exact(self):
+        """Test exact tie detection with integer values."""
+        A = SupertropicalMatrix([[3, 1]], dtype=np.int64)
+        B = SupertropicalMatrix([[1], [3]], dtype=np.int64)
+        assert (A * B)[0, 0].is_ghost
+
+    def test_mixed_dtypes_promote(self):
+        """Test that operands promote like NumPy arrays."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]], dtype=np.int32)
+        assert (A * A.astype(np.int64)).dtype == np.int64
+        assert (A * A.astype(np.float32)).dtype == np.float64
+        assert (A * 2).dtype == np.int32
+        assert (A * 0.5).dtype == np.float64
+        assert (A.astype(np.float32) * 0.5).dtype == np.float32
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.int32])
+    def test_closure_matches_float64(self, dtype):
+        """Test the closure in the smaller dtypes."""
+        A = random_matrix(np.random.default_rng(3), (6, 6), low=-50, high=1)
+        expected = A.closure()
+        result = A.astype(dtype).closure()
+        assert result.dtype == dtype
+        assert np.array_equal(result.astype(np.float64).values, expected.values)
+        assert np.array_equal(result.ghost, expected.ghost)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.int64, np.int32])
+    def test_solve_matches_float64(self, dtype):
+        """Test that solve() returns the float64 solution in the matrix dtype."""
+        A = random_matrix(np.random.default_rng(4), (5, 5), low=-50, high=50, ghost=0)
+        np.fill_diagonal(A.values, 40)
+        np.fill_diagonal(A.ghost, False)
+        b = random_matrix(np.random.default_rng(5), (5, 2), low=0, high=10)
+        expected = A.solve(b)
+        result = A.astype(dtype).solve(b.astype(dtype))
+        assert result.dtype == dtype
+        assert np.array_equal(result.astype(np.float64).values, expected.values)
+        assert np.array_equal(result.ghost, expected.ghost)
+
+
+class TestBulkConstructors:
+    """Test from_arrays, from_numpy and from_edges."""
+
+    def test_from_numpy_shares_memory(self):
+        """Test that arrays of a supported dtype are not copied."""
+        values = np.array([[1.0, -np.inf], [2.0, 3.0]])
+        A = SupertropicalMatrix.from_numpy(values)
+        assert A.values is values
+        assert not A.ghost.any()
+        assert A[0, 1].value == -math.inf
+
+    def test_from_numpy_keeps_integer_dtype(self):
+        """Test that int32 arrays give an int32 matrix without a copy."""
+        values = np.arange(6, dtype=np.int32).reshape(2, 3)
+        A = SupertropicalMatrix.from_numpy(values)
+        assert A.dtype == np.int32
+        assert A.values is values
+
+    def test_from_numpy_converts_other_dtypes(self):
+        """Test that unsupported numeric dtypes become float64."""
+        A = SupertropicalMatrix.from_numpy(np.array([[1, 2]], dtype=np.int16))
+        assert A.dtype == np.float64
+        assert A[0, 1].value == 2.0
+
+    def test_from_arrays_with_ghost_mask(self):
+        """Test that the ghost mask is used as given."""
+        values = np.array([[1.0, 2.0]])
+        mask = np.array([[False, True]])
+        A = SupertropicalMatrix.from_arrays(values, mask)
+        assert A.ghost is mask
+        assert A[0, 1].is_ghost
+        assert not A[0, 0].is_ghost
+
+    def test_from_arrays_rejects_bad_input(self):
+        """Test shape mismatches and non-numeric values."""
+        with pytest.raises(ValueError):
+            SupertropicalMatrix.from_arrays(np.zeros((2, 2)), np.zeros((2, 3), dtype=bool))
+        with pytest.raises(TypeError):
+            SupertropicalMatrix.from_arrays(np.array([["a"]]))
+
+    def test_from_edges(self):
+        """Test that missing edges are ε and edges land at (row, col)."""
+        A = SupertropicalMatrix.from_edges([0, 1], [2, 0], [5, -1], shape=(2, 3))
+        assert A.shape == (2, 3)
+        assert A[0, 2].value == 5.0
+        assert A[1, 0].value == -1.0
+        assert A[0, 0] == SupertropicalElement(-math.inf, is_ghost=True)
+        assert not A[0, 2].is_ghost
+
+    def test_from_edges_matches_sparse(self):
+        """Test that missing entries are ghost ε, as in the sparse class."""
+        rows, cols, weights = [0, 1, 2], [1, 2, 0], [1.0, -2.0, 3.0]
+        A = SupertropicalMatrix.from_edges(rows, cols, weights, shape=(3, 3))
+        S = SparseSupertropicalMatrix(weights, [False] * 3, cols, [0, 1, 2, 3], (3, 3))
+        assert np.array_equal(A.values, S.to_dense().values)
+        assert np.array_equal(A.ghost, S.to_dense().ghost)
+
+    def test_from_edges_parallel_edges(self):
+        """Test that parallel edges are summed with ⊕."""
+        A = SupertropicalMatrix.from_edges(
+            [0, 0, 1, 1, 1], [0, 0, 1, 1, 1], [3, 4, 2, 2, 1],
+            ghosts=[False, False, False, False, True],
+        )
+        assert A[0, 0] == SupertropicalElement(4)
+        assert not A[0, 0].is_ghost
+        assert A[1, 1] == SupertropicalElement(2, True)
+
+    def test_from_edges_default_shape_and_dtype(self):
+        """Test the inferred shape and that the weight dtype is kept."""
+        A = SupertropicalMatrix.from_edges([0, 2], [1, 0], np.array([7, 8], dtype=np.int64))
+        assert A.shape == (3, 2)
+        assert A.dtype == np.int64
+        assert A[2, 0].value == 8.0
+
+    def test_from_edges_out_of_range(self):
+        """Test that edges outside the shape raise ValueError."""
+        with pytest.raises(ValueError):
+            SupertropicalMatrix.from_edges([0, 2], [0, 0], [1, 1], shape=(2, 2))
+
+    def test_list_input_matches_elements(self):
+        """Test the vectorized list path against element input."""
+        A = SupertropicalMatrix([[1, -math.inf], [True, 2.5]])
+        B = SupertropicalMatrix([[SupertropicalElement(1), SupertropicalElement(-math.inf)],
+                                 [SupertropicalElement(1), SupertropicalElement(2.5)]])
+        assert np.array_equal(A.values, B.values)
+        assert np.array_equal(A.ghost, B.ghost)
+        with pytest.raises(TypeError):
+            SupertropicalMatrix([["a", 1]])
@@ -0,0 +1,261 @@
+"""
+Unit tests for SupertropicalPolynomial.
+"""
+import pytest
+import numpy as np
+from src.supertropical import (
+    SupertropicalElement,
+    SupertropicalMatrix,
+    SupertropicalPolynomial,
+    evaluate_characteristic,
+)
+from .helpers import random_matrix
+
+
+def brute_force(values, ghost, x, x_ghost=False):
+    """max_k (c_k + k x) with the ghost rules, term by term."""
+    best, count, hit = -np.inf, 0, False
+    for k, (c, c_ghost) in enumerate(zip(values, ghost)):
+        if c == -np.inf:
+            continue
+        term = c if k == 0 else c + k * x
+        term_ghost = bool(c_ghost) or (x_ghost and k > 0)
+        if term > best:
+            best, count, hit = term, 1, term_ghost
+        elif term == best:
+            count, hit = count + 1, hit or term_ghost
+    return best, count >= 2 or hit or best == -np.inf
+
+
+def random_polynomial(rng):
+    coefficients = random_matrix(rng, (int(rng.integers(1, 8)),), low=-6, high=7)
+    return coefficients.values, coefficients.ghost
+
+
+class TestPolynomialCreation:
+    """Test constructing polynomials."""
+    
+    def test_create_from_list(self):
+        """Test coefficients given as numbers and elements."""
+        p = SupertropicalPolynomial([0, SupertropicalElement(1, is_ghost=True), -1])
+        assert p.degree == 2
+        assert p[1] == SupertropicalElement(1, is_ghost=True)
+        assert p[5] == SupertropicalElement(-np.inf, is_ghost=True)
+        assert str(p) == "0.0 ⊕ 1.0ν⊙x ⊕ -1.0⊙x^2"
+        
+    def test_trailing_epsilon_dropped(self):
+        """Test that trailing ε coefficients do not count towards the degree."""
+        p = SupertropicalPolynomial(np.array([1.0, 2.0, -np.inf]))
+        assert p.degree == 1
+        assert p.values.shape == (2,)
+        
+    @pytest.mark.parametrize("dtype", [np.int64, np.int32])
+    def test_integer_epsilon_coefficient(self, dtype):
+        """Test that the integer ε sentinel is read as an ε coefficient."""
+        p = SupertropicalPolynomial(SupertropicalMatrix([1, -np.inf, 2], dtype=dtype))
+        assert str(p) == "1.0 ⊕ 2.0⊙x^2"
+        assert p[1] == SupertropicalElement(-np.inf, is_ghost=True)
+        assert p.hull().tolist() == [0, 2]
+        x = SupertropicalMatrix([0, -np.inf], dtype=dtype)
+        result = p(x)
+        assert result[0] == SupertropicalElement(2)
+        assert result[1] == SupertropicalElement(1)
+        
+    def test_invalid_coefficients_raise_error(self):
+        """Test that empty or 2-D coefficients raise ValueError."""
+        with pytest.raises(ValueError):
+            SupertropicalPolynomial([])
+        with pytest.raises(ValueError):
+            SupertropicalPolynomial(SupertropicalMatrix([[1, 2], [3, 4]]))
+
+
+class TestPolynomialEvaluation:
+    """Test vectorized evaluation."""
+    
+    def test_matches_brute_force(self):
+        """Test evaluation against term-by-term maxima, ghost points included."""
+        rng = np.random.default_rng(5)
+        for _ in range(200):
+            values, ghost = random_polynomial(rng)
+            p = SupertropicalPolynomial._from_arrays(values.copy(), ghost.copy())
+            x = np.append(rng.integers(-8, 9, size=12) / 2.0, -np.inf)
+            x_ghost = rng.random(x.shape) < 0.3
+            result = p(SupertropicalMatrix._from_arrays(x, x_ghost))
+            for i in range(x.size):
+                expected = brute_force(values, ghost, x[i], x_ghost[i])
+                assert (result.values[i], result.ghost[i]) == expected
+                
+    def test_scalar_and_array_points(self):
+        """Test the return types for single points and arrays."""
+        p = SupertropicalPolynomial([0, 1, -1])
+        assert p(0) == SupertropicalElement(1)
+        assert p(-1) == SupertropicalElement(0, is_ghost=True)
+        result = p(np.array([[0.0, 3.0]]))
+        assert isinstance(result, SupertropicalMatrix)
+        assert result.shape == (1, 2)
+        assert np.array_equal(result.values, [[1, 5]])
+        
+    def test_epsilon_polynomial(self):
+        """Test that the ε polynomial evaluates to ghost ε."""
+        p = SupertropicalPolynomial([-np.inf])
+        assert p.degree == -1
+        assert p(2.0) == SupertropicalElement(-np.inf, is_ghost=True)
+
+
+class TestPolynomialRoots:
+    """Test corner roots and the hull."""
+    
+    def test_roots(self):
+        """Test corner locations and multiplicities."""
+        # max(0, x + 1, 2x - 1): corners at -1 and 2
+        p = SupertropicalPolynomial([0, 1, -1])
+        locations, multiplicities = p.roots()
+        assert np.array_equal(locations, [-1, 2])
+        assert np.array_equal(multiplicities, [1, 1])
+        assert p(locations[0]).is_ghost and p(locations[1]).is_ghost
+        
+    def test_non_essential_terms(self):
+        """Test that terms below the hull are dropped by essential()."""
+        p = SupertropicalPolynomial([0, -5, 0])
+        assert np.array_equal(p.hull(), [0, 2])
+        locations, multiplicities = p.roots()
+        assert np.array_equal(locations, [0]) and np.array_equal(multiplicities, [2])
+        assert p.essential()[1] == SupertropicalElement(-np.inf, is_ghost=True)
+        x = np.linspace(-3, 3, 13)
+        assert np.array_equal(p.essential()(x).values, p(x).values)
+
+
+class TestPolynomialArithmetic:
+    """Test sums and products."""
+    
+    def test_sum(self):
+        """Test coefficientwise ⊕ with ties becoming ghost."""
+        p = SupertropicalPolynomial([1, 2]) + SupertropicalPolynomial([1, 0, 3])
+        assert p[0] == SupertropicalElement(1, is_ghost=True)
+        assert p[1] == SupertropicalElement(2)
+        assert p[2] == SupertropicalElement(3)
+        
+    def test_product_matches_convolution(self):
+        """Test that products agree with the full max-plus convolution."""
+        rng = np.random.default_rng(6)
+        for _ in range(200):
+            f_values, f_ghost = random_polynomial(rng)
+            g_values, g_ghost = random_polynomial(rng)
+            size = f_values.size + g_values.size - 1
+            values = np.full(size, -np.inf)
+            count = np.zeros(size, dtype=int)
+            ghost = np.zeros(size, dtype=bool)
+            for i in range(f_values.size):
+                for j in range(g_values.size):
+                    term = f_values[i] + g_values[j]
+                    if term == -np.inf:
+                        continue
+                    if term > values[i + j]:
+                        values[i + j], count[i + j], ghost[i + j] = term, 1, f_ghost[i] or g_ghost[j]
+                    elif term == values[i + j]:
+                        count[i + j] += 1
+                        ghost[i + j] |= f_ghost[i] or g_ghost[j]
+            ghost |= count >= 2
+            product = (SupertropicalPolynomial._from_arrays(f_values, f_ghost)
+                       * SupertropicalPolynomial._from_arrays(g_values, g_ghost))
+            x = rng.integers(-8, 9, size=12) / 2.0
+            result = product(x)
+            for i in range(x.size):
+                assert (result.values[i], result.ghost[i]) == brute_force(values, ghost, x[i])
+                
+    def test_scalar_product(self):
+        """Test multiplying by an element shifts every coefficient."""
+        p = SupertropicalElement(2, is_ghost=True) * SupertropicalPolynomial([0, 1])
+        assert p[0] == SupertropicalElement(2, is_ghost=True)
+        assert p[1] == SupertropicalElement(3, is_ghost=True)
+
+
+class TestCharacteristicEvaluation:
+    """Test evaluating per(A ⊕ x·I)."""
+    
+    def test_evaluate_characteristic(self):
+        """Test against the permanent of A ⊕ x·I."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        result = evaluate_characteristic(A, [0, 5, 10])
+        assert np.array_equal(result.values, [5, 10, 20])
+        assert np.array_equal(result.ghost, [True, False, False])
+        for x in (0, 5, 10):
+            shifted = SupertropicalMatrix([[max(1, x), 2], [3, max(4, x)]])
+            assert evaluate_characteristic(A, x).value == shifted.permanent().value
+            
+    def test_non_square_raises_error(self):
+        """Test that non-square matrices raise ValueError."""
+        with pytest.raises(ValueError):
+            evaluate_characteristic(SupertropicalMatrix([[1, 2, 3]]), 0)
+
+
+class TestCharacteristicPolynomial:
+    """Test SupertropicalMatrix.characteristic_polynomial()."""
+    
+    @staticmethod
+    def brute_force_coefficients(values, ghost):
+        """c_k as the supertropical sum over principal submatrices."""
+        import itertools
+        n = values.shape[0]
+        coef = np.full(n + 1, -np.inf)
+        count = np.zeros(n + 1, dtype=int)
+        coef_ghost = np.zeros(n + 1, dtype=bool)
+        for size in range(n + 1):
+            k = n - size
+            for rows in itertools.combinations(range(n), size):
+                for cols in itertools.permutations(rows):
+                    term = sum(values[i, j] for i, j in zip(rows, cols)) if size else 0.0
+                    if term == -np.inf:
+                        continue
+                    term_ghost = any(ghost[i, j] for i, j in zip(rows, cols))
+                    if term > coef[k]:
+                        coef[k], count[k], coef_ghost[k] = term, 1, term_ghost
+                    elif term == coef[k]:
+                        count[k] += 1
+                        coef_ghost[k] |= term_ghost
+        return coef, coef_ghost | (count >= 2) | (coef == -np.inf)
+    
+    def test_matches_principal_submatrices(self):
+        """Test hull coefficients and their ghost status against enumeration."""
+        rng = np.random.default_rng(8)
+        for _ in range(100):
+            n = int(rng.integers(1, 5))
+            A = random_matrix(rng, (n, n), low=-4, high=5, ghost=0.15)
+            f = A.characteristic_polynomial()
+            coef, coef_ghost = self.brute_force_coefficients(A.values, A.ghost)
+            expected = SupertropicalPolynomial._from_arrays(coef, coef_ghost)
+            hull = expected.hull()
+            assert np.array_equal(f.hull(), hull)
+            assert np.array_equal(f.values[hull], coef[hull])
+            assert np.array_equal(f.ghost[hull], coef_ghost[hull])
+            x = rng.integers(-10, 11, size=6) / 2.0
+            assert np.array_equal(f(x).ghost, evaluate_characteristic(A, x).ghost)
+            
+    def test_example(self):
+        """Test a 2x2 matrix: f(x) = x^2 ⊕ 4x ⊕ 5ν."""
+        f = SupertropicalMatrix([[1, 2], [3, 4]]).characteristic_polynomial()
+        assert f.degree == 2
+        assert f[2] == SupertropicalElement(0)
+        assert f[1] == SupertropicalElement(4)
+        assert f[0] == SupertropicalElement(5, is_ghost=True)
+        
+    def test_largest_corner_is_eigenvalue(self):
+        """Test that the largest corner is the maximum cycle mean."""
+        rng = np.random.default_rng(9)
+        A = SupertropicalMatrix(rng.normal(size=(30, 30)))
+        locations, _ = A.characteristic_polynomial().roots()
+        assert locations[-1] == pytest.approx(A.eigenvalue().value)
+        
+    def test_many_points_use_polynomial(self):
+        """Test that bulk evaluation agrees with per-point permanents."""
+        A = SupertropicalMatrix([[1, 2, 0], [0, 1, 2], [2, 0, 1]])
+        x = np.linspace(-4, 4, 33)
+        bulk = evaluate_characteristic(A, x)
+        single = [evaluate_characteristic(A, float(v)) for v in x]
+        assert np.array_equal(bulk.values, [s.value for s in single])
+        assert np.array_equal(bulk.ghost, [s.is_ghost for s in single])
+        
+    def test_non_square_raises_error(self):
+        """Test that non-square matrices raise ValueError."""
+        with pytest.raises(ValueError):
+            SupertropicalMatrix([[1, 2, 3]]).characteristic_polynomial()
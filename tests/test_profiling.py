@@ -0,0 +1,89 @@
+"""
+Unit tests for the opt-in profiling hooks.
+"""
+import json
+import pytest
+from src.supertropical import (
+    Profiler,
+    SupertropicalElement,
+    SupertropicalMatrix,
+    profile,
+)
+from src.supertropical import profiling
+
+
+@pytest.fixture
+def system():
+    A = SupertropicalMatrix([[2, 1], [1, 3]])
+    b = SupertropicalMatrix([[5], [4]])
+    return A, b
+
+
+class TestProfiler:
+    """Test recording of instrumented calls."""
+    
+    def test_solve_breakdown(self, system):
+        """Test that solve records its permanent, adjoint and product chain."""
+        A, b = system
+        with profile() as prof:
+            A.solve(b)
+        methods = prof.as_dict()["methods"]
+        assert methods["SupertropicalMatrix.solve"]["calls"] == 1
+        assert methods["SupertropicalMatrix.permanent"]["calls"] == 1
+        assert methods["SupertropicalMatrix.adjoint"]["calls"] == 1
+        assert methods["LazySupertropicalMatrix.compute"]["calls"] == 1
+        assert methods["SupertropicalMatrix.solve"]["shapes"] == {"(2, 2) (2, 1)": 1}
+        
+    def test_nested_times(self, system):
+        """Test that total time includes nested calls and self time does not."""
+        A, b = system
+        with profile() as prof:
+            A.solve(b)
+        solve = prof.as_dict()["methods"]["SupertropicalMatrix.solve"]
+        assert 0 <= solve["self_s"] < solve["total_s"]
+        
+    def test_counts_element_allocations(self, system):
+        """Test that element objects created inside a call are counted."""
+        A, _ = system
+        with profile() as prof:
+            A.permanent()
+            SupertropicalElement(1) + SupertropicalElement(2)
+        methods = prof.as_dict()["methods"]
+        # The permanent is returned as one element
+        assert methods["SupertropicalMatrix.permanent"]["allocations"] == 1
+        
+    def test_disabled_records_nothing(self, system):
+        """Test that calls outside a profile block are not recorded."""
+        A, b = system
+        prof = Profiler()
+        A.solve(b)
+        assert prof.events == []
+        assert SupertropicalElement.__init__ is profiling._original_init
+        
+    def test_stop_restores_element_init(self, system):
+        """Test that element creation is unwrapped after the block."""
+        A, _ = system
+        with profile():
+            assert SupertropicalElement.__init__ is not profiling._original_init
+        assert SupertropicalElement.__init__ is profiling._original_init
+        
+    def test_static_methods(self):
+        """Test that static constructors are recorded."""
+        with profile() as prof:
+            SupertropicalMatrix.identity(3)
+        assert prof.as_dict()["methods"]["SupertropicalMatrix.identity"]["calls"] == 1
+
+
+class TestChromeTrace:
+    """Test Chrome trace export."""
+    
+    def test_trace_events(self, system, tmp_path):
+        """Test that every call becomes a complete event in a JSON file."""
+        A, b = system
+        with profile() as prof:
+            A.solve(b)
+        trace = prof.to_chrome_trace(tmp_path / "trace.json")
+        events = trace["traceEvents"]
+        assert len(events) == len(prof.events)
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+        assert json.loads((tmp_path / "trace.json").read_text()) == trace
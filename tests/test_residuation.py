@@ -0,0 +1,109 @@
+"""
+Unit tests for the residuation solver.
+"""
+import pytest
+import numpy as np
+from src.supertropical import (
+    SupertropicalElement,
+    SupertropicalMatrix,
+    SupertropicalSystemSolution,
+)
+from src.supertropical.residuation import greatest_subsolution
+from .helpers import random_matrix
+
+
+class TestGreatestSubsolution:
+    """Test max-plus residuation on arrays."""
+    
+    def test_matches_definition(self):
+        """Test x_j = min_i (b_i - a_ij) over non-ε entries, across blocks."""
+        rng = np.random.default_rng(12)
+        for _ in range(50):
+            m, n = (int(v) for v in rng.integers(1, 6, 2))
+            a = random_matrix(rng, (m, n), low=-4, high=5).values
+            b = random_matrix(rng, (m, 2), low=-4, high=5, epsilon=0.2).values
+            x = greatest_subsolution(a, b, block_elements=3)
+            for c in range(2):
+                for j in range(n):
+                    residuals = [b[i, c] - a[i, j] for i in range(m) if np.isfinite(a[i, j])]
+                    assert x[j, c] == (min(residuals) if residuals else np.inf)
+
+
+class TestSolveSystem:
+    """Test SupertropicalMatrix.solve_system()."""
+    
+    def test_overdetermined_exact(self):
+        """Test a 3x2 system with an exact solution."""
+        A = SupertropicalMatrix([[0, 2], [1, 0], [3, 1]])
+        result = A.solve_system(SupertropicalMatrix([3, 2, 4]))
+        assert isinstance(result, SupertropicalSystemSolution)
+        assert result.method == "residuation"
+        assert np.array_equal(result.x.values, [[1], [1]])
+        assert result.exact.all() and result.is_solution
+        
+    def test_reports_ghost_only_equations(self):
+        """Test that an equation reached by a tie is reported as ghost only."""
+        A = SupertropicalMatrix([[0, 0], [0, -1]])
+        result = A.solve_system(SupertropicalMatrix([1, 1]), fallback=False)
+        assert np.array_equal(result.x.values, [[1], [1]])
+        assert np.array_equal(result.ghost_only, [[True], [False]])
+        assert np.array_equal(result.exact, [[False], [True]])
+        assert result.is_solution
+        
+    def test_unsatisfied_equation(self):
+        """Test that an inconsistent equation is neither exact nor ghost."""
+        A = SupertropicalMatrix([[0], [0]])
+        result = A.solve_system(SupertropicalMatrix([1, 2]))
+        assert np.array_equal(result.x.values, [[1]])
+        assert np.array_equal(result.satisfied, [[True], [False]])
+        assert not result.is_solution
+        
+    def test_square_fallback_to_cramer(self):
+        """Test that square nonsingular systems use the Cramer solution."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        b = SupertropicalMatrix([[5], [4]])
+        result = A.solve_system(b)
+        assert result.method == "cramer"
+        assert np.array_equal(result.x.values, A.solve(b).values)
+        assert result.is_solution
+        assert A.solve_system(b, fallback=False).method == "residuation"
+        
+    def test_singular_skips_factorization(self, monkeypatch):
+        """Test that a ghost permanent keeps the residuation result unfactorized."""
+        monkeypatch.setattr(
+            SupertropicalMatrix, "factorize", lambda self: pytest.fail("factorized")
+        )
+        A = SupertropicalMatrix([[0, 0], [0, 0]])
+        result = A.solve_system(SupertropicalMatrix([1, 2]))
+        assert result.method == "residuation"
+        assert not result.is_solution
+        
+    def test_recovers_consistent_systems(self):
+        """Test that b = A * x is always solved, for float data too."""
+        rng = np.random.default_rng(13)
+        for m, n in ((40, 30), (30, 40), (50, 50)):
+            A = SupertropicalMatrix(rng.normal(size=(m, n)))
+            b = A * SupertropicalMatrix(rng.normal(size=(n, 2)))
+            result = A.solve_system(b, fallback=False)
+            assert result.x.shape == (n, 2)
+            assert result.is_solution
+            
+    def test_near_ties_agree_with_permanent(self):
+        """Test that a rounding-level tie is ghost in both solvers."""
+        A = SupertropicalMatrix([[0.1, 0.3], [0.0, 0.2]])
+        assert A.permanent().is_ghost
+        result = A.solve_system(SupertropicalMatrix([0.1 + 0.2, 0.2]), fallback=False)
+        assert not result.exact.any()
+        assert result.is_solution
+        
+    def test_free_variables_are_epsilon(self):
+        """Test that variables in an all-ε column are ε."""
+        A = SupertropicalMatrix([[1, -np.inf], [2, -np.inf]])
+        result = A.solve_system(SupertropicalMatrix([3, 4]), fallback=False)
+        assert result.x[1, 0] == SupertropicalElement(-np.inf, is_ghost=True)
+        assert result.is_solution
+        
+    def test_dimension_mismatch_raises_error(self):
+        """Test that b must have one entry per row of A."""
+        with pytest.raises(ValueError):
+            SupertropicalMatrix([[1, 2]]).solve_system(SupertropicalMatrix([1, 2]))
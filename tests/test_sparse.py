@@ -0,0 +1,124 @@
+"""
+Unit tests for SparseSupertropicalMatrix class.
+"""
+import pytest
+import numpy as np
+import math
+from src.supertropical import (
+    SparseSupertropicalMatrix,
+    SupertropicalElement,
+    SupertropicalMatrix,
+)
+from .helpers import assert_same, random_matrix
+
+
+class TestSparseConversion:
+    """Test conversion between dense and sparse storage."""
+    
+    def test_from_dense_stores_only_finite_entries(self):
+        """Test that ε entries are not stored."""
+        A = SupertropicalMatrix.identity(4)
+        S = SparseSupertropicalMatrix.from_dense(A)
+        assert S.nnz == 4
+        assert S.shape == (4, 4)
+        assert S.indptr.tolist() == [0, 1, 2, 3, 4]
+        
+    def test_round_trip(self):
+        """Test dense -> sparse -> dense keeps values and ghosts."""
+        A = random_matrix(np.random.default_rng(0), (5, 7), epsilon=0.5)
+        assert_same(SparseSupertropicalMatrix.from_dense(A).to_dense(), A)
+        
+    def test_getitem(self):
+        """Test single-entry access, including missing entries."""
+        g = SupertropicalElement(3, is_ghost=True)
+        S = SparseSupertropicalMatrix.from_dense(
+            SupertropicalMatrix([[1, -math.inf], [g, 2]])
+        )
+        assert S[0, 0] == SupertropicalElement(1)
+        assert S[1, 0] == g
+        assert S[0, 1].value == -math.inf
+        assert S[1, -1] == SupertropicalElement(2)
+        with pytest.raises(IndexError):
+            S[0, 2]
+        with pytest.raises(IndexError):
+            S[2, 0]
+        
+    def test_invalid_csr_raises_error(self):
+        """Test that inconsistent CSR arrays raise ValueError."""
+        with pytest.raises(ValueError):
+            SparseSupertropicalMatrix([1.0], [False], [0], [0, 2], (1, 1))
+
+
+class TestSparseOperations:
+    """Test sparse products and transpose against the dense class."""
+    
+    def test_transpose(self):
+        """Test transpose matches the dense transpose."""
+        A = random_matrix(np.random.default_rng(1), (4, 6), epsilon=0.5)
+        S = SparseSupertropicalMatrix.from_dense(A)
+        assert_same(S.transpose().to_dense(), A.transpose())
+        
+    def test_sparse_times_dense(self):
+        """Test sparse × dense against dense × dense."""
+        rng = np.random.default_rng(2)
+        for _ in range(20):
+            A = random_matrix(rng, (5, 4), epsilon=0.5)
+            B = random_matrix(rng, (4, 3), epsilon=0.5)
+            result = SparseSupertropicalMatrix.from_dense(A) * B
+            assert isinstance(result, SupertropicalMatrix)
+            assert_same(result, A * B)
+            
+    def test_sparse_times_integer_dense(self):
+        """Test that the ε sentinel of an integer operand stays ε."""
+        A = SupertropicalMatrix([[1, -math.inf], [0, 2]])
+        B = SupertropicalMatrix([[1, -math.inf], [2, 3]], dtype=np.int64)
+        S = SparseSupertropicalMatrix.from_dense(A)
+        assert (S * B)[0, 1] == SupertropicalElement(-math.inf, is_ghost=True)
+        assert_same(S * B, A * B.astype(np.float64))
+        assert S.matvec(B[:, 1])[0] == SupertropicalElement(-math.inf, is_ghost=True)
+        
+    def test_sparse_times_sparse(self):
+        """Test sparse × sparse against dense × dense."""
+        rng = np.random.default_rng(3)
+        for _ in range(20):
+            A = random_matrix(rng, (5, 4), epsilon=0.5)
+            B = random_matrix(rng, (4, 6), epsilon=0.5)
+            result = SparseSupertropicalMatrix.from_dense(A) * SparseSupertropicalMatrix.from_dense(B)
+            assert isinstance(result, SparseSupertropicalMatrix)
+            assert_same(result.to_dense(), A * B)
+            
+    def test_small_blocks(self):
+        """Test that block splitting does not change the products."""
+        rng = np.random.default_rng(4)
+        A = random_matrix(rng, (6, 5), epsilon=0.5)
+        B = random_matrix(rng, (5, 4), epsilon=0.5)
+        S = SparseSupertropicalMatrix.from_dense(A)
+        values, ghost = S._mul_dense(B.values, B.ghost, block_elements=3)
+        assert_same(SupertropicalMatrix._from_arrays(values, ghost), A * B)
+        T = S._mul_sparse(SparseSupertropicalMatrix.from_dense(B), block_elements=2)
+        assert_same(T.to_dense(), A * B)
+        
+    def test_matvec(self):
+        """Test matrix-vector products for (n,) and (n, 1) vectors."""
+        rng = np.random.default_rng(5)
+        A = random_matrix(rng, (6, 4), epsilon=0.5)
+        x = SupertropicalMatrix([[1], [0], [2], [-1]])
+        S = SparseSupertropicalMatrix.from_dense(A)
+        assert_same(S.matvec(x), A * x)
+        y = S.matvec(x[:, 0])
+        assert y.shape == (6,)
+        assert np.array_equal(y.values, (A * x).values[:, 0])
+        
+    def test_scalar_multiply(self):
+        """Test scalar multiplication scales stored entries."""
+        S = SparseSupertropicalMatrix.from_dense(SupertropicalMatrix([[1, -math.inf], [0, 2]]))
+        T = S * SupertropicalElement(1, is_ghost=True)
+        assert T[1, 1].value == 3.0
+        assert T[1, 1].is_ghost
+        assert T.nnz == 3
+        
+    def test_dimension_mismatch_raises_error(self):
+        """Test that incompatible shapes raise ValueError."""
+        S = SparseSupertropicalMatrix.from_dense(SupertropicalMatrix([[1, 2]]))
+        with pytest.raises(ValueError):
+            S * SupertropicalMatrix([[1, 2]])
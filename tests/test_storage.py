@@ -0,0 +1,120 @@
+"""
+Unit tests for the binary on-disk format and MappedSupertropicalMatrix.
+"""
+import pytest
+import numpy as np
+import math
+from src.supertropical import (
+    MappedSupertropicalMatrix,
+    SupertropicalElement,
+    SupertropicalMatrix,
+)
+from src.supertropical import storage
+from .helpers import assert_same, random_matrix
+
+
+class TestSaveLoad:
+    """Test round trips through the binary format."""
+    
+    @pytest.mark.parametrize("shape", [(3,), (5, 9), (2, 3, 4), (1, 1), (17, 8)])
+    def test_round_trip(self, tmp_path, shape):
+        """Test that values and ghosts survive save and load."""
+        A = random_matrix(np.random.default_rng(0), shape)
+        A.save(tmp_path / "a.stm")
+        assert_same(SupertropicalMatrix.load(tmp_path / "a.stm"), A)
+        
+    def test_file_layout(self, tmp_path):
+        """Test header, value block and packed bitmap sizes."""
+        A = random_matrix(np.random.default_rng(1), (3, 10))
+        storage.save(A, tmp_path / "a.stm", block_elements=4)
+        raw = (tmp_path / "a.stm").read_bytes()
+        assert raw[:8] == b"SUPTROP\0"
+        # 64 byte header, 30 float64 values, 3 rows of 2 bitmap bytes
+        assert len(raw) == 64 + 30 * 8 + 3 * 2
+        
+    @pytest.mark.parametrize("dtype", [np.float32, np.int64, np.int32])
+    def test_round_trip_keeps_dtype(self, tmp_path, dtype):
+        """Test that the values dtype is stored in the header."""
+        A = random_matrix(np.random.default_rng(5), (4, 6)).astype(dtype)
+        A.save(tmp_path / "a.stm")
+        B = SupertropicalMatrix.load(tmp_path / "a.stm")
+        assert B.dtype == dtype
+        assert_same(B, A)
+        M = SupertropicalMatrix.load(tmp_path / "a.stm", mmap=True)
+        assert M.dtype == dtype
+        assert M[0, 0] == A[0, 0]
+        assert_same(M.to_dense(), A)
+
+    def test_large_int64_values_are_exact(self, tmp_path):
+        """Test that int64 values beyond 2**53 are not rounded."""
+        eps = np.iinfo(np.int64).min
+        A = SupertropicalMatrix(np.array([[2 ** 62 + 1, eps]]), dtype=np.int64)
+        A.save(tmp_path / "a.stm")
+        assert SupertropicalMatrix.load(tmp_path / "a.stm").values[0, 0] == 2 ** 62 + 1
+
+    def test_bad_file_raises_error(self, tmp_path):
+        """Test that files in another format are rejected."""
+        (tmp_path / "bad.stm").write_bytes(b"x" * 100)
+        with pytest.raises(ValueError):
+            SupertropicalMatrix.load(tmp_path / "bad.stm")
+
+
+class TestMappedMatrix:
+    """Test block-wise processing of memory-mapped matrices."""
+    
+    @pytest.fixture
+    def mapped(self, tmp_path):
+        A = random_matrix(np.random.default_rng(2), (13, 11))
+        A.save(tmp_path / "a.stm")
+        return A, SupertropicalMatrix.load(tmp_path / "a.stm", mmap=True)
+    
+    def test_open_maps_file(self, mapped):
+        """Test that the mapping reads entries without loading the file."""
+        A, M = mapped
+        assert isinstance(M, MappedSupertropicalMatrix)
+        assert isinstance(M.values, np.memmap)
+        assert M.shape == (13, 11)
+        assert M[4, 9] == A[4, 9]
+        assert M[4, 9].is_ghost == A[4, 9].is_ghost
+        assert_same(M.rows(3, 7), A[3:7])
+        
+    def test_matmul_in_blocks(self, mapped):
+        """Test the block-wise product against the in-memory product."""
+        A, M = mapped
+        B = random_matrix(np.random.default_rng(3), (11, 4))
+        assert_same(M.matmul(B, block_elements=15), A * B)
+        assert_same(M * B, A * B)
+        
+    def test_matmul_into_mapped_output(self, mapped, tmp_path):
+        """Test writing the product to another mapped file."""
+        A, M = mapped
+        B = random_matrix(np.random.default_rng(4), (11, 4))
+        out = MappedSupertropicalMatrix.create(tmp_path / "c.stm", (13, 4))
+        assert out[0, 0] == SupertropicalElement(-math.inf, is_ghost=True)
+        M.matmul(B, out=out, block_elements=20)
+        assert_same(SupertropicalMatrix.load(tmp_path / "c.stm"), A * B)
+        
+    def test_create_integer_file(self, tmp_path):
+        """Test an int32 output file filled with the ε sentinel."""
+        out = MappedSupertropicalMatrix.create(tmp_path / "c.stm", (2, 3), dtype=np.int32)
+        assert out.values.dtype == np.int32
+        assert out[1, 2] == SupertropicalElement(-math.inf, is_ghost=True)
+        out.write_rows(0, SupertropicalMatrix([[1, 2, 3]]))
+        assert out.rows(0, 1).dtype == np.int32
+        assert out[0, 2] == SupertropicalElement(3)
+
+    def test_matvec(self, mapped):
+        """Test the block-wise matrix-vector product."""
+        A, M = mapped
+        x = SupertropicalMatrix(np.arange(11.0))
+        expected = A * SupertropicalMatrix(np.arange(11.0).reshape(-1, 1))
+        result = M.matvec(x, block_elements=11)
+        assert result.shape == (13,)
+        assert np.array_equal(result.values, expected.values.ravel())
+        assert np.array_equal(result.ghost, expected.ghost.ravel())
+        
+    def test_read_only_mapping_rejects_writes(self, mapped):
+        """Test that write_rows needs mode 'r+'."""
+        A, M = mapped
+        with pytest.raises(ValueError):
+            M.write_rows(0, A[0:1])
@@ -0,0 +1,118 @@
+"""
+Unit tests for SupertropicalTrajectory (SupertropicalMatrix.iterate).
+"""
+import pytest
+import numpy as np
+import math
+from src.supertropical import (
+    SupertropicalElement,
+    SupertropicalMatrix,
+    SupertropicalTrajectory,
+)
+from .helpers import random_matrix
+
+
+class TestTrajectoryStates:
+    """Test that streamed states match repeated multiplication."""
+    
+    def test_matches_repeated_products(self):
+        """Test x(k) against A * x(k-1) on random matrices, across chunks."""
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            n = int(rng.integers(1, 6))
+            A = random_matrix(rng, (n, n))
+            x = random_matrix(rng, (n, 1), low=-2, high=3, epsilon=0, ghost=0)
+            chunks = list(A.iterate(x, 20, chunk_size=6))
+            assert [c.shape[0] for c in chunks] == [6, 6, 6, 3]
+            values = np.vstack([c.values for c in chunks])
+            ghost = np.vstack([c.ghost for c in chunks])
+            current = x
+            for k in range(21):
+                assert np.array_equal(values[k], current.values.ravel())
+                assert np.array_equal(ghost[k], current.ghost.ravel())
+                current = A * current
+                
+    def test_run_returns_last_state(self):
+        """Test run() on a 2x2 example."""
+        A = SupertropicalMatrix([[1, 3], [2, 0]])
+        x = A.iterate(SupertropicalMatrix([0, 0]), 3).run()
+        assert x.values.tolist() == [8.0, 7.0]
+        
+    def test_writes_to_out(self, tmp_path):
+        """Test that states are written into memory-mapped buffers."""
+        A = SupertropicalMatrix([[1, 3], [2, 0]])
+        values = np.memmap(tmp_path / "values", dtype=np.float64, mode="w+", shape=(11, 2))
+        ghost = np.memmap(tmp_path / "ghost", dtype=bool, mode="w+", shape=(11, 2))
+        chunks = list(A.iterate(SupertropicalMatrix([0, 0]), 10, chunk_size=4, out=(values, ghost)))
+        assert np.shares_memory(chunks[0].values, values)
+        assert values[1].tolist() == [3.0, 2.0]
+        assert values[10].tolist() == [25.0, 25.0]
+        
+    def test_invalid_shapes_raise_error(self):
+        """Test shape validation of A, x0 and out."""
+        A = SupertropicalMatrix([[1, 2], [3, 4]])
+        with pytest.raises(ValueError):
+            SupertropicalMatrix([[1, 2, 3]]).iterate(SupertropicalMatrix([0, 0, 0]), 5)
+        with pytest.raises(ValueError):
+            A.iterate(SupertropicalMatrix([0, 0, 0]), 5)
+        with pytest.raises(ValueError):
+            A.iterate(SupertropicalMatrix([0, 0]), 5, out=SupertropicalMatrix(np.zeros((5, 2))))
+
+
+class TestTrajectoryPeriodicity:
+    """Test early stopping once the trajectory is periodic."""
+    
+    def test_detects_period_and_cycle_time(self):
+        """Test x(2) = 5 ⊙ x(0) for a matrix with a 2-cycle of mean 2.5."""
+        A = SupertropicalMatrix([[1, 3], [2, 0]])
+        trajectory = A.iterate(SupertropicalMatrix([0, 0]), 1000, detect_period=True)
+        states = list(trajectory)
+        assert isinstance(trajectory, SupertropicalTrajectory)
+        assert trajectory.is_periodic
+        assert trajectory.steps_done == 2
+        assert (trajectory.transient, trajectory.period) == (0, 2)
+        assert trajectory.cycle_time == SupertropicalElement(2.5)
+        assert states[-1].shape == (3, 2)
+        
+    def test_transient(self):
+        """Test a trajectory that becomes periodic after some steps.
+
+        x(5) = (-5, -5ν) is a tie; x(6) = x(7) = (-5, -5) are tangible.
+        """
+        A = SupertropicalMatrix([[0, -math.inf], [0, -1]])
+        trajectory = A.iterate(SupertropicalMatrix([-5, 0]), 100, detect_period=True)
+        trajectory.run()
+        assert trajectory.period == 1
+        assert trajectory.transient == 6
+        assert trajectory.cycle_time == SupertropicalElement(0)
+        
+    def test_cycle_time_matches_eigenvalue(self):
+        """Test the cycle time of an irreducible matrix with tolerance."""
+        A = SupertropicalMatrix(np.random.default_rng(1).random((8, 8)))
+        trajectory = A.iterate(SupertropicalMatrix(np.zeros(8)), 10000,
+                               detect_period=True, atol=1e-9)
+        trajectory.run()
+        assert trajectory.is_periodic
+        assert trajectory.cycle_time.value == pytest.approx(A.eigenvalue().value)
+        
+    def test_no_period_runs_all_steps(self):
+        """Test that without detection all steps are produced."""
+        A = SupertropicalMatrix([[1, 3], [2, 0]])
+        trajectory = A.iterate(SupertropicalMatrix([0, 0]), 50)
+        trajectory.run()
+        assert trajectory.steps_done == 50
+        assert not trajectory.is_periodic
+        
+    def test_max_period_bounds_history(self):
+        """Test that a window of max_period states finds the same period."""
+        A = SupertropicalMatrix([[0, -math.inf], [0, -1]])
+        trajectory = A.iterate(SupertropicalMatrix([-5, 0]), 100, detect_period=True, max_period=1)
+        trajectory.run()
+        assert (trajectory.transient, trajectory.period) == (6, 1)
+        B = SupertropicalMatrix([[-math.inf, 0], [0, -math.inf]])
+        trajectory = B.iterate(SupertropicalMatrix([0, 1]), 20, detect_period=True, max_period=1)
+        trajectory.run()
+        assert len(trajectory._seen) <= 1
+        assert not trajectory.is_periodic
+        with pytest.raises(ValueError):
+            A.iterate(SupertropicalMatrix([0, 0]), 5, max_period=0)
@@ -0,0 +1,164 @@
+"""
+Unit tests for elementwise supertropical operations.
+"""
+import pytest
+import numpy as np
+import math
+from src.supertropical import SupertropicalElement, SupertropicalMatrix, ufuncs
+
+
+@pytest.fixture
+def matrices():
+    g = SupertropicalElement(5, is_ghost=True)
+    A = SupertropicalMatrix([[1, 2], [3, 4]])
+    B = SupertropicalMatrix([[1, g], [0, 4]])
+    return A, B
+
+
+class TestElementwiseAddition:
+    """Test elementwise ⊕."""
+    
+    def test_add_matches_elements(self, matrices):
+        """Test A ⊕ B entry by entry against element addition."""
+        A, B = matrices
+        C = A + B
+        for i in range(2):
+            for j in range(2):
+                assert C[i, j] == A[i, j] + B[i, j]
+                
+    def test_theory_example(self):
+        """Test Example 3.1 from the theory guide."""
+        A = SupertropicalMatrix([[2, 1], [1, 3]])
+        B = SupertropicalMatrix([[5, SupertropicalElement(4, is_ghost=True)], [2, 1]])
+        C = ufuncs.add(A, B)
+        assert C.values.tolist() == [[5.0, 4.0], [2.0, 3.0]]
+        assert C.ghost.tolist() == [[False, True], [False, False]]
+        
+    def test_numpy_dispatch(self, matrices):
+        """Test np.add and np.maximum dispatch to ⊕."""
+        A, B = matrices
+        for C in (np.add(A, B), np.maximum(A, B)):
+            assert isinstance(C, SupertropicalMatrix)
+            assert np.array_equal(C.values, (A + B).values)
+            assert np.array_equal(C.ghost, (A + B).ghost)
+            
+    def test_broadcasting(self, matrices):
+        """Test a row and a scalar broadcast against a matrix."""
+        A, _ = matrices
+        C = A + SupertropicalMatrix([[0, 10]])
+        assert C.values.tolist() == [[1.0, 10.0], [3.0, 10.0]]
+        D = 3 + A
+        assert D[1, 0].is_ghost
+        assert D[0, 0] == SupertropicalElement(3)
+        
+    def test_in_place(self, matrices):
+        """Test A += B and out= reuse the buffers of A."""
+        A, B = matrices
+        expected = A + B
+        values = A.values
+        A += B
+        assert A.values is values
+        assert np.array_equal(A.ghost, expected.ghost)
+        C = SupertropicalMatrix([[0, 0], [0, 0]])
+        result = np.maximum(expected, B, out=(C,))
+        assert result is C
+        
+    def test_scalars_return_element(self):
+        """Test that scalar operands give a SupertropicalElement."""
+        assert ufuncs.add(SupertropicalElement(3), 3) == SupertropicalElement(3, is_ghost=True)
+
+
+class TestElementwiseMultiplication:
+    """Test elementwise ⊙ and power."""
+    
+    def test_multiply(self, matrices):
+        """Test np.multiply is the elementwise ⊙."""
+        A, B = matrices
+        C = np.multiply(A, B)
+        assert C.values.tolist() == [[2.0, 7.0], [3.0, 8.0]]
+        assert C.ghost.tolist() == [[False, True], [False, False]]
+        
+    def test_numpy_scalar_times_matrix(self, matrices):
+        """Test that a NumPy scalar scales like a Python number."""
+        A, _ = matrices
+        assert np.array_equal((np.float64(2) * A).values, (2 * A).values)
+        
+    def test_multiply_out(self, matrices):
+        """Test elementwise ⊙ into an output buffer."""
+        A, B = matrices
+        ufuncs.multiply(A, B, out=A)
+        assert A.values.tolist() == [[2.0, 7.0], [3.0, 8.0]]
+        assert A[0, 1].is_ghost
+        
+    def test_power(self):
+        """Test elementwise power, including exponent 0 on ε."""
+        g = SupertropicalElement(2, is_ghost=True)
+        A = SupertropicalMatrix([[g, -math.inf], [-1, 3]])
+        P = np.power(A, 3)
+        assert P.values.tolist() == [[6.0, -math.inf], [-3.0, 9.0]]
+        assert P[0, 0].is_ghost
+        Z = ufuncs.power(A, 0)
+        assert np.all(Z.values == 0.0)
+        assert not Z.ghost.any()
+        
+    def test_power_requires_integer(self, matrices):
+        """Test that non-integer exponents raise ValueError."""
+        A, _ = matrices
+        with pytest.raises(ValueError):
+            ufuncs.power(A, 0.5)
+
+
+class TestProjections:
+    """Test ghost and tangible projections."""
+    
+    def test_ghost_projection(self, matrices):
+        """Test every entry becomes ghost."""
+        A, _ = matrices
+        G = ufuncs.ghost(A)
+        assert G.ghost.all()
+        assert np.array_equal(G.values, A.values)
+        assert not A.ghost.any()
+        
+    def test_tangible_projection_in_place(self, matrices):
+        """Test every entry becomes tangible, in place."""
+        _, B = matrices
+        ufuncs.tangible(B, out=B)
+        assert not B.ghost.any()
+        
+    def test_unsupported_operand_raises_error(self, matrices):
+        """Test that unsupported operands raise TypeError."""
+        A, _ = matrices
+        with pytest.raises(TypeError):
+            ufuncs.add(A, "x")
+
+
+class TestIntegerOperands:
+    """Test elementwise operations on integer matrices."""
+
+    def test_epsilon_sentinel_is_absorbing(self):
+        """Test that ε ⊙ a and ε^k stay ε in int32."""
+        A = SupertropicalMatrix([[-math.inf, -5]], dtype=np.int32)
+        product = ufuncs.multiply(A, -3)
+        assert product.dtype == np.int32
+        assert product[0, 0].value == -math.inf
+        assert product[0, 1].value == -8
+        power = ufuncs.power(A, 3)
+        assert power[0, 0].value == -math.inf
+        assert power[0, 1].value == -15
+
+    def test_addition_ties_with_sentinel(self):
+        """Test that ε ⊕ ε is ghost ε in int64."""
+        A = SupertropicalMatrix([[-math.inf, 2]], dtype=np.int64)
+        result = A + A
+        assert result.dtype == np.int64
+        assert result[0, 0].value == -math.inf
+        assert result.ghost.all()
+
+    def test_overflow_raises_error(self):
+        """Test that int32 products and powers out of range raise OverflowError."""
+        A = SupertropicalMatrix([[-math.inf, 2 ** 30]], dtype=np.int32)
+        with pytest.raises(OverflowError):
+            ufuncs.multiply(A, A)
+        with pytest.raises(OverflowError):
+            ufuncs.power(A, 2)
+        assert ufuncs.power(A, -1)[0, 1].value == -2 ** 30